@@ -8,8 +8,9 @@ from app.db.session import get_db
 from app.models.user import User, TradingMode
 from app.schemas.user import RealKISCredentialsUpdate, MockKISCredentialsUpdate, UserDetailResponse
 from app.core.deps import get_current_active_user
-from app.services.kis_client import KISClient
+from app.services.kis_client import kis_client_registry
 from app.services.kis_account import KISAccount
+from app.services.quote_stream import quote_stream_hub
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -59,8 +60,8 @@ async def get_balance(
         logger.info(f"  - App Key (first 10 chars): {app_key[:10]}...")
         logger.info(f"  - App Secret (first 10 chars): {app_secret[:10]}...")
 
-        # Initialize KIS client with user's credentials and trading mode
-        kis_client = KISClient(
+        # Get the shared KIS client for the user's credentials and trading mode
+        kis_client = kis_client_registry.get_client(
             app_key=app_key,
             app_secret=app_secret,
             account_number=account_number,
@@ -137,6 +138,10 @@ async def update_real_kis_credentials(
     """
     logger.info(f"[PUT /kis-credentials/real] Updating real trading credentials for user {current_user.id}")
 
+    # Drop the cached client and quote streams for the old credentials
+    kis_client_registry.invalidate(current_user.real_app_key, TradingMode.REAL)
+    quote_stream_hub.revoke(current_user.real_app_key, TradingMode.REAL)
+
     # Update Real KIS credentials
     current_user.real_app_key = kis_data.real_app_key
     current_user.real_app_secret = kis_data.real_app_secret
@@ -165,6 +170,10 @@ async def update_mock_kis_credentials(
     """
     logger.info(f"[PUT /kis-credentials/mock] Updating mock trading credentials for user {current_user.id}")
 
+    # Drop the cached client and quote streams for the old credentials
+    kis_client_registry.invalidate(current_user.mock_app_key, TradingMode.MOCK)
+    quote_stream_hub.revoke(current_user.mock_app_key, TradingMode.MOCK)
+
     # Update Mock KIS credentials
     current_user.mock_app_key = kis_data.mock_app_key
     current_user.mock_app_secret = kis_data.mock_app_secret
@@ -192,6 +201,10 @@ async def delete_real_kis_credentials(
     """
     logger.info(f"[DELETE /kis-credentials/real] Deleting real trading credentials for user {current_user.id}")
 
+    # Drop the cached client and quote streams for the old credentials
+    kis_client_registry.invalidate(current_user.real_app_key, TradingMode.REAL)
+    quote_stream_hub.revoke(current_user.real_app_key, TradingMode.REAL)
+
     # Clear Real KIS credentials
     current_user.real_app_key = None
     current_user.real_app_secret = None
@@ -218,6 +231,10 @@ async def delete_mock_kis_credentials(
     """
     logger.info(f"[DELETE /kis-credentials/mock] Deleting mock trading credentials for user {current_user.id}")
 
+    # Drop the cached client and quote streams for the old credentials
+    kis_client_registry.invalidate(current_user.mock_app_key, TradingMode.MOCK)
+    quote_stream_hub.revoke(current_user.mock_app_key, TradingMode.MOCK)
+
     # Clear Mock KIS credentials
     current_user.mock_app_key = None
     current_user.mock_app_secret = None
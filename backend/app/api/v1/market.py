@@ -1,12 +1,17 @@
 """Market data API endpoints."""
 
+import asyncio
+import json
 import logging
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.core.deps import get_current_user, get_db
+from app.config import settings
+from app.core.deps import get_current_user, get_db, get_user_from_token
+from app.db.session import get_session_factory
 from app.models.user import User
 from app.models.market_data import TimeInterval
 from app.schemas.market_data import (
@@ -14,15 +19,23 @@ from app.schemas.market_data import (
     MarketDataResponse,
     ChartDataResponse,
     ChartDataPoint,
-    PriceResponse
+    PriceResponse,
+    UniverseCollectRequest,
+    CollectionProgress
 )
-from app.services.kis_client import KISClient
+from app.services.kis_client import KISClient, RequestPriority, kis_client_registry
 from app.services.kis_quotation import KISQuotation
-from app.services.market_data_service import MarketDataService
+from app.services.market_data_collector import MarketDataCollector, load_checkpoint
+from app.services.market_data_service import MarketDataService, RESAMPLE_SOURCES
+from app.services.quote_cache import quote_cache
+from app.services.quote_stream import quote_stream_hub, to_price_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Most recent bars a chart request loads
+CHART_MAX_BARS = 1000
+
 
 def get_kis_client(current_user: User = Depends(get_current_user)) -> KISClient:
     """
@@ -32,7 +45,7 @@ def get_kis_client(current_user: User = Depends(get_current_user)) -> KISClient:
         current_user: Current authenticated user
 
     Returns:
-        KISClient instance
+        Shared KISClient instance from the process-wide registry
 
     Raises:
         HTTPException: If user doesn't have KIS credentials
@@ -61,7 +74,7 @@ def get_kis_client(current_user: User = Depends(get_current_user)) -> KISClient:
         account_number = current_user.mock_account_number
         account_code = current_user.mock_account_code
 
-    return KISClient(
+    return kis_client_registry.get_client(
         app_key=app_key,
         app_secret=app_secret,
         account_number=account_number,
@@ -70,10 +83,112 @@ def get_kis_client(current_user: User = Depends(get_current_user)) -> KISClient:
     )
 
 
+@router.post("/collect/daily", response_model=CollectionProgress, status_code=202)
+async def collect_universe_daily_data(
+    request: UniverseCollectRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    kis_client: KISClient = Depends(get_kis_client),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Start a background job collecting daily data for many symbols.
+
+    Collects every stock (optionally filtered by market) or the given
+    symbols under the account's KIS rate limit. With ``history_start`` the
+    job backfills each symbol's history back to that date instead. Passing
+    the ``job_id`` of an interrupted job resumes it with its original
+    period, mode and ``history_start``, skipping symbols that were already
+    saved.
+
+    Args:
+        request: Universe filter, period, concurrency and optional job to resume
+        background_tasks: FastAPI background tasks
+        db: Database session
+        session_factory: Session factory for the job's writes
+        kis_client: KIS API client
+        current_user: Current user
+
+    Returns:
+        CollectionProgress of the started job (poll /collect/jobs/{job_id})
+    """
+    if request.market_type and request.market_type not in ["KOSPI", "KOSDAQ"]:
+        raise HTTPException(status_code=400, detail="Invalid market_type. Use KOSPI or KOSDAQ")
+    if request.period not in ["D", "W", "M"]:
+        raise HTTPException(status_code=400, detail="Invalid period. Use D, W or M")
+
+    try:
+        progress = load_checkpoint(request.job_id) if request.job_id else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if request.job_id and progress is None:
+        raise HTTPException(status_code=404, detail=f"Collection job {request.job_id} not found")
+
+    symbols = await MarketDataCollector.select_universe(
+        db=db,
+        market_type=request.market_type,
+        symbols=request.symbols
+    )
+    if not symbols:
+        raise HTTPException(status_code=404, detail="No symbols to collect")
+
+    if progress is None:
+        progress = MarketDataCollector.new_progress(
+            period=request.period,
+            incremental=request.incremental,
+            history_start=request.history_start,
+            total_symbols=len(symbols)
+        )
+    progress.status = "running"
+    logger.info(f"[Market API] Starting collection job {progress.job_id} for {len(symbols)} symbols")
+
+    collector = MarketDataCollector(
+        quotation=KISQuotation(kis_client),
+        session_factory=session_factory,
+        concurrency=request.concurrency
+    )
+    # A resumed job runs with the settings saved in its checkpoint
+    background_tasks.add_task(
+        collector.collect_daily,
+        symbols,
+        progress.period,
+        progress.job_id,
+        progress.incremental,
+        progress.history_start
+    )
+    return progress
+
+
+@router.get("/collect/jobs/{job_id}", response_model=CollectionProgress)
+async def get_collection_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get progress and throughput of a collection job.
+
+    Args:
+        job_id: Collection job id
+        current_user: Current user
+
+    Returns:
+        CollectionProgress from the job's checkpoint
+    """
+    try:
+        progress = load_checkpoint(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if progress is None:
+        raise HTTPException(status_code=404, detail=f"Collection job {job_id} not found")
+    return progress
+
+
 @router.post("/collect/daily/{symbol}", response_model=MarketDataListResponse)
 async def collect_daily_market_data(
     symbol: str,
     period: str = Query("D", description="Period: D(일), W(주), M(월)"),
+    incremental: bool = Query(False, description="Only fetch bars after the latest stored one"),
     db: AsyncSession = Depends(get_db),
     kis_client: KISClient = Depends(get_kis_client),
     current_user: User = Depends(get_current_user)
@@ -84,12 +199,14 @@ async def collect_daily_market_data(
     Args:
         symbol: Stock symbol (e.g., "005930" for Samsung Electronics)
         period: Period code (D, W, M)
+        incremental: Only fetch and save bars after the latest stored one
         db: Database session
         kis_client: KIS API client
         current_user: Current user
 
     Returns:
-        MarketDataListResponse with collected data
+        MarketDataListResponse with collected data (empty if incremental and
+        nothing was new)
     """
     try:
         logger.info(f"[Market API] Collecting daily data for {symbol}, period: {period}")
@@ -102,10 +219,11 @@ async def collect_daily_market_data(
             db=db,
             kis_client=kis_quotation,
             symbol=symbol,
-            period=period
+            period=period,
+            incremental=incremental
         )
 
-        if not market_data_list:
+        if not market_data_list and not incremental:
             raise HTTPException(
                 status_code=404,
                 detail=f"No market data found for symbol {symbol}"
@@ -214,21 +332,107 @@ async def collect_minute_market_data(
         )
 
 
+@router.post("/resample/{symbol}", response_model=MarketDataListResponse)
+async def resample_market_data(
+    symbol: str,
+    interval: TimeInterval = Query(..., description="Target interval (5m, 10m, 30m, 1h, 1w, 1mo)"),
+    days: int = Query(30, ge=1, le=3650, description="Number of days to resample"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Build coarser bars from stored bars and save them, without calling KIS.
+
+    Intraday intervals are derived from stored 1m bars and weekly/monthly
+    bars from stored 1d bars.
+
+    Args:
+        symbol: Stock symbol
+        interval: Target interval
+        days: Number of days to resample
+        db: Database session
+        current_user: Current user
+
+    Returns:
+        MarketDataListResponse with the saved bars
+    """
+    if interval not in RESAMPLE_SOURCES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid interval for resampling. Must be one of: {[i.value for i in RESAMPLE_SOURCES]}"
+        )
+
+    try:
+        end_date = datetime.now()
+        # Start on a bucket boundary so the first bar is complete
+        start_date = MarketDataService.bucket_starts(
+            np.array([end_date - timedelta(days=days)], dtype="datetime64[us]"), interval
+        )[0].item()
+
+        resampled = await MarketDataService.resample_market_data(
+            db=db,
+            symbols=[symbol],
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date
+        )
+        if symbol not in resampled:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No {RESAMPLE_SOURCES[interval].value} data found for symbol {symbol}"
+            )
+
+        market_data_list = await MarketDataService.upsert_market_data(db, resampled[symbol])
+        data_responses = [MarketDataResponse.model_validate(data) for data in market_data_list]
+
+        return MarketDataListResponse(
+            data=data_responses,
+            symbol=symbol,
+            interval=interval,
+            start_date=market_data_list[0].timestamp,
+            end_date=market_data_list[-1].timestamp,
+            total=len(data_responses)
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[Market API] Error resampling market data: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to resample market data: {str(e)}"
+        )
+
+
 @router.get("/chart/{symbol}", response_model=ChartDataResponse)
 async def get_chart_data(
     symbol: str,
     interval: TimeInterval = Query(TimeInterval.ONE_DAY, description="Time interval"),
     days: int = Query(30, ge=1, le=365, description="Number of days to retrieve"),
+    max_points: Optional[int] = Query(
+        None, ge=3, le=CHART_MAX_BARS, description="Downsample to at most this many points"
+    ),
+    downsample: str = Query(
+        "ohlc", pattern="^(ohlc|lttb)$",
+        description="ohlc: merge runs of bars into candles; lttb: keep shape-preserving bars (line charts)"
+    ),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Get chart data for a symbol from database.
 
+    Intervals with no stored bars are resampled on the fly from stored
+    1m (intraday) or 1d (weekly/monthly) bars. With ``max_points`` the
+    bars are downsampled on the server so long ranges ship only as many
+    points as the chart can show.
+
     Args:
         symbol: Stock symbol
         interval: Time interval
         days: Number of days to retrieve
+        max_points: Maximum number of points to return (optional)
+        downsample: Downsampling method ("ohlc" or "lttb")
         db: Database session
         current_user: Current user
 
@@ -239,33 +443,60 @@ async def get_chart_data(
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        # Get data from database
-        market_data_list = await MarketDataService.get_market_data(
+        # Load plain columns from database (no ORM objects)
+        data = await MarketDataService.get_market_data_bulk(
             db=db,
-            symbol=symbol,
+            symbols=[symbol],
             interval=interval,
             start_date=start_date,
             end_date=end_date,
-            limit=1000
+            limit=CHART_MAX_BARS
         )
+        columns = data.get(symbol)
+
+        if columns is None and interval in RESAMPLE_SOURCES:
+            # Derive the bars from stored finer bars instead of requiring a download
+            start_date = MarketDataService.bucket_starts(
+                np.array([start_date], dtype="datetime64[us]"), interval
+            )[0].item()
+            source = await MarketDataService.get_market_data_bulk(
+                db=db,
+                symbols=[symbol],
+                interval=RESAMPLE_SOURCES[interval],
+                start_date=start_date,
+                end_date=end_date,
+                limit=None
+            )
+            if symbol in source:
+                columns = MarketDataService.resample_columns(source[symbol], interval)
+                columns = {key: values[-CHART_MAX_BARS:] for key, values in columns.items()}
 
-        if not market_data_list:
+        if columns is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No chart data found for symbol {symbol}. Try collecting data first."
             )
 
+        if max_points is not None:
+            if downsample == "lttb":
+                indices = MarketDataService.lttb_indices(
+                    columns["timestamp"].astype(np.int64), columns["close"], max_points
+                )
+                columns = {key: values[indices] for key, values in columns.items()}
+            else:
+                columns = MarketDataService.downsample_ohlc(columns, max_points)
+
         # Convert to chart data points
         chart_points = [
-            ChartDataPoint(
-                timestamp=data.timestamp,
-                open=data.open,
-                high=data.high,
-                low=data.low,
-                close=data.close,
-                volume=data.volume
+            ChartDataPoint(timestamp=timestamp, open=open_, high=high, low=low, close=close, volume=volume)
+            for timestamp, open_, high, low, close, volume in zip(
+                columns["timestamp"].tolist(),
+                columns["open"].tolist(),
+                columns["high"].tolist(),
+                columns["low"].tolist(),
+                columns["close"].tolist(),
+                columns["volume"].tolist()
             )
-            for data in market_data_list
         ]
 
         return ChartDataResponse(
@@ -294,6 +525,9 @@ async def get_current_price(
     """
     Get current price for a symbol from KIS API.
 
+    Quotes are served from a short-TTL cache, and concurrent requests for
+    the same symbol share one KIS call.
+
     Args:
         symbol: Stock symbol
         db: Database session
@@ -309,8 +543,8 @@ async def get_current_price(
         # Initialize KIS Quotation service
         kis_quotation = KISQuotation(kis_client)
 
-        # Get current price from KIS API
-        kis_response = await kis_quotation.get_current_price(symbol)
+        # Get current price from the quote cache (KIS API on a miss)
+        kis_response = await quote_cache.get_current_price(kis_quotation, symbol)
 
         if 'output' not in kis_response:
             raise HTTPException(
@@ -318,41 +552,7 @@ async def get_current_price(
                 detail=f"No price data found for symbol {symbol}"
             )
 
-        output = kis_response['output']
-
-        # Parse response
-        current_price = float(output.get('stck_prpr', 0))  # 현재가
-        change = float(output.get('prdy_vrss', 0))  # 전일대비
-        change_percent = float(output.get('prdy_ctrt', 0))  # 전일대비율
-        volume = float(output.get('acml_vol', 0))  # 누적거래량
-
-        # Get timestamp from KIS API response
-        # stck_bsop_date: 영업일자 (YYYYMMDD)
-        # stck_cntg_hour: 체결시간 (HHMMSS)
-        trade_date = output.get('stck_bsop_date', '')  # 영업일자
-        trade_time = output.get('stck_cntg_hour', '')  # 체결시간
-
-        # Parse datetime from KIS API response
-        if trade_date and trade_time:
-            # Format: YYYYMMDD + HHMMSS
-            datetime_str = f"{trade_date}{trade_time}"
-            try:
-                kis_timestamp = datetime.strptime(datetime_str, "%Y%m%d%H%M%S")
-            except ValueError:
-                logger.warning(f"Failed to parse KIS timestamp: {datetime_str}")
-                kis_timestamp = datetime.now()
-        else:
-            logger.warning("KIS API response missing date/time fields")
-            kis_timestamp = datetime.now()
-
-        return PriceResponse(
-            symbol=symbol,
-            price=current_price,
-            change=change,
-            change_percent=change_percent,
-            volume=volume,
-            timestamp=kis_timestamp
-        )
+        return to_price_response(symbol, kis_response)
 
     except HTTPException:
         raise
@@ -364,6 +564,145 @@ async def get_current_price(
         )
 
 
+async def authenticate_stream(websocket: WebSocket, session_factory: async_sessionmaker) -> User:
+    """
+    Authenticate a stream connection from its first message.
+
+    The token is sent as ``{"action": "auth", "token": ...}`` instead of in
+    the URL so that it does not end up in access logs.
+
+    Args:
+        websocket: Accepted client connection
+        session_factory: Session factory
+
+    Returns:
+        User owning the token
+
+    Raises:
+        HTTPException: If no auth message arrives in time or its token is invalid
+    """
+    try:
+        message = json.loads(
+            await asyncio.wait_for(websocket.receive_text(), timeout=settings.QUOTE_STREAM_AUTH_TIMEOUT)
+        )
+        token = message["token"] if message["action"] == "auth" else None
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=401, detail="Authentication timed out")
+    except (ValueError, KeyError, TypeError):
+        token = None
+
+    if not isinstance(token, str):
+        raise HTTPException(status_code=401, detail='Expected {"action": "auth", "token": ...} first')
+
+    async with session_factory() as db:
+        return await get_user_from_token(token, db)
+
+
+@router.websocket("/stream")
+async def stream_prices(
+    websocket: WebSocket,
+    session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """
+    Push realtime price updates over a WebSocket.
+
+    The first message must be ``{"action": "auth", "token": <JWT>}``
+    (browsers cannot set WebSocket headers, and a query parameter would be
+    logged). Afterwards clients send
+    ``{"action": "subscribe" | "unsubscribe", "symbols": [...]}`` and
+    receive ``{"type": "quote", "data": PriceResponse}`` messages. Each
+    symbol is polled upstream once for all connections watching it, so
+    clients no longer need to poll ``/price/{symbol}``. Failed
+    authentication closes the connection with an error message and code
+    1008 (policy violation, do not retry); changed KIS credentials close it
+    with code 1012 so the client reconnects with the new ones.
+
+    Args:
+        websocket: Client connection
+        session_factory: Session factory (the connection outlives a request session)
+    """
+    await websocket.accept()
+    try:
+        current_user = await authenticate_stream(websocket, session_factory)
+        kis_client = get_kis_client(current_user)
+    except HTTPException as e:
+        await websocket.send_json({"type": "error", "detail": e.detail})
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+        return
+    except WebSocketDisconnect:
+        return
+
+    subscription = quote_stream_hub.connect(KISQuotation(kis_client))
+
+    async def send_quotes():
+        while True:
+            quote = await subscription.get()
+            if quote is None:
+                # Credentials were changed or deleted (see QuoteStreamHub.revoke)
+                await websocket.send_json({"type": "error", "detail": "KIS credentials changed; reconnect"})
+                await websocket.close(code=status.WS_1012_SERVICE_RESTART)
+                return
+            await websocket.send_json({"type": "quote", "data": quote})
+
+    sender = asyncio.create_task(send_quotes())
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+                action = message["action"]
+                symbols = [str(symbol) for symbol in message["symbols"]]
+            except (ValueError, KeyError, TypeError):
+                await websocket.send_json({
+                    "type": "error",
+                    "detail": 'Expected {"action": "subscribe" | "unsubscribe", "symbols": [...]}'
+                })
+                continue
+
+            if action == "subscribe":
+                try:
+                    subscription.subscribe(symbols)
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                    continue
+            elif action == "unsubscribe":
+                subscription.unsubscribe(symbols)
+            else:
+                await websocket.send_json({"type": "error", "detail": f"Unknown action: {action}"})
+                continue
+
+            await websocket.send_json({"type": "subscribed", "symbols": sorted(subscription.symbols)})
+
+    except WebSocketDisconnect:
+        logger.info(f"[Market API] Stream closed for user {current_user.id}")
+    finally:
+        sender.cancel()
+        subscription.close()
+
+
+@router.get("/rate-limit")
+async def get_rate_limit_stats(
+    kis_client: KISClient = Depends(get_kis_client),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get KIS rate limiter metrics for the current user's app key.
+
+    Args:
+        kis_client: KIS API client
+        current_user: Current user
+
+    Returns:
+        Budget, queue depth and per-lane wait statistics (ORDER, ACCOUNT,
+        QUOTE, BULK)
+    """
+    stats = kis_client.rate_limiter.stats()
+    stats["trading_mode"] = kis_client.trading_mode
+    stats["lanes"] = {
+        RequestPriority(priority).name: lane for priority, lane in stats["lanes"].items()
+    }
+    return stats
+
+
 @router.get("/latest/{symbol}", response_model=MarketDataResponse)
 async def get_latest_market_data(
     symbol: str,
@@ -3,9 +3,11 @@
 import logging
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.config import settings
 from app.core.deps import get_current_user, get_db
+from app.db.session import get_session_factory
 from app.models.user import User
 from app.core.strategy.types import StrategyStatus
 from app.schemas.strategy import (
@@ -17,6 +19,7 @@ from app.schemas.strategy import (
     StrategyExecuteResponse,
 )
 from app.services.strategy_service import StrategyService
+from app.services.strategy_execution_service import StrategyExecutionService
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -329,15 +332,20 @@ async def execute_strategy(
     strategy_id: int,
     request: StrategyExecuteRequest,
     db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
     current_user: User = Depends(get_current_user)
 ):
     """
     Execute a strategy on multiple symbols and generate trading signals.
 
+    Market data is loaded with up to ``request.concurrency`` concurrent
+    queries (default STRATEGY_EXECUTION_CONCURRENCY), each on its own session.
+
     Args:
         strategy_id: Strategy ID
         request: Execution request with list of symbols
         db: Database session
+        session_factory: Session factory for concurrent market data loads
         current_user: Current authenticated user
 
     Returns:
@@ -345,7 +353,7 @@ async def execute_strategy(
     """
     from datetime import datetime, timedelta
     from app.core.strategy import MomentumStrategy, StrategyType
-    from app.services.market_data_service import MarketDataService
+    from app.core.indicators import indicator_cache
     from app.models.market_data import TimeInterval
 
     try:
@@ -366,7 +374,9 @@ async def execute_strategy(
         if strategy.strategy_type == StrategyType.MOMENTUM:
             strategy_instance = MomentumStrategy(
                 name=strategy.name,
-                parameters=strategy.parameters
+                parameters=strategy.parameters,
+                indicator_cache=indicator_cache,
+                interval=TimeInterval.ONE_DAY
             )
         else:
             raise HTTPException(
@@ -374,77 +384,44 @@ async def execute_strategy(
                 detail=f"Strategy type {strategy.strategy_type.value} is not yet supported"
             )
 
-        # Execute strategy for each symbol
-        all_signals = []
+        # Load market data for all symbols
         end_date = datetime.now()
         start_date = end_date - timedelta(days=60)  # 60 days of data
+        concurrency = min(
+            request.concurrency or settings.STRATEGY_EXECUTION_CONCURRENCY,
+            settings.STRATEGY_MAX_CONCURRENCY
+        )
+
+        market_data_by_symbol = await StrategyExecutionService.load_market_data(
+            db=db,
+            symbols=request.symbols,
+            interval=TimeInterval.ONE_DAY,
+            start_date=start_date,
+            end_date=end_date,
+            limit=100,
+            concurrency=concurrency,
+            session_factory=session_factory
+        )
+
+        # Evaluate all symbols in one batch call
+        signals_by_symbol = await StrategyExecutionService.generate_signals(
+            strategy=strategy_instance,
+            market_data_by_symbol=market_data_by_symbol
+        )
 
-        for symbol in request.symbols:
-            try:
-                # Get market data for the symbol
-                market_data_list = await MarketDataService.get_market_data(
-                    db=db,
-                    symbol=symbol,
-                    interval=TimeInterval.ONE_DAY,
-                    start_date=start_date,
-                    end_date=end_date,
-                    limit=100
-                )
-
-                if not market_data_list:
-                    logger.warning(
-                        f"[Strategy API] No market data found for symbol {symbol}, skipping"
-                    )
-                    continue
-
-                # Get current price (last close price)
-                current_price = float(market_data_list[-1].close)
-
-                # Convert market data to dict format
-                market_data_dicts = [
-                    {
-                        "timestamp": data.timestamp,
-                        "open": float(data.open),
-                        "high": float(data.high),
-                        "low": float(data.low),
-                        "close": float(data.close),
-                        "volume": float(data.volume)
-                    }
-                    for data in market_data_list
-                ]
-
-                # Generate signals for this symbol
-                signals = await strategy_instance.generate_signals(
-                    symbol=symbol,
-                    market_data=market_data_dicts,
-                    current_price=current_price
-                )
-
-                # Add signals to results
-                all_signals.extend([
-                    {
-                        "timestamp": signal.timestamp.isoformat(),
-                        "symbol": signal.symbol,
-                        "signal_type": signal.signal_type.value,
-                        "price": signal.price,
-                        "quantity": signal.quantity,
-                        "reason": signal.reason,
-                        "confidence": signal.confidence
-                    }
-                    for signal in signals
-                ])
-
-                logger.info(
-                    f"[Strategy API] Executed strategy for {symbol}, "
-                    f"generated {len(signals)} signal(s)"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"[Strategy API] Error executing strategy for symbol {symbol}: {e}"
-                )
-                # Continue with next symbol instead of failing entire request
-                continue
+        all_signals = [
+            {
+                "timestamp": signal.timestamp.isoformat(),
+                "symbol": signal.symbol,
+                "signal_type": signal.signal_type.value,
+                "price": signal.price,
+                "quantity": signal.quantity,
+                "reason": signal.reason,
+                "confidence": signal.confidence
+            }
+            for symbol in request.symbols
+            for signal in signals_by_symbol.get(symbol, [])
+        ]
 
         logger.info(
             f"[Strategy API] Executed strategy: {strategy.name} (ID: {strategy_id}) "
@@ -38,9 +38,47 @@ class Settings(BaseSettings):
     KIS_BASE_URL: str = "https://openapi.koreainvestment.com:9443"
     KIS_ACCOUNT_NUMBER: Optional[str] = None
     KIS_ACCOUNT_CODE: Optional[str] = None
+    KIS_HTTP_TIMEOUT: float = 30.0
+    KIS_HTTP_MAX_CONNECTIONS: int = 50
+    KIS_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KIS_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # Seconds an idle connection stays open
+    KIS_HTTP2: bool = False  # Requires httpx[http2]
+    KIS_TOKEN_PROACTIVE_REFRESH: bool = True
+    KIS_TOKEN_REFRESH_MARGIN: int = 1800  # Seconds before expiry to renew in the background
+    KIS_REALTIME_URL: Optional[str] = None  # Default: KIS WebSocket URL of the trading mode
+    KIS_REALTIME_RECONNECT_MAX_DELAY: float = 30.0
 
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
+    KIS_REAL_REQUESTS_PER_SECOND: float = 18.0  # KIS allows 20/s on real accounts
+    KIS_MOCK_REQUESTS_PER_SECOND: float = 2.0  # and far less on mock accounts
+    # Budgets above are per app key across ALL processes using it. Set this to the
+    # number of such processes (uvicorn --workers, plus scripts running alongside);
+    # each process then limits itself to 1/N of the budget.
+    KIS_RATE_LIMIT_PROCESSES: int = 1
+
+    # Market Data Collection
+    COLLECTOR_CONCURRENCY: int = 8
+    COLLECTOR_BATCH_ROWS: int = 5000  # Rows buffered before each bulk upsert
+    COLLECTOR_MAX_RETRIES: int = 3
+    COLLECTOR_PREFETCH_PAGES: int = 2  # Backfill pages in flight per symbol
+    COLLECTOR_CHECKPOINT_DIR: Optional[str] = None  # Default: logs/collector
+    AGGREGATOR_FLUSH_ROWS: int = 1000  # Closed live bars buffered before a bulk upsert
+    AGGREGATOR_FLUSH_INTERVAL: float = 5.0  # Seconds between background flushes
+
+    # Quote Cache
+    QUOTE_CACHE_TTL_MARKET_HOURS: float = 1.0  # Seconds; 0 disables caching
+    QUOTE_CACHE_TTL_AFTER_HOURS: float = 30.0
+    QUOTE_STREAM_POLL_INTERVAL: float = 1.0  # Seconds between upstream polls per symbol
+    QUOTE_STREAM_MAX_SYMBOLS: int = 50  # Per connection
+    QUOTE_STREAM_QUEUE_SIZE: int = 100  # Undelivered quotes kept per connection
+    QUOTE_STREAM_AUTH_TIMEOUT: float = 10.0  # Seconds to wait for the auth message
+
+    # Strategy Execution
+    STRATEGY_EXECUTION_CONCURRENCY: int = 1  # 1 = sequential on the request session
+    STRATEGY_MAX_CONCURRENCY: int = 32
+    STRATEGY_PROCESS_POOL_WORKERS: int = 0  # 0 = evaluate in the event loop process
+    STRATEGY_PROCESS_POOL_MIN_SYMBOLS: int = 200
 
     model_config = SettingsConfigDict(
         env_file=".env",
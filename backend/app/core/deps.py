@@ -19,8 +19,11 @@ async def get_current_user(
     db: AsyncSession = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token."""
-    token = credentials.credentials
+    return await get_user_from_token(credentials.credentials, db)
 
+
+async def get_user_from_token(token: str, db: AsyncSession) -> User:
+    """Get the user of a JWT access token (e.g. one passed to a WebSocket)."""
     # Decode token
     payload = decode_token(token)
     if payload is None:
@@ -1,13 +1,48 @@
 """Technical indicators module."""
 
+from app.core.indicators import vectorized
 from app.core.indicators.technical import (
     calculate_sma,
     calculate_ema,
+    calculate_sma_grid,
+    calculate_ema_grid,
     detect_crossover,
+    find_crossovers,
+)
+from app.core.indicators.cache import IndicatorCache, indicator_cache
+from app.core.indicators.cross_sectional import (
+    build_price_matrix,
+    compute_crossover_matrices,
+)
+from app.core.indicators.streaming import (
+    RingBuffer,
+    SMAState,
+    EMAState,
+    WilderState,
+    RSIState,
+    MACDState,
+    ATRState,
+    CrossoverState,
 )
 
 __all__ = [
+    "vectorized",
     "calculate_sma",
     "calculate_ema",
+    "calculate_sma_grid",
+    "calculate_ema_grid",
     "detect_crossover",
+    "find_crossovers",
+    "IndicatorCache",
+    "indicator_cache",
+    "build_price_matrix",
+    "compute_crossover_matrices",
+    "RingBuffer",
+    "SMAState",
+    "EMAState",
+    "WilderState",
+    "RSIState",
+    "MACDState",
+    "ATRState",
+    "CrossoverState",
 ]
@@ -0,0 +1,201 @@
+"""Memoization layer for indicator series.
+
+Results are cached per (symbol, interval, indicator, params) together with
+the first/last bar timestamp and last value they were computed from. A
+request whose last bar matches is a hit; a request that only adds one bar
+(or slides a fixed window forward by one bar) is extended from the cached
+series instead of being recomputed.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.indicators import vectorized
+
+CacheKey = Tuple[str, str, str, Tuple[Tuple[str, Any], ...]]
+
+# Rough per-entry overhead (key, timestamps, dict) added to the array size
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+def _extend_sma(values: np.ndarray, previous: np.ndarray, period: int) -> float:
+    """Next SMA value from the last ``period`` bars."""
+    if values.size < period:
+        return np.nan
+    return float(values[-period:].mean())
+
+
+def _extend_ema(values: np.ndarray, previous: np.ndarray, period: int) -> float:
+    """Next EMA value from the previous EMA and the new bar."""
+    if previous.size == 0 or np.isnan(previous[-1]):
+        # Still warming up: the bar that completes the first full window seeds it
+        if values.size < period:
+            return np.nan
+        return float(vectorized.ema(values, period)[-1])
+    multiplier = 2 / (period + 1)
+    return float((values[-1] - previous[-1]) * multiplier + previous[-1])
+
+
+# name -> (batch function, one-bar extension or None)
+INDICATORS: Dict[str, Tuple[Callable[..., np.ndarray], Optional[Callable[..., float]]]] = {
+    "sma": (vectorized.sma, _extend_sma),
+    "ema": (vectorized.ema, _extend_ema),
+    "rsi": (vectorized.rsi, None),
+    "rolling_std": (vectorized.rolling_std, None),
+}
+
+# Indicators whose value at a bar depends only on a trailing window, so a
+# window sliding forward by one bar keeps all earlier values except warm-up.
+_WINDOWED = {"sma"}
+
+
+class IndicatorCache:
+    """LRU cache of indicator series with a memory cap."""
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize indicator cache.
+
+        Args:
+            max_entries: Maximum number of cached series
+            max_bytes: Approximate memory cap for cached series
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.extensions = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached series."""
+        return self._bytes
+
+    def get(
+        self,
+        symbol: str,
+        interval: str,
+        indicator: str,
+        params: Dict[str, Any],
+        timestamps: Sequence[Hashable],
+        values: Sequence[float]
+    ) -> np.ndarray:
+        """
+        Return the indicator series for ``values``, computing only what is new.
+
+        Args:
+            symbol: Stock symbol
+            interval: Time interval of the bars (e.g. TimeInterval.ONE_DAY)
+            indicator: Indicator name (key of ``INDICATORS``)
+            params: Indicator keyword parameters (e.g. {"period": 20})
+            timestamps: Bar timestamps in chronological order
+            values: Input series aligned with ``timestamps``
+
+        Returns:
+            Indicator array (treat as read-only; it is shared with the cache)
+
+        Raises:
+            ValueError: If the indicator is not registered
+        """
+        if indicator not in INDICATORS:
+            raise ValueError(f"Unsupported indicator: {indicator}")
+
+        compute, extend = INDICATORS[indicator]
+        interval = getattr(interval, "value", interval)
+        key: CacheKey = (symbol, interval, indicator, tuple(sorted(params.items())))
+        array = vectorized.to_array(values)
+        n = array.size
+
+        entry = self._entries.get(key)
+        if entry is not None and n > 0:
+            self._entries.move_to_end(key)
+            cached = entry["result"]
+            same_last = entry["last_ts"] == timestamps[-1] and entry["last_value"] == array[-1]
+
+            if same_last and entry["first_ts"] == timestamps[0] and cached.size == n:
+                self.hits += 1
+                return cached
+
+            if (extend is not None and n >= 2 and entry["last_ts"] == timestamps[-2]
+                    and entry["last_value"] == array[-2]):
+                result = None
+                if entry["first_ts"] == timestamps[0] and cached.size == n - 1:
+                    # Same start, one bar appended
+                    result = np.append(cached, extend(array, cached, **params))
+                elif (indicator in _WINDOWED and cached.size == n
+                        and cached.size > 1 and entry["second_ts"] == timestamps[0]):
+                    # Fixed-size window slid forward by one bar
+                    result = np.append(cached[1:], extend(array, cached, **params))
+                    result[:params["period"] - 1] = np.nan
+
+                if result is not None:
+                    self.extensions += 1
+                    self._store(key, timestamps, array, result)
+                    return result
+
+        self.misses += 1
+        result = compute(array, **params) if n else np.empty(0)
+        if n:
+            self._store(key, timestamps, array, result)
+        return result
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        Drop cached series.
+
+        Args:
+            symbol: Only drop entries for this symbol (default: everything)
+        """
+        for key in [k for k in self._entries if symbol is None or k[0] == symbol]:
+            self._bytes -= self._entries.pop(key)["nbytes"]
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/extension/miss counters and current size."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "extensions": self.extensions,
+            "misses": self.misses,
+        }
+
+    def _store(
+        self,
+        key: CacheKey,
+        timestamps: Sequence[Hashable],
+        values: np.ndarray,
+        result: np.ndarray
+    ) -> None:
+        """Insert or replace an entry and evict least recently used ones."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old["nbytes"]
+
+        result.setflags(write=False)
+        nbytes = result.nbytes + _ENTRY_OVERHEAD_BYTES
+        self._entries[key] = {
+            "first_ts": timestamps[0],
+            "second_ts": timestamps[1] if len(timestamps) > 1 else None,
+            "last_ts": timestamps[-1],
+            "last_value": values[-1],
+            "result": result,
+            "nbytes": nbytes,
+        }
+        self._bytes += nbytes
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted["nbytes"]
+
+
+# Process-wide cache shared by all strategy executions
+indicator_cache = IndicatorCache()
@@ -0,0 +1,73 @@
+"""Cross-sectional indicator computation over a universe of symbols.
+
+Prices are held in a 2-D ``symbols x time`` matrix aligned on the latest
+bar, so one vectorized pass computes indicators for every symbol at once.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.indicators import vectorized
+
+
+def build_price_matrix(
+    series_by_symbol: Mapping[str, Sequence[float]],
+    length: Optional[int] = None
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Stack per-symbol price series into a right-aligned matrix.
+
+    Series are aligned on their last bar; shorter histories are left-padded
+    with NaN and longer ones keep only their most recent ``length`` bars.
+
+    Args:
+        series_by_symbol: Chronological prices per symbol
+        length: Number of bars (columns); defaults to the longest series
+
+    Returns:
+        Tuple of (symbols in row order, float64 matrix of shape symbols x length)
+    """
+    symbols = list(series_by_symbol.keys())
+    if length is None:
+        length = max((len(s) for s in series_by_symbol.values()), default=0)
+
+    matrix = np.full((len(symbols), length), np.nan)
+    if length == 0:
+        return symbols, matrix
+
+    for row, symbol in enumerate(symbols):
+        values = vectorized.to_array(series_by_symbol[symbol])[-length:]
+        if values.size:
+            matrix[row, length - values.size:] = values
+    return symbols, matrix
+
+
+def compute_crossover_matrices(
+    closes: np.ndarray,
+    fast_period: int,
+    slow_period: int,
+    ma_type: str = "SMA"
+) -> Dict[str, np.ndarray]:
+    """
+    Compute fast/slow moving averages and crossovers for every symbol.
+
+    Args:
+        closes: Close price matrix (symbols x time)
+        fast_period: Fast moving average period
+        slow_period: Slow moving average period
+        ma_type: "SMA" or "EMA"
+
+    Returns:
+        Dictionary with "fast" and "slow" MA matrices and an int8
+        "crossover" matrix (+1 golden, -1 death, 0 none), all symbols x time
+    """
+    closes = np.atleast_2d(vectorized.to_array(closes))
+    fast = vectorized.moving_average(closes, fast_period, ma_type)
+    slow = vectorized.moving_average(closes, slow_period, ma_type)
+
+    return {
+        "fast": fast,
+        "slow": slow,
+        "crossover": vectorized.crossovers(fast, slow),
+    }
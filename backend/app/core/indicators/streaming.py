@@ -0,0 +1,409 @@
+"""Streaming indicator state for live bars.
+
+Each state object consumes one bar at a time via ``update()`` in O(1) and
+produces the same values as the batch functions in ``technical.py`` /
+``vectorized.py`` for the same input sequence.
+"""
+
+from typing import Dict, Iterable, List, Literal, Optional
+
+CrossoverType = Literal["golden", "death", "none"]
+
+
+class RingBuffer:
+    """Fixed-size ring buffer of floats with a running sum."""
+
+    # Recompute the running sum from the buffer after this many wraps to
+    # bound floating-point drift on long-lived states.
+    _RESUM_WRAPS = 64
+
+    def __init__(self, size: int):
+        """
+        Initialize ring buffer.
+
+        Args:
+            size: Number of values to keep
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self._values: List[float] = [0.0] * size
+        self._index = 0
+        self._count = 0
+        self._wraps = 0
+        self.total = 0.0
+
+    @property
+    def full(self) -> bool:
+        """Whether the buffer holds ``size`` values."""
+        return self._count == self.size
+
+    def push(self, value: float) -> Optional[float]:
+        """
+        Append a value, evicting the oldest one when full.
+
+        Args:
+            value: New value
+
+        Returns:
+            Evicted value, or None if the buffer was not full yet
+        """
+        evicted = self._values[self._index] if self.full else None
+        self._values[self._index] = value
+        self.total += value - (evicted or 0.0)
+
+        self._index += 1
+        if self._index == self.size:
+            self._index = 0
+            self._wraps += 1
+            if self._wraps % self._RESUM_WRAPS == 0:
+                self.total = sum(self._values)
+        if not self.full:
+            self._count += 1
+        return evicted
+
+
+class SMAState:
+    """Incremental Simple Moving Average."""
+
+    def __init__(self, period: int):
+        """
+        Initialize SMA state.
+
+        Args:
+            period: Moving average period
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self._buffer = RingBuffer(period)
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough bars have been seen to produce a value."""
+        return self.value is not None
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add one bar.
+
+        Args:
+            price: New price
+
+        Returns:
+            Current SMA, or None during warm-up
+        """
+        self._buffer.push(float(price))
+        if self._buffer.full:
+            self.value = self._buffer.total / self.period
+        return self.value
+
+    @classmethod
+    def from_history(cls, prices: Iterable[float], period: int) -> "SMAState":
+        """Create a state and replay historical prices through it."""
+        state = cls(period)
+        for price in prices:
+            state.update(price)
+        return state
+
+
+class EMAState:
+    """Incremental Exponential Moving Average (SMA-seeded)."""
+
+    def __init__(self, period: int):
+        """
+        Initialize EMA state.
+
+        Args:
+            period: EMA period
+        """
+        if period <= 0:
+            raise ValueError("period must be positive")
+        self.period = period
+        self.multiplier = 2 / (period + 1)
+        self._seed = SMAState(period)
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough bars have been seen to produce a value."""
+        return self.value is not None
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add one bar.
+
+        Args:
+            price: New price
+
+        Returns:
+            Current EMA, or None during warm-up
+        """
+        price = float(price)
+        if self.value is None:
+            self.value = self._seed.update(price)
+        else:
+            self.value = (price - self.value) * self.multiplier + self.value
+        return self.value
+
+    @classmethod
+    def from_history(cls, prices: Iterable[float], period: int) -> "EMAState":
+        """Create a state and replay historical prices through it."""
+        state = cls(period)
+        for price in prices:
+            state.update(price)
+        return state
+
+
+class WilderState(EMAState):
+    """Incremental Wilder smoothing (SMA-seeded, ``alpha = 1 / period``)."""
+
+    def __init__(self, period: int):
+        """
+        Initialize Wilder smoothing state.
+
+        Args:
+            period: Smoothing period
+        """
+        super().__init__(period)
+        self.multiplier = 1 / period
+
+
+class RSIState:
+    """Incremental Relative Strength Index (matches ``vectorized.rsi``)."""
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize RSI state.
+
+        Args:
+            period: RSI period
+        """
+        self.period = period
+        self._gain = WilderState(period)
+        self._loss = WilderState(period)
+        self._prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough bars have been seen to produce a value."""
+        return self.value is not None
+
+    def update(self, close: float) -> Optional[float]:
+        """
+        Add one bar.
+
+        Args:
+            close: Closing price
+
+        Returns:
+            Current RSI, or None during warm-up (the first ``period`` bars)
+        """
+        close = float(close)
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return None
+
+        change = close - prev_close
+        avg_gain = self._gain.update(max(change, 0.0))
+        avg_loss = self._loss.update(max(-change, 0.0))
+        if avg_gain is None or avg_loss is None:
+            return None
+
+        if avg_loss == 0:
+            # No losses in the window: 100, or neutral 50 for a completely flat window
+            self.value = 50.0 if avg_gain == 0 else 100.0
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return self.value
+
+    @classmethod
+    def from_history(cls, closes: Iterable[float], period: int = 14) -> "RSIState":
+        """Create a state and replay historical closes through it."""
+        state = cls(period)
+        for close in closes:
+            state.update(close)
+        return state
+
+
+class MACDState:
+    """Incremental MACD line, signal and histogram (matches ``vectorized.macd``)."""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        """
+        Initialize MACD state.
+
+        Args:
+            fast_period: Fast EMA period
+            slow_period: Slow EMA period
+            signal_period: Signal line EMA period (over the MACD line)
+        """
+        self._fast = EMAState(fast_period)
+        self._slow = EMAState(slow_period)
+        self._signal = EMAState(signal_period)
+        self.macd: Optional[float] = None
+        self.signal: Optional[float] = None
+        self.histogram: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether the signal line has warmed up."""
+        return self.signal is not None
+
+    def update(self, close: float) -> Dict[str, Optional[float]]:
+        """
+        Add one bar.
+
+        Args:
+            close: Closing price
+
+        Returns:
+            Dictionary with "macd", "signal" and "histogram" (None during warm-up)
+        """
+        fast = self._fast.update(close)
+        slow = self._slow.update(close)
+        if fast is not None and slow is not None:
+            self.macd = fast - slow
+            # The signal EMA only sees bars where the MACD line exists
+            self.signal = self._signal.update(self.macd)
+            if self.signal is not None:
+                self.histogram = self.macd - self.signal
+
+        return {"macd": self.macd, "signal": self.signal, "histogram": self.histogram}
+
+    @classmethod
+    def from_history(
+        cls,
+        closes: Iterable[float],
+        fast_period: int = 12,
+        slow_period: int = 26,
+        signal_period: int = 9
+    ) -> "MACDState":
+        """Create a state and replay historical closes through it."""
+        state = cls(fast_period, slow_period, signal_period)
+        for close in closes:
+            state.update(close)
+        return state
+
+
+class ATRState:
+    """Incremental Average True Range (matches ``vectorized.atr``)."""
+
+    def __init__(self, period: int = 14):
+        """
+        Initialize ATR state.
+
+        Args:
+            period: ATR period
+        """
+        self.period = period
+        self._average = WilderState(period)
+        self._prev_close: Optional[float] = None
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether enough bars have been seen to produce a value."""
+        return self.value is not None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        """
+        Add one bar.
+
+        Args:
+            high: High price
+            low: Low price
+            close: Closing price
+
+        Returns:
+            Current ATR, or None during warm-up (the first ``period`` bars)
+        """
+        high, low = float(high), float(low)
+        prev_close, self._prev_close = self._prev_close, float(close)
+        if prev_close is None:
+            # The first bar has no previous close, so no true range
+            return None
+
+        true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        self.value = self._average.update(true_range)
+        return self.value
+
+    @classmethod
+    def from_history(
+        cls,
+        highs: Iterable[float],
+        lows: Iterable[float],
+        closes: Iterable[float],
+        period: int = 14
+    ) -> "ATRState":
+        """Create a state and replay historical bars through it."""
+        state = cls(period)
+        for high, low, close in zip(highs, lows, closes):
+            state.update(high, low, close)
+        return state
+
+
+class CrossoverState:
+    """
+    Incremental fast/slow moving average crossover detector.
+
+    Keeps only the previous pair of MA values, so each bar is O(1) instead of
+    recomputing both full series to read their last two points.
+    """
+
+    def __init__(self, fast_period: int, slow_period: int, ma_type: str = "SMA"):
+        """
+        Initialize crossover state.
+
+        Args:
+            fast_period: Fast moving average period
+            slow_period: Slow moving average period
+            ma_type: Moving average type ("SMA" or "EMA")
+        """
+        state_cls = EMAState if ma_type.upper() == "EMA" else SMAState
+        self.fast = state_cls(fast_period)
+        self.slow = state_cls(slow_period)
+        self._prev_fast: Optional[float] = None
+        self._prev_slow: Optional[float] = None
+        self.last_crossover: CrossoverType = "none"
+
+    def update(self, price: float) -> CrossoverType:
+        """
+        Add one bar and report whether it completed a crossover.
+
+        Args:
+            price: New price
+
+        Returns:
+            "golden", "death" or "none" (same rules as ``detect_crossover``)
+        """
+        fast = self.fast.update(price)
+        slow = self.slow.update(price)
+        prev_fast, prev_slow = self._prev_fast, self._prev_slow
+        self._prev_fast, self._prev_slow = fast, slow
+
+        crossover: CrossoverType = "none"
+        if None not in (prev_fast, prev_slow, fast, slow):
+            if prev_fast < prev_slow and fast > slow:
+                crossover = "golden"
+            elif prev_fast > prev_slow and fast < slow:
+                crossover = "death"
+
+        self.last_crossover = crossover
+        return crossover
+
+    @classmethod
+    def from_history(
+        cls,
+        prices: Iterable[float],
+        fast_period: int,
+        slow_period: int,
+        ma_type: str = "SMA"
+    ) -> "CrossoverState":
+        """Create a state and replay historical prices through it."""
+        state = cls(fast_period, slow_period, ma_type)
+        for price in prices:
+            state.update(price)
+        return state
@@ -1,6 +1,8 @@
 """Technical indicators calculation."""
 
-from typing import List, Literal
+from typing import Dict, List, Literal, Tuple
+
+from app.core.indicators import vectorized
 
 
 def calculate_sma(data: List[float], period: int) -> List[float]:
@@ -14,6 +16,9 @@ def calculate_sma(data: List[float], period: int) -> List[float]:
     Returns:
         List of SMA values (same length as input, with None for insufficient data points)
 
+    Note:
+        List wrapper around ``vectorized.sma`` (cumulative-sum, O(n)).
+
     Example:
         >>> prices = [100, 102, 101, 103, 105, 107, 106, 108, 110, 109]
         >>> sma_5 = calculate_sma(prices, 5)
@@ -25,19 +30,7 @@ def calculate_sma(data: List[float], period: int) -> List[float]:
     if period > len(data):
         return [None] * len(data)
 
-    sma_values = []
-
-    # First (period - 1) values are None (not enough data points)
-    for i in range(period - 1):
-        sma_values.append(None)
-
-    # Calculate SMA for remaining values
-    for i in range(period - 1, len(data)):
-        window = data[i - period + 1:i + 1]
-        sma = sum(window) / period
-        sma_values.append(sma)
-
-    return sma_values
+    return vectorized.to_list(vectorized.sma(data, period))
 
 
 def calculate_ema(data: List[float], period: int) -> List[float]:
@@ -51,6 +44,9 @@ def calculate_ema(data: List[float], period: int) -> List[float]:
     Returns:
         List of EMA values (same length as input, with None for insufficient data points)
 
+    Note:
+        List wrapper around ``vectorized.ema`` (recursive filter, O(n)).
+
     Example:
         >>> prices = [100, 102, 101, 103, 105, 107, 106, 108, 110, 109]
         >>> ema_5 = calculate_ema(prices, 5)
@@ -61,24 +57,64 @@ def calculate_ema(data: List[float], period: int) -> List[float]:
     if period > len(data):
         return [None] * len(data)
 
-    ema_values = []
-    multiplier = 2 / (period + 1)
+    return vectorized.to_list(vectorized.ema(data, period))
+
+
+def calculate_sma_grid(data: List[float], periods: List[int]) -> Dict[int, List[float]]:
+    """
+    Calculate SMA for several periods at once (parameter sweeps).
+
+    All windows are read from a single prefix-sum array, so the cost is
+    O(n * len(periods)) in vectorized operations instead of one loop per period.
+
+    Args:
+        data: List of prices (e.g., closing prices)
+        periods: Moving average periods
+
+    Returns:
+        Dictionary mapping each period to its SMA values (same format as calculate_sma)
+
+    Raises:
+        ValueError: If any period is not positive
+
+    Example:
+        >>> grid = calculate_sma_grid(prices, [5, 10, 20, 60])
+        >>> sma_20 = grid[20]
+    """
+    periods = list(dict.fromkeys(periods))
+    if any(p <= 0 for p in periods):
+        raise ValueError("periods must be positive")
+    if not data or not periods:
+        return {p: [] for p in periods}
+
+    rows = vectorized.sma_grid(data, periods)
+    return {p: vectorized.to_list(row) for p, row in zip(periods, rows)}
+
+
+def calculate_ema_grid(data: List[float], periods: List[int]) -> Dict[int, List[float]]:
+    """
+    Calculate EMA for several periods at once (parameter sweeps).
+
+    Every period is filtered in the same batched pass over the data.
 
-    # First (period - 1) values are None
-    for i in range(period - 1):
-        ema_values.append(None)
+    Args:
+        data: List of prices (e.g., closing prices)
+        periods: EMA periods
 
-    # First EMA value is SMA
-    first_sma = sum(data[:period]) / period
-    ema_values.append(first_sma)
+    Returns:
+        Dictionary mapping each period to its EMA values (same format as calculate_ema)
 
-    # Calculate EMA for remaining values
-    # EMA = (Close - EMA(previous day)) * multiplier + EMA(previous day)
-    for i in range(period, len(data)):
-        ema = (data[i] - ema_values[-1]) * multiplier + ema_values[-1]
-        ema_values.append(ema)
+    Raises:
+        ValueError: If any period is not positive
+    """
+    periods = list(dict.fromkeys(periods))
+    if any(p <= 0 for p in periods):
+        raise ValueError("periods must be positive")
+    if not data or not periods:
+        return {p: [] for p in periods}
 
-    return ema_values
+    rows = vectorized.ema_grid(data, periods)
+    return {p: vectorized.to_list(row) for p, row in zip(periods, rows)}
 
 
 def detect_crossover(
@@ -130,3 +166,37 @@ def detect_crossover(
         return "death"
 
     return "none"
+
+
+def find_crossovers(
+    fast_ma: List[float],
+    slow_ma: List[float]
+) -> List[Tuple[int, Literal["golden", "death"]]]:
+    """
+    Find every moving average crossover over the full history.
+
+    Applies the ``detect_crossover`` rule to each consecutive pair of bars in
+    one vectorized pass, so the whole series costs O(n) instead of calling
+    ``detect_crossover`` on every prefix.
+
+    Args:
+        fast_ma: Fast moving average values (None during warm-up)
+        slow_ma: Slow moving average values (None during warm-up)
+
+    Returns:
+        List of (index, "golden" | "death") tuples in chronological order
+
+    Example:
+        >>> fast_ma = [None, 101, 103, 101]
+        >>> slow_ma = [None, 102, 102, 102]
+        >>> find_crossovers(fast_ma, slow_ma)
+        [(2, 'golden'), (3, 'death')]
+    """
+    if not fast_ma or not slow_ma:
+        return []
+
+    indices, directions = vectorized.find_crossovers(fast_ma, slow_ma)
+    return [
+        (index, "golden" if direction > 0 else "death")
+        for index, direction in zip(indices.tolist(), directions.tolist())
+    ]
@@ -0,0 +1,603 @@
+"""Vectorized technical indicators on NumPy arrays.
+
+All functions take float arrays (1-D series or 2-D symbols x time matrices,
+time on the last axis) and return arrays of the same shape. Bars without
+enough data are NaN, mirroring the ``None`` warm-up of the list API in
+``technical.py``.
+"""
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[np.ndarray, Iterable[float]]
+
+# Largest growth factor allowed inside one EMA block before the carry is
+# folded back in; keeps the closed-form prefix sums well inside float64 range.
+_EMA_BLOCK_GROWTH = 1e8
+
+
+def to_array(data: ArrayLike) -> np.ndarray:
+    """
+    Convert prices to a float64 array (None becomes NaN).
+
+    Args:
+        data: List/sequence of prices or an existing array
+
+    Returns:
+        Float64 NumPy array
+    """
+    if isinstance(data, np.ndarray) and data.dtype == np.float64:
+        return data
+    return np.array(data, dtype=np.float64)
+
+
+def to_list(values: np.ndarray) -> list:
+    """
+    Convert an indicator array to the list format of the list API.
+
+    Args:
+        values: 1-D indicator array
+
+    Returns:
+        List of floats with None in place of NaN
+    """
+    return [None if v != v else v for v in values.tolist()]
+
+
+def sma(data: ArrayLike, period: int) -> np.ndarray:
+    """
+    Simple Moving Average from a single cumulative sum, O(n).
+
+    A window containing any NaN yields NaN, so series that are left-padded
+    with NaN (shorter histories in a universe matrix) warm up independently.
+
+    Args:
+        data: Prices, 1-D or 2-D (time on the last axis)
+        period: Moving average period
+
+    Returns:
+        SMA array, NaN where fewer than ``period`` valid bars are available
+    """
+    values = to_array(data)
+    if period <= 0:
+        raise ValueError("period must be positive")
+
+    result = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if period > n:
+        return result
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+
+    # Prepend a zero column so window sums are csum[t + 1] - csum[t + 1 - period]
+    pad = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    csum = np.pad(np.cumsum(filled, axis=-1), pad)
+    ccount = np.pad(np.cumsum(valid, axis=-1), pad)
+
+    window_sum = csum[..., period:] - csum[..., :-period]
+    window_count = ccount[..., period:] - ccount[..., :-period]
+
+    result[..., period - 1:] = np.where(
+        window_count == period, window_sum / period, np.nan
+    )
+    return result
+
+
+def ema(data: ArrayLike, period: int) -> np.ndarray:
+    """
+    Exponential Moving Average as a recursive filter, O(n).
+
+    The first value is the SMA of the first ``period`` valid bars and every
+    following bar applies ``EMA = (Close - EMA_prev) * k + EMA_prev`` with
+    ``k = 2 / (period + 1)``. The recursion is evaluated in closed form over
+    blocks of bars instead of one Python iteration per bar.
+
+    Args:
+        data: Prices, 1-D or 2-D (time on the last axis)
+        period: EMA period
+
+    Returns:
+        EMA array, NaN before the seed bar
+    """
+    values = to_array(data)
+    if period <= 0:
+        raise ValueError("period must be positive")
+
+    seed = sma(values, period)
+    alpha = 2.0 / (period + 1)
+    return ewm_filter(values, seed, alpha)
+
+
+def ewm_filter(
+    values: np.ndarray,
+    seed: np.ndarray,
+    alpha: Union[float, np.ndarray]
+) -> np.ndarray:
+    """
+    Run ``y[t] = alpha * x[t] + (1 - alpha) * y[t - 1]`` seeded per row.
+
+    Each row starts at its first non-NaN entry of ``seed`` (taking the seed
+    value there) and filters ``values`` from the next bar on. Bars before
+    the seed are NaN.
+
+    Args:
+        values: Input series, 1-D or 2-D (time on the last axis)
+        seed: Array shaped like ``values``; first non-NaN per row is the seed
+        alpha: Smoothing factor in (0, 1], scalar or one per row
+
+    Returns:
+        Filtered array
+    """
+    values = to_array(values)
+    seed = to_array(seed)
+    squeeze = values.ndim == 1
+    x = np.atleast_2d(values)
+    s = np.atleast_2d(seed)
+    rows, n = x.shape
+    result = np.full((rows, n), np.nan)
+    if n == 0:
+        return result[0] if squeeze else result
+
+    alpha = np.broadcast_to(np.asarray(alpha, dtype=np.float64), (rows,))[:, None]
+    has_seed = ~np.isnan(s)
+    start = np.where(has_seed.any(axis=1), has_seed.argmax(axis=1), n)
+    t = np.arange(n)
+
+    # Impulse formulation: inject the seed at its bar and alpha * x after it,
+    # so the whole series becomes a zero-state linear filter.
+    y = np.where(t > start[:, None], alpha * x, 0.0)
+    row_idx = np.nonzero(start < n)[0]
+    y[row_idx, start[row_idx]] = s[row_idx, start[row_idx]]
+
+    decay = 1.0 - alpha
+    if not decay.any():
+        out = y
+    else:
+        # Block length is bounded by the fastest-decaying row; rows with
+        # decay 0 (alpha 1) are exact with any block since 0 ** 0 == 1.
+        fastest = decay[decay > 0].min()
+        block = max(1, int(np.log(_EMA_BLOCK_GROWTH) / -np.log(fastest)))
+        out = np.empty_like(y)
+        carry = np.zeros((rows, 1))
+        for b0 in range(0, n, block):
+            b1 = min(n, b0 + block)
+            powers = decay ** np.arange(b1 - b0 + 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scaled = np.cumsum(y[:, b0:b1] / powers[:, :-1], axis=1) * powers[:, :-1]
+            # Zero decay: the filter output is just the impulse itself
+            scaled = np.where(decay == 0, y[:, b0:b1], scaled)
+            out[:, b0:b1] = scaled + carry * powers[:, 1:]
+            carry = out[:, b1 - 1:b1]
+
+    mask = t >= start[:, None]
+    result[mask] = out[mask]
+    return result[0] if squeeze else result
+
+
+def sma_grid(data: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """
+    SMA for many periods from one shared cumulative sum.
+
+    Args:
+        data: 1-D prices
+        periods: Moving average periods
+
+    Returns:
+        Array of shape (len(periods), n); row i is ``sma(data, periods[i])``
+    """
+    values = to_array(data)
+    periods = np.asarray(periods, dtype=np.int64)
+    if (periods <= 0).any():
+        raise ValueError("periods must be positive")
+
+    n = values.size
+    result = np.full((periods.size, n), np.nan)
+    if n == 0 or periods.size == 0:
+        return result
+
+    valid = ~np.isnan(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+
+    # Window [t - p + 1, t] for every (period, bar) pair via fancy indexing
+    end = np.arange(1, n + 1)
+    begin = end[None, :] - periods[:, None]
+    in_range = begin >= 0
+    begin = np.where(in_range, begin, 0)
+    window_sum = csum[end][None, :] - csum[begin]
+    window_count = ccount[end][None, :] - ccount[begin]
+
+    full = in_range & (window_count == periods[:, None])
+    result[full] = (window_sum / periods[:, None])[full]
+    return result
+
+
+def ema_grid(data: ArrayLike, periods: Sequence[int]) -> np.ndarray:
+    """
+    EMA for many periods as one batched recursive filter.
+
+    Args:
+        data: 1-D prices
+        periods: EMA periods
+
+    Returns:
+        Array of shape (len(periods), n); row i is ``ema(data, periods[i])``
+    """
+    values = to_array(data)
+    periods = np.asarray(periods, dtype=np.float64)
+    seeds = sma_grid(values, periods.astype(np.int64))
+    tiled = np.broadcast_to(values, seeds.shape)
+    return ewm_filter(tiled, seeds, 2.0 / (periods + 1))
+
+
+def moving_average(data: ArrayLike, period: int, ma_type: str = "SMA") -> np.ndarray:
+    """
+    Dispatch to ``sma`` or ``ema`` by moving average type.
+
+    Args:
+        data: Prices, 1-D or 2-D (time on the last axis)
+        period: Moving average period
+        ma_type: "SMA" or "EMA"
+
+    Returns:
+        Moving average array
+    """
+    if ma_type.upper() == "EMA":
+        return ema(data, period)
+    return sma(data, period)
+
+
+def crossovers(fast: ArrayLike, slow: ArrayLike) -> np.ndarray:
+    """
+    Classify every bar as golden (+1), death (-1) or no crossover (0).
+
+    Uses the same rule as ``detect_crossover`` on each consecutive pair of
+    bars. NaN comparisons are always False, so warm-up bars come out as 0.
+
+    Args:
+        fast: Fast moving average, 1-D or 2-D (time on the last axis)
+        slow: Slow moving average with the same shape
+
+    Returns:
+        int8 array shaped like the inputs; the first bar is always 0
+    """
+    fast = to_array(fast)
+    slow = to_array(slow)
+    result = np.zeros(fast.shape, dtype=np.int8)
+    if fast.shape[-1] < 2:
+        return result
+
+    prev_fast, prev_slow = fast[..., :-1], slow[..., :-1]
+    curr_fast, curr_slow = fast[..., 1:], slow[..., 1:]
+    with np.errstate(invalid="ignore"):
+        golden = (prev_fast < prev_slow) & (curr_fast > curr_slow)
+        death = (prev_fast > prev_slow) & (curr_fast < curr_slow)
+    result[..., 1:] = golden.astype(np.int8) - death.astype(np.int8)
+    return result
+
+
+def find_crossovers(fast: ArrayLike, slow: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locate every crossover event in a 1-D pair of moving averages.
+
+    Args:
+        fast: Fast moving average (NaN/None during warm-up)
+        slow: Slow moving average (NaN/None during warm-up)
+
+    Returns:
+        Tuple of (bar indices, directions) where direction is +1 for a
+        golden cross and -1 for a death cross, in chronological order
+    """
+    events = crossovers(fast, slow)
+    indices = np.flatnonzero(events)
+    return indices, events[indices]
+
+
+def _shift(values: np.ndarray, fill: float = np.nan) -> np.ndarray:
+    """Shift an array one bar forward along the time axis."""
+    shifted = np.empty_like(values)
+    shifted[..., 0] = fill
+    shifted[..., 1:] = values[..., :-1]
+    return shifted
+
+
+def _rolling_extreme(values: np.ndarray, period: int, ufunc: np.ufunc, pad: float) -> np.ndarray:
+    """
+    Rolling max/min in O(n) with the van Herk/Gil-Werman block scheme.
+
+    Within each block of ``period`` bars a forward prefix and a backward
+    suffix accumulation are taken; every window spans at most two blocks, so
+    its extreme is ``ufunc(suffix[start], prefix[end])``. NaN propagates.
+    """
+    values = to_array(values)
+    if period <= 0:
+        raise ValueError("period must be positive")
+
+    result = np.full(values.shape, np.nan)
+    n = values.shape[-1]
+    if period > n:
+        return result
+
+    blocks = -(-n // period)
+    padded = np.full(values.shape[:-1] + (blocks * period,), pad)
+    padded[..., :n] = values
+    shaped = padded.reshape(values.shape[:-1] + (blocks, period))
+
+    prefix = ufunc.accumulate(shaped, axis=-1).reshape(padded.shape)
+    suffix = ufunc.accumulate(shaped[..., ::-1], axis=-1)[..., ::-1].reshape(padded.shape)
+
+    result[..., period - 1:] = ufunc(suffix[..., :n - period + 1], prefix[..., period - 1:n])
+    return result
+
+
+def rolling_max(data: ArrayLike, period: int) -> np.ndarray:
+    """
+    Highest value over a trailing window, O(n).
+
+    Args:
+        data: Values, 1-D or 2-D (time on the last axis)
+        period: Window length
+
+    Returns:
+        Rolling maximum, NaN during warm-up
+    """
+    return _rolling_extreme(data, period, np.maximum, -np.inf)
+
+
+def rolling_min(data: ArrayLike, period: int) -> np.ndarray:
+    """
+    Lowest value over a trailing window, O(n).
+
+    Args:
+        data: Values, 1-D or 2-D (time on the last axis)
+        period: Window length
+
+    Returns:
+        Rolling minimum, NaN during warm-up
+    """
+    return _rolling_extreme(data, period, np.minimum, np.inf)
+
+
+def rolling_std(data: ArrayLike, period: int) -> np.ndarray:
+    """
+    Population standard deviation over a trailing window, O(n).
+
+    Computed from cumulative sums of the values and their squares after
+    subtracting the first valid value of each row to limit cancellation.
+
+    Args:
+        data: Values, 1-D or 2-D (time on the last axis)
+        period: Window length
+
+    Returns:
+        Rolling standard deviation, NaN during warm-up
+    """
+    values = to_array(data)
+    if values.shape[-1] == 0:
+        return np.full(values.shape, np.nan)
+
+    # Center each row on its first valid value
+    first = np.argmax(~np.isnan(values), axis=-1)[..., None]
+    reference = np.nan_to_num(np.take_along_axis(values, first, axis=-1))
+    centered = values - reference
+    mean = sma(centered, period)
+    mean_sq = sma(centered * centered, period)
+    return np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+
+
+def rsi(close: ArrayLike, period: int = 14) -> np.ndarray:
+    """
+    Relative Strength Index with Wilder smoothing.
+
+    Average gain/loss are seeded with the simple mean of the first
+    ``period`` price changes and then smoothed with ``alpha = 1 / period``.
+
+    Args:
+        close: Closing prices, 1-D or 2-D (time on the last axis)
+        period: RSI period
+
+    Returns:
+        RSI in [0, 100], NaN for the first ``period`` bars
+    """
+    close = to_array(close)
+    change = close - _shift(close)
+    gain = np.where(change > 0, change, 0.0)
+    loss = np.where(change < 0, -change, 0.0)
+    gain[np.isnan(change)] = np.nan
+    loss[np.isnan(change)] = np.nan
+
+    alpha = 1.0 / period
+    avg_gain = ewm_filter(gain, sma(gain, period), alpha)
+    avg_loss = ewm_filter(loss, sma(loss, period), alpha)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    # No losses in the window: 100, or neutral 50 for a completely flat window
+    result = np.where(avg_loss == 0, np.where(avg_gain == 0, 50.0, 100.0), result)
+    return result
+
+
+def macd(
+    close: ArrayLike,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9
+) -> Dict[str, np.ndarray]:
+    """
+    Moving Average Convergence Divergence.
+
+    Args:
+        close: Closing prices, 1-D or 2-D (time on the last axis)
+        fast_period: Fast EMA period
+        slow_period: Slow EMA period
+        signal_period: Signal line EMA period (over the MACD line)
+
+    Returns:
+        Dictionary with "macd", "signal" and "histogram" arrays
+    """
+    close = to_array(close)
+    macd_line = ema(close, fast_period) - ema(close, slow_period)
+    signal_line = ema(macd_line, signal_period)
+
+    return {
+        "macd": macd_line,
+        "signal": signal_line,
+        "histogram": macd_line - signal_line,
+    }
+
+
+def bollinger_bands(
+    close: ArrayLike,
+    period: int = 20,
+    num_std: float = 2.0
+) -> Dict[str, np.ndarray]:
+    """
+    Bollinger Bands (SMA +/- population standard deviation).
+
+    Args:
+        close: Closing prices, 1-D or 2-D (time on the last axis)
+        period: Moving average period
+        num_std: Band width in standard deviations
+
+    Returns:
+        Dictionary with "upper", "middle" and "lower" arrays
+    """
+    close = to_array(close)
+    middle = sma(close, period)
+    width = num_std * rolling_std(close, period)
+
+    return {
+        "upper": middle + width,
+        "middle": middle,
+        "lower": middle - width,
+    }
+
+
+def true_range(high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+    """
+    True range; the first bar is NaN since it has no previous close.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+
+    Returns:
+        True range array
+    """
+    high, low, close = to_array(high), to_array(low), to_array(close)
+    prev_close = _shift(close)
+    return np.maximum(high - low, np.maximum(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> np.ndarray:
+    """
+    Average True Range with Wilder smoothing.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        period: ATR period
+
+    Returns:
+        ATR array, NaN for the first ``period`` bars
+    """
+    tr = true_range(high, low, close)
+    return ewm_filter(tr, sma(tr, period), 1.0 / period)
+
+
+def stochastic(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    k_period: int = 14,
+    d_period: int = 3
+) -> Dict[str, np.ndarray]:
+    """
+    Stochastic oscillator (%K and its SMA %D).
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        k_period: Lookback for highest high / lowest low
+        d_period: SMA period of %D
+
+    Returns:
+        Dictionary with "k" and "d" arrays in [0, 100]
+    """
+    close = to_array(close)
+    highest = rolling_max(high, k_period)
+    lowest = rolling_min(low, k_period)
+    price_range = highest - lowest
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = 100.0 * (close - lowest) / price_range
+    # Flat windows have no range; report the midpoint instead of NaN
+    k = np.where(price_range == 0, 50.0, k)
+
+    return {
+        "k": k,
+        "d": sma(k, d_period),
+    }
+
+
+def obv(close: ArrayLike, volume: ArrayLike) -> np.ndarray:
+    """
+    On-Balance Volume, starting from the first bar's volume.
+
+    Args:
+        close: Closing prices
+        volume: Volumes
+
+    Returns:
+        OBV array
+    """
+    close, volume = to_array(close), to_array(volume)
+    direction = np.sign(close - _shift(close))
+    signed = direction * volume
+    signed[..., 0] = volume[..., 0]
+    return np.cumsum(signed, axis=-1)
+
+
+def vwap(
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    volume: ArrayLike,
+    sessions: Optional[ArrayLike] = None
+) -> np.ndarray:
+    """
+    Volume Weighted Average Price of the typical price (H + L + C) / 3.
+
+    Args:
+        high: High prices
+        low: Low prices
+        close: Closing prices
+        volume: Volumes
+        sessions: Optional 1-D session labels per bar (e.g. trading dates);
+            the running average resets whenever the label changes
+
+    Returns:
+        VWAP array, NaN while cumulative volume is zero
+    """
+    high, low, close, volume = to_array(high), to_array(low), to_array(close), to_array(volume)
+    typical = (high + low + close) / 3.0
+
+    pv = np.cumsum(typical * volume, axis=-1)
+    vol = np.cumsum(volume, axis=-1)
+
+    if sessions is not None:
+        labels = np.asarray(sessions)
+        boundary = np.ones(labels.shape[-1], dtype=bool)
+        boundary[1:] = labels[1:] != labels[:-1]
+        # Index of the first bar of the current session for every bar
+        start = np.maximum.accumulate(np.where(boundary, np.arange(labels.shape[-1]), 0))
+        pv = pv - _shift(pv, 0.0)[..., start]
+        vol = vol - _shift(vol, 0.0)[..., start]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vol > 0, pv / vol, np.nan)
@@ -6,7 +6,7 @@ from app.core.strategy.types import (
     StrategyStatus,
     Signal,
 )
-from app.core.strategy.base import BaseStrategy
+from app.core.strategy.base import BaseStrategy, ColumnarMarketData
 from app.core.strategy.momentum import MomentumStrategy
 
 __all__ = [
@@ -15,5 +15,6 @@ __all__ = [
     "StrategyStatus",
     "Signal",
     "BaseStrategy",
+    "ColumnarMarketData",
     "MomentumStrategy",
 ]
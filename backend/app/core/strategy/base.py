@@ -1,11 +1,20 @@
 """Base strategy class."""
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from app.core.strategy.types import StrategyType, StrategyStatus, Signal
 
+logger = logging.getLogger(__name__)
+
+# Columnar market data for one symbol: "timestamp", "open", "high", "low",
+# "close", "volume" -> chronological arrays of equal length
+ColumnarMarketData = Dict[str, np.ndarray]
+
 
 class BaseStrategy(ABC):
     """Abstract base class for all trading strategies."""
@@ -53,6 +62,49 @@ class BaseStrategy(ABC):
         """
         pass
 
+    async def generate_signals_batch(
+        self,
+        market_data_by_symbol: Dict[str, ColumnarMarketData]
+    ) -> Dict[str, List[Signal]]:
+        """
+        Generate trading signals for many symbols at once.
+
+        The default implementation converts each symbol's columns back to
+        row dicts and calls ``generate_signals`` per symbol, using the last
+        close as the current price. Strategies that can evaluate the whole
+        universe in one vectorized pass should override this.
+
+        Args:
+            market_data_by_symbol: Columnar historical market data per symbol
+
+        Returns:
+            Signals per successfully evaluated symbol (symbols that raise are
+            logged and omitted)
+        """
+        results: Dict[str, List[Signal]] = {}
+
+        for symbol, columns in market_data_by_symbol.items():
+            close = columns["close"]
+            if len(close) == 0:
+                continue
+
+            keys = list(columns.keys())
+            market_data = [
+                dict(zip(keys, values))
+                for values in zip(*(columns[key].tolist() for key in keys))
+            ]
+
+            try:
+                results[symbol] = await self.generate_signals(
+                    symbol=symbol,
+                    market_data=market_data,
+                    current_price=float(close[-1])
+                )
+            except Exception as e:
+                logger.error(f"[{self.name}] Error generating signals for {symbol}: {e}")
+
+        return results
+
     def validate_parameters(self) -> bool:
         """
         Validate strategy parameters.
@@ -1,12 +1,23 @@
 """Momentum strategy implementation."""
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from app.core.strategy.base import BaseStrategy
+import numpy as np
+
+from app.core.strategy.base import BaseStrategy, ColumnarMarketData
 from app.core.strategy.types import StrategyType, Signal, SignalType
-from app.core.indicators import calculate_sma, calculate_ema, detect_crossover
+from app.core.indicators import (
+    calculate_sma,
+    calculate_ema,
+    detect_crossover,
+    vectorized,
+    build_price_matrix,
+    compute_crossover_matrices,
+    CrossoverState,
+    IndicatorCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,8 @@ class MomentumStrategy(BaseStrategy):
         self,
         name: str,
         parameters: Dict[str, Any],
+        indicator_cache: Optional[IndicatorCache] = None,
+        interval: str = "1d",
         **kwargs
     ):
         """
@@ -38,6 +51,8 @@ class MomentumStrategy(BaseStrategy):
         Args:
             name: Strategy name
             parameters: Strategy parameters
+            indicator_cache: Optional shared cache for moving average series
+            interval: Bar interval of the market data (part of the cache key)
             **kwargs: Additional arguments for BaseStrategy
         """
         super().__init__(
@@ -47,9 +62,18 @@ class MomentumStrategy(BaseStrategy):
             **kwargs
         )
 
+        self.indicator_cache = indicator_cache
+        self.interval = interval
+
         # Validate parameters on initialization
         self.validate_parameters()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the process-local indicator cache when pickling (process pool)."""
+        state = self.__dict__.copy()
+        state["indicator_cache"] = None
+        return state
+
     def get_required_parameters(self) -> List[str]:
         """
         Get required parameter names.
@@ -77,6 +101,155 @@ class MomentumStrategy(BaseStrategy):
         slow_period = self.parameters.get("slow_period") or self.parameters.get("long_window", 20)
         return slow_period * 2
 
+    def create_crossover_state(self, prices: Optional[List[float]] = None) -> CrossoverState:
+        """
+        Create a streaming crossover state for live bar updates.
+
+        A live runner keeps one state per symbol and calls ``update()`` with
+        each new close instead of recomputing both MA series per tick.
+
+        Args:
+            prices: Optional historical closing prices to warm the state up with
+
+        Returns:
+            CrossoverState configured with this strategy's parameters
+        """
+        fast_period, slow_period, ma_type = self._get_ma_parameters()
+        return CrossoverState.from_history(prices or [], fast_period, slow_period, ma_type)
+
+    async def generate_signals_batch(
+        self,
+        market_data_by_symbol: Dict[str, ColumnarMarketData]
+    ) -> Dict[str, List[Signal]]:
+        """
+        Generate MA crossover signals for many symbols in one vectorized pass.
+
+        Closing prices are stacked into a symbols x time matrix, both moving
+        averages and the crossover classification are computed for the whole
+        matrix at once, and Signal objects are only built for symbols whose
+        last bar is a crossover. With an indicator cache, each symbol's
+        moving averages are read from (and stored in) the cache instead, so
+        repeated executions only compute the bars that are new.
+
+        Args:
+            market_data_by_symbol: Columnar historical market data per symbol
+
+        Returns:
+            Signals per evaluated symbol (symbols with insufficient data are omitted)
+        """
+        fast_period, slow_period, ma_type = self._get_ma_parameters()
+        if not fast_period or not slow_period:
+            raise ValueError("Missing required parameters: fast_period/short_window and slow_period/long_window")
+
+        closes_by_symbol = {
+            symbol: columns["close"]
+            for symbol, columns in market_data_by_symbol.items()
+            if len(columns["close"]) >= slow_period
+        }
+        skipped = len(market_data_by_symbol) - len(closes_by_symbol)
+        if skipped:
+            logger.warning(f"[{self.name}] Insufficient data (< {slow_period} bars) for {skipped} symbol(s)")
+
+        results: Dict[str, List[Signal]] = {symbol: [] for symbol in closes_by_symbol}
+        if not closes_by_symbol:
+            return results
+
+        symbols, closes = build_price_matrix(closes_by_symbol)
+        if self.indicator_cache is not None and all(
+            "timestamp" in market_data_by_symbol[symbol] for symbol in symbols
+        ):
+            fast = self._cached_ma_matrix(symbols, market_data_by_symbol, ma_type, fast_period, closes.shape[1])
+            slow = self._cached_ma_matrix(symbols, market_data_by_symbol, ma_type, slow_period, closes.shape[1])
+            matrices = {"fast": fast, "slow": slow, "crossover": vectorized.crossovers(fast, slow)}
+        else:
+            matrices = compute_crossover_matrices(closes, fast_period, slow_period, ma_type)
+
+        crossover = matrices["crossover"][:, -1]
+        fast_last = matrices["fast"][:, -1]
+        slow_last = matrices["slow"][:, -1]
+        current_prices = closes[:, -1]
+
+        # Same separation thresholds as _calculate_confidence
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diff_percent = np.abs(fast_last - slow_last) / slow_last * 100
+        confidence = np.select(
+            [diff_percent < 1, diff_percent < 2, diff_percent < 3],
+            [0.6, 0.7, 0.8],
+            default=0.9
+        )
+
+        now = datetime.now()
+        for row in np.flatnonzero(crossover).tolist():
+            symbol = symbols[row]
+            if crossover[row] > 0:
+                signal_type = SignalType.BUY
+                reason = f"Golden cross detected: {ma_type}{fast_period} crossed above {ma_type}{slow_period}"
+            else:
+                signal_type = SignalType.SELL
+                reason = f"Death cross detected: {ma_type}{fast_period} crossed below {ma_type}{slow_period}"
+
+            results[symbol] = [Signal(
+                timestamp=now,
+                symbol=symbol,
+                signal_type=signal_type,
+                price=float(current_prices[row]),
+                quantity=None,
+                reason=reason,
+                confidence=float(confidence[row])
+            )]
+
+        logger.info(
+            f"[{self.name}] Batch evaluated {len(symbols)} symbols, "
+            f"{int(np.count_nonzero(crossover))} crossover signal(s)"
+        )
+        return results
+
+    def _cached_ma_matrix(
+        self,
+        symbols: List[str],
+        market_data_by_symbol: Dict[str, ColumnarMarketData],
+        ma_type: str,
+        period: int,
+        length: int
+    ) -> np.ndarray:
+        """
+        Build a moving average matrix from per-symbol indicator cache entries.
+
+        Args:
+            symbols: Symbols in matrix row order
+            market_data_by_symbol: Columnar historical market data per symbol
+            ma_type: "SMA" or "EMA"
+            period: Moving average period
+            length: Number of bars (columns) of the close matrix
+
+        Returns:
+            Moving average matrix aligned like ``build_price_matrix(closes)``
+        """
+        series = {
+            symbol: self.indicator_cache.get(
+                symbol=symbol,
+                interval=self.interval,
+                indicator=ma_type.lower(),
+                params={"period": period},
+                timestamps=market_data_by_symbol[symbol]["timestamp"],
+                values=market_data_by_symbol[symbol]["close"]
+            )
+            for symbol in symbols
+        }
+        return build_price_matrix(series, length)[1]
+
+    def _get_ma_parameters(self) -> Tuple[Optional[int], Optional[int], str]:
+        """
+        Read MA parameters, supporting both naming conventions.
+
+        Returns:
+            Tuple of (fast_period, slow_period, ma_type)
+        """
+        fast_period = self.parameters.get("fast_period") or self.parameters.get("short_window")
+        slow_period = self.parameters.get("slow_period") or self.parameters.get("long_window")
+        ma_type = self.parameters.get("ma_type", "SMA").upper()
+        return fast_period, slow_period, ma_type
+
     async def generate_signals(
         self,
         symbol: str,
@@ -114,12 +287,8 @@ class MomentumStrategy(BaseStrategy):
             close_prices = [float(data["close"]) for data in market_data]
 
             # Calculate moving averages
-            if ma_type == "EMA":
-                fast_ma = calculate_ema(close_prices, fast_period)
-                slow_ma = calculate_ema(close_prices, slow_period)
-            else:  # SMA
-                fast_ma = calculate_sma(close_prices, fast_period)
-                slow_ma = calculate_sma(close_prices, slow_period)
+            fast_ma = self._calculate_ma(symbol, market_data, close_prices, ma_type, fast_period)
+            slow_ma = self._calculate_ma(symbol, market_data, close_prices, ma_type, slow_period)
 
             # Detect crossover
             crossover = detect_crossover(fast_ma, slow_ma)
@@ -167,6 +336,42 @@ class MomentumStrategy(BaseStrategy):
             logger.error(f"[{self.name}] Error generating signals: {e}")
             raise
 
+    def _calculate_ma(
+        self,
+        symbol: str,
+        market_data: List[Dict[str, Any]],
+        close_prices: List[float],
+        ma_type: str,
+        period: int
+    ) -> List[float]:
+        """
+        Calculate a moving average, through the indicator cache when available.
+
+        Args:
+            symbol: Stock symbol
+            market_data: Historical market data (timestamps are used as cache keys)
+            close_prices: Closing prices extracted from market_data
+            ma_type: "SMA" or "EMA"
+            period: Moving average period
+
+        Returns:
+            Moving average values (None for insufficient data points)
+        """
+        if self.indicator_cache is not None and "timestamp" in market_data[0]:
+            values = self.indicator_cache.get(
+                symbol=symbol,
+                interval=self.interval,
+                indicator=ma_type.lower(),
+                params={"period": period},
+                timestamps=[data["timestamp"] for data in market_data],
+                values=close_prices
+            )
+            return vectorized.to_list(values)
+
+        if ma_type == "EMA":
+            return calculate_ema(close_prices, period)
+        return calculate_sma(close_prices, period)
+
     def _calculate_confidence(
         self,
         fast_ma: List[float],
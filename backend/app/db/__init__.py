@@ -1,6 +1,6 @@
 """Database module."""
 
 from app.db.base import Base
-from app.db.session import get_db, engine, AsyncSessionLocal
+from app.db.session import get_db, get_session_factory, engine, AsyncSessionLocal
 
-__all__ = ["Base", "get_db", "engine", "AsyncSessionLocal"]
+__all__ = ["Base", "get_db", "get_session_factory", "engine", "AsyncSessionLocal"]
@@ -32,3 +32,8 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+
+def get_session_factory() -> async_sessionmaker:
+    """Dependency for tasks that need their own sessions (e.g. concurrent loads)."""
+    return AsyncSessionLocal
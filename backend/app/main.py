@@ -9,6 +9,9 @@ from app.api.v1 import auth, account, strategy, backtest, market, dashboard, sto
 from app.db.session import engine
 from app.db.base import Base
 from app.core.logging_config import setup_logging
+from app.services.kis_client import close_http_clients, kis_client_registry
+from app.services.quote_stream import quote_stream_hub
+from app.services.strategy_execution_service import shutdown_process_pool
 
 # Initialize logging
 setup_logging()
@@ -50,6 +53,10 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event handler."""
     logger.info(f"Shutting down {settings.APP_NAME}")
+    shutdown_process_pool()
+    await quote_stream_hub.close()
+    kis_client_registry.clear()
+    await close_http_clients()
 
 
 @app.get("/")
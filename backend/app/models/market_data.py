@@ -16,6 +16,8 @@ class TimeInterval(str, enum.Enum):
     THIRTY_MINUTES = "30m"
     ONE_HOUR = "1h"
     ONE_DAY = "1d"
+    ONE_WEEK = "1w"
+    ONE_MONTH = "1mo"
 
 
 class MarketData(Base):
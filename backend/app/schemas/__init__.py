@@ -45,6 +45,8 @@ from app.schemas.market_data import (
     MarketDataListResponse,
     PriceResponse,
     ChartDataResponse,
+    UniverseCollectRequest,
+    CollectionProgress,
 )
 from app.schemas.backtest import (
     BacktestConfig,
@@ -98,6 +100,8 @@ __all__ = [
     "MarketDataListResponse",
     "PriceResponse",
     "ChartDataResponse",
+    "UniverseCollectRequest",
+    "CollectionProgress",
     # Backtest
     "BacktestConfig",
     "BacktestRun",
@@ -1,6 +1,7 @@
 """MarketData Pydantic schemas for request/response validation."""
 
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 from app.models.market_data import TimeInterval
@@ -66,3 +67,36 @@ class ChartDataResponse(BaseModel):
     symbol: str
     interval: TimeInterval
     data: list[ChartDataPoint]
+
+
+class UniverseCollectRequest(BaseModel):
+    """Schema for a universe-wide daily collection request."""
+    symbols: Optional[list[str]] = Field(None, description="Explicit symbols (default: all stocks)")
+    market_type: Optional[str] = Field(None, description="Filter stocks by market: KOSPI or KOSDAQ")
+    period: str = Field("D", description="Period: D(일), W(주), M(월); stored as 1d, 1w or 1mo bars")
+    concurrency: Optional[int] = Field(None, ge=1, description="Concurrent KIS requests")
+    incremental: bool = Field(True, description="Only fetch bars after the latest stored one")
+    history_start: Optional[date] = Field(None, description="Backfill history back to this date")
+    job_id: Optional[str] = Field(None, description="Resume this job, skipping completed symbols")
+
+
+class CollectionProgress(BaseModel):
+    """Progress and throughput of a collection job (also its checkpoint)."""
+    job_id: str
+    status: str = "running"  # running, completed, completed_with_errors, failed
+    interval: TimeInterval = TimeInterval.ONE_DAY
+    period: str = "D"
+    incremental: bool = False
+    history_start: Optional[date] = None
+    total_symbols: int = 0
+    completed_symbols: list[str] = Field(default_factory=list)
+    failed_symbols: dict[str, str] = Field(default_factory=dict)
+    up_to_date_symbols: int = 0
+    rows_saved: int = 0
+    requests: int = 0
+    elapsed_seconds: float = 0.0
+    symbols_per_second: float = 0.0
+    rows_per_second: float = 0.0
+    rate_limit_wait_seconds: float = 0.0
+    started_at: datetime
+    updated_at: datetime
@@ -58,6 +58,11 @@ class StrategyExecuteRequest(BaseModel):
     """Schema for executing strategy on multiple symbols."""
     symbols: list[str] = Field(..., min_length=1, description="List of stock symbols to execute strategy on")
     source: Optional[str] = Field(None, description="Source of symbols (manual, watchlist, screening)")
+    concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Maximum concurrent market data queries (default: server setting)"
+    )
 
 
 # Schema for signal in execution response
@@ -0,0 +1,288 @@
+"""
+Live OHLCV bar aggregation from realtime ticks.
+
+Each tick updates the open bar of every interval at once. Bars of a symbol
+are rows of one small NumPy array, so a tick costs a fixed handful of
+vectorized operations however many bars are open. Closed bars are queued
+and upserted into ``market_data`` in batches.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.models.market_data import TimeInterval
+from app.schemas.market_data import MarketDataCreate
+from app.services.kis_realtime import RealtimeEvent, RealtimeTick
+from app.services.market_data_service import INTERVAL_SECONDS, MarketDataService
+from app.services.quote_cache import KRX_TIMEZONE
+
+logger = logging.getLogger(__name__)
+
+EPOCH = datetime(1970, 1, 1)
+
+# Columns of the per-symbol bar array (one row per interval). LAST_CLOSED is
+# the start of the latest closed bar, kept when the open bar is reset.
+START, OPEN, HIGH, LOW, CLOSE, VOLUME, PARTIAL, LAST_CLOSED = range(8)
+
+
+class BarAggregator:
+    """
+    Builds bars for several intervals from a tick stream.
+
+    A bar closes when a tick of a later bucket arrives or when
+    ``close_elapsed`` passes its end. The first bar of each interval after
+    startup only covers part of its bucket, so it is not written (collect
+    that bucket once from KIS instead of overwriting a complete bar).
+    The daily bar uses the session open/high/low/volume carried by KIS
+    ticks and is always complete. Ticks for a bucket that has already
+    closed are counted as late and dropped.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        intervals: Sequence[TimeInterval] = tuple(INTERVAL_SECONDS),
+        flush_rows: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ):
+        """
+        Initialize aggregator.
+
+        Args:
+            session_factory: Factory for the sessions used to write bars
+            intervals: Intervals to build (default: all fixed-length intervals)
+            flush_rows: Closed bars that trigger a write (default: AGGREGATOR_FLUSH_ROWS)
+            flush_interval: Seconds between background flushes (default: AGGREGATOR_FLUSH_INTERVAL)
+        """
+        self.session_factory = session_factory
+        self.intervals = list(intervals)
+        self.flush_rows = flush_rows or settings.AGGREGATOR_FLUSH_ROWS
+        self.flush_interval = flush_interval or settings.AGGREGATOR_FLUSH_INTERVAL
+
+        self._widths = np.array([INTERVAL_SECONDS[interval] for interval in self.intervals], dtype=np.float64)
+        self._daily = self.intervals.index(TimeInterval.ONE_DAY) if TimeInterval.ONE_DAY in self.intervals else None
+        self._bars: Dict[str, np.ndarray] = {}
+
+        self._pending: List[MarketDataCreate] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+        self.ticks = 0
+        self.late_ticks = 0
+        self.bars_closed = 0
+        self.bars_written = 0
+
+    def add_tick(
+        self,
+        symbol: str,
+        timestamp: datetime,
+        price: float,
+        volume: float = 0.0,
+        session: Optional[Tuple[float, float, float, float]] = None
+    ) -> None:
+        """
+        Apply one trade to the open bars of a symbol.
+
+        Args:
+            symbol: Stock symbol
+            timestamp: Trade time
+            price: Trade price
+            volume: Traded quantity
+            session: Day (open, high, low, accumulated volume), used for the daily bar
+        """
+        self.ticks += 1
+        seconds = (timestamp - EPOCH).total_seconds()
+        starts = seconds - seconds % self._widths
+
+        bars = self._bars.get(symbol)
+        if bars is None:
+            bars = np.full((len(self.intervals), 8), np.nan)
+            bars[:, PARTIAL] = 1.0
+            self._bars[symbol] = bars
+
+        current = bars[:, START]
+        late = (starts < current) | (starts <= bars[:, LAST_CLOSED])
+        if late.any():
+            self.late_ticks += 1
+
+        rolled = starts > current
+        for row in np.flatnonzero(rolled):
+            self._close(symbol, int(row), bars[row])
+
+        opened = (rolled | np.isnan(current)) & ~late
+        if opened.any():
+            bars[opened, START] = starts[opened]
+            bars[opened, OPEN:CLOSE + 1] = price
+            bars[opened, VOLUME] = 0.0
+            # Only the first bar seen for a symbol can have missed trades
+            bars[opened, PARTIAL] = np.where(rolled[opened], 0.0, bars[opened, PARTIAL])
+
+        active = ~late
+        bars[active, HIGH] = np.maximum(bars[active, HIGH], price)
+        bars[active, LOW] = np.minimum(bars[active, LOW], price)
+        bars[active, CLOSE] = price
+        bars[active, VOLUME] += volume
+
+        if session is not None and self._daily is not None and active[self._daily]:
+            bars[self._daily, OPEN:LOW + 1] = session[:3]
+            bars[self._daily, VOLUME] = session[3]
+            bars[self._daily, PARTIAL] = 0.0
+
+        if len(self._pending) >= self.flush_rows:
+            self._schedule_flush()
+
+    def handle_event(self, event: RealtimeEvent) -> None:
+        """
+        KISRealtimeClient handler: aggregate execution ticks, ignore order books.
+
+        Args:
+            event: Parsed realtime event
+        """
+        if isinstance(event, RealtimeTick):
+            self.add_tick(
+                event.symbol,
+                event.timestamp,
+                event.price,
+                event.volume,
+                session=(event.open, event.high, event.low, event.accumulated_volume)
+            )
+
+    def _close(self, symbol: str, row: int, bar: np.ndarray) -> None:
+        """Queue a finished bar for writing (complete bars only)."""
+        self.bars_closed += 1
+        bar[LAST_CLOSED] = bar[START]
+        if bar[PARTIAL]:
+            return
+
+        self._pending.append(MarketDataCreate(
+            symbol=symbol,
+            timestamp=EPOCH + timedelta(seconds=float(bar[START])),
+            open=float(bar[OPEN]),
+            high=float(bar[HIGH]),
+            low=float(bar[LOW]),
+            close=float(bar[CLOSE]),
+            volume=float(bar[VOLUME]),
+            interval=self.intervals[row]
+        ))
+
+    def close_elapsed(self, now: Optional[datetime] = None) -> int:
+        """
+        Close bars whose bucket has ended, even without a newer tick.
+
+        Args:
+            now: Current KST time, naive like tick timestamps (default: now in Asia/Seoul)
+
+        Returns:
+            Number of bars closed
+        """
+        if now is None:
+            now = datetime.now(KRX_TIMEZONE).replace(tzinfo=None)
+        seconds = (now - EPOCH).total_seconds()
+        closed = 0
+        for symbol, bars in self._bars.items():
+            ended = bars[:, START] + self._widths <= seconds
+            for row in np.flatnonzero(ended):
+                self._close(symbol, int(row), bars[row])
+                bars[row, :PARTIAL] = np.nan
+                bars[row, PARTIAL] = 0.0
+                closed += 1
+        return closed
+
+    def current_bars(self, symbol: str) -> Dict[TimeInterval, Dict[str, float]]:
+        """
+        Get the open (in-progress) bars of a symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            OHLCV of each interval with an open bar
+        """
+        bars = self._bars.get(symbol)
+        if bars is None:
+            return {}
+
+        return {
+            interval: {
+                "timestamp": EPOCH + timedelta(seconds=float(bar[START])),
+                "open": float(bar[OPEN]),
+                "high": float(bar[HIGH]),
+                "low": float(bar[LOW]),
+                "close": float(bar[CLOSE]),
+                "volume": float(bar[VOLUME]),
+            }
+            for interval, bar in zip(self.intervals, bars)
+            if not np.isnan(bar[START])
+        }
+
+    def _schedule_flush(self) -> None:
+        """Start a background flush unless one is running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> int:
+        """
+        Write queued closed bars with one bulk upsert.
+
+        Returns:
+            Number of bars written
+        """
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, []
+        try:
+            async with self.session_factory() as session:
+                await MarketDataService.upsert_market_data(session, batch, returning=False)
+        except BaseException as e:
+            # Keep the bars for the next flush
+            self._pending = batch + self._pending
+            if not isinstance(e, Exception):
+                raise
+            logger.error(f"[BarAggregator] Failed to write {len(batch)} bars: {e}")
+            return 0
+
+        self.bars_written += len(batch)
+        logger.debug(f"[BarAggregator] Wrote {len(batch)} bars")
+        return len(batch)
+
+    def start(self) -> None:
+        """Close elapsed bars and flush in the background every ``flush_interval``."""
+        if self._loop_task is None or self._loop_task.done():
+            self._loop_task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Background close-and-flush loop."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.close_elapsed()
+            await self.flush()
+
+    async def stop(self) -> None:
+        """Stop the background loop and write everything that has closed."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+        if self._flush_task is not None:
+            await self._flush_task
+        self._loop_task = self._flush_task = None
+
+        self.close_elapsed()
+        await self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Return tick and bar counters."""
+        return {
+            "symbols": len(self._bars),
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "bars_closed": self.bars_closed,
+            "bars_written": self.bars_written,
+            "pending": len(self._pending),
+        }
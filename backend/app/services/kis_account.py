@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
 
-from app.services.kis_client import KISClient
+from app.services.kis_client import KISClient, RequestPriority
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +62,7 @@ class KISAccount:
         logger.info(f"  - URL: {url}")
         logger.info(f"  - TR ID: {tr_id}")
 
-        result = await self.client.get(url, headers, params)
+        result = await self.client.get(url, headers, params, priority=RequestPriority.ACCOUNT)
 
         # Log response structure for debugging
         logger.info(f"[KIS Account] Response structure:")
@@ -135,4 +135,4 @@ class KISAccount:
         logger.info(f"  - Start Date: {start_date}")
         logger.info(f"  - End Date: {end_date}")
 
-        return await self.client.get(url, headers, params)
+        return await self.client.get(url, headers, params, priority=RequestPriority.ACCOUNT)
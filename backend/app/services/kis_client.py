@@ -1,12 +1,15 @@
 """Korea Investment & Securities API Base Client."""
 
+import asyncio
 import httpx
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
+from datetime import datetime, timedelta
+from enum import IntEnum
+from typing import Dict, Any, Optional, Tuple
 
 from app.config import settings
 from app.services.kis_token_manager import KISTokenManager, KISToken
+from app.utils.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,123 @@ logger = logging.getLogger(__name__)
 KIS_MOCK_URL = "https://openapivts.koreainvestment.com:29443"  # 모의투자
 KIS_REAL_URL = "https://openapi.koreainvestment.com:9443"  # 실전투자
 
+# Long-lived connection pools shared by all KISClient instances, per base URL
+_http_clients: Dict[str, httpx.AsyncClient] = {}
+
+# Request budgets shared by all KISClient instances, per (app_key, trading_mode)
+_rate_limiters: Dict[Tuple[str, str], TokenBucket] = {}
+
+# Token issuance locks shared by all KISClient instances, per (app_key, trading_mode)
+_token_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+# Delay before retrying a failed background token refresh
+TOKEN_REFRESH_RETRY_SECONDS = 60
+
+
+class RequestPriority(IntEnum):
+    """Rate limiter lanes for KIS requests (lower values are served first)."""
+    ORDER = 0
+    ACCOUNT = 1
+    QUOTE = 2
+    BULK = 3
+
+
+def get_rate_limiter(app_key: str, trading_mode: str) -> TokenBucket:
+    """
+    Get the shared request budget for an app key.
+
+    KIS enforces its per-second call limit per app key, so every client
+    using the same key draws from one bucket. Mock accounts get the lower
+    KIS_MOCK_REQUESTS_PER_SECOND budget. The bucket only covers this
+    process, so the budget is divided by KIS_RATE_LIMIT_PROCESSES to keep
+    several worker processes on one key within the KIS limit together.
+
+    Args:
+        app_key: KIS API app key
+        trading_mode: Trading mode ("MOCK" or "REAL")
+
+    Returns:
+        Shared TokenBucket
+    """
+    mode = str(getattr(trading_mode, "value", trading_mode)).upper()
+    limiter = _rate_limiters.get((app_key, mode))
+    if limiter is None:
+        rate = (
+            settings.KIS_REAL_REQUESTS_PER_SECOND if mode == "REAL"
+            else settings.KIS_MOCK_REQUESTS_PER_SECOND
+        )
+        # Capacity 1: a full bucket on top of a second of refill would let
+        # about twice the budget through in one second
+        limiter = TokenBucket(rate=rate / max(1, settings.KIS_RATE_LIMIT_PROCESSES), capacity=1)
+        _rate_limiters[(app_key, mode)] = limiter
+    return limiter
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package (httpx[http2]) is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _create_http_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP client for a KIS base URL.
+
+    Args:
+        base_url: KIS API base URL
+
+    Returns:
+        httpx.AsyncClient with keep-alive connection pooling
+    """
+    http2 = settings.KIS_HTTP2
+    if http2 and not _http2_available():
+        logger.warning("[KISClient] KIS_HTTP2 is enabled but h2 is not installed, using HTTP/1.1")
+        http2 = False
+
+    logger.info(f"[KISClient] Creating connection pool for {base_url} (http2={http2})")
+    return httpx.AsyncClient(
+        timeout=settings.KIS_HTTP_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=settings.KIS_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.KIS_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.KIS_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=http2,
+    )
+
+
+def get_http_client(base_url: str) -> httpx.AsyncClient:
+    """
+    Get the shared pooled HTTP client for a KIS base URL.
+
+    Reusing one client keeps TCP/TLS connections alive between calls
+    instead of handshaking with the KIS server on every request.
+
+    Args:
+        base_url: KIS API base URL
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    client = _http_clients.get(base_url)
+    if client is None or client.is_closed:
+        client = _create_http_client(base_url)
+        _http_clients[base_url] = client
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close all shared KIS HTTP clients (application shutdown)."""
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
+    if clients:
+        logger.info(f"[KISClient] Closed {len(clients)} connection pool(s)")
+
 
 class KISClient:
     """
@@ -23,6 +143,8 @@ class KISClient:
     - Authentication and token management
     - Common request headers
     - Base URL configuration
+    - Connection reuse through a pooled HTTP client shared per base URL
+    - Per-app-key rate limiting with priority lanes (orders before quotes)
 
     Specific API operations are implemented in separate modules:
     - kis_quotation.py: Market data and price queries
@@ -64,44 +186,104 @@ class KISClient:
         else:
             self.base_url = KIS_MOCK_URL
 
+        # Per-app-key request budget shared with other clients using the same key
+        self.rate_limiter = get_rate_limiter(app_key, trading_mode)
+
         # Initialize token manager for persistent token storage
         self._token_manager = KISTokenManager(app_key=app_key, trading_mode=trading_mode.lower())
         self._access_token: Optional[KISToken] = None
 
+        # Single-flight token issuance per app key, plus proactive refresh
+        mode = str(getattr(trading_mode, "value", trading_mode)).upper()
+        self._token_lock = _token_locks.setdefault((app_key, mode), asyncio.Lock())
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # WebSocket approval key (issued on first realtime connection)
+        self._approval_key: Optional[str] = None
+
         logger.info(f"[KISClient] Initialized")
         logger.info(f"  - Trading Mode: {trading_mode}")
         logger.info(f"  - Base URL: {self.base_url}")
         logger.info(f"  - Account: {account_number}")
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client for this client's base URL."""
+        return get_http_client(self.base_url)
+
     async def _ensure_token(self) -> None:
         """
         Ensure we have a valid access token.
 
         Flow:
         1. Check if in-memory token exists and is valid
-        2. If not, try to load from file
-        3. If file token is invalid/missing, request new token from API
-        4. Save new token to file
+        2. If not, wait for the app key's token lock (single flight: one
+           coroutine issues a token while concurrent callers wait for it)
+        3. Re-check the in-memory token, then the shared token store
+        4. If none is valid, request a new token under the token file lock
+           (other processes wait and reuse it) and save it
+        5. Schedule a background refresh before the token expires
         """
         # Check in-memory token first
         if self._access_token and not self._access_token.is_expired():
             logger.debug(f"[KISClient] Using in-memory token")
             return
 
-        # Try to load from file
-        logger.info(f"[KISClient] Checking for cached token...")
-        self._access_token = self._token_manager.load_token()
+        async with self._token_lock:
+            # Another coroutine may have refreshed the token while we waited
+            if self._access_token and not self._access_token.is_expired():
+                return
 
-        if self._access_token:
-            logger.info(f"[KISClient] Using cached token from file")
+            # Try the shared token store (in-memory mirror, then file)
+            logger.info(f"[KISClient] Checking for cached token...")
+            self._access_token = self._token_manager.load_token()
+
+            if self._access_token:
+                logger.info(f"[KISClient] Using cached token")
+            else:
+                # Request new token from API, unless another process does so first
+                logger.info(f"[KISClient] No valid cached token, requesting new token...")
+                self._access_token = await self._token_manager.get_or_issue(self._request_new_token)
+
+            self._schedule_token_refresh()
+
+    def _schedule_token_refresh(self) -> None:
+        """Start the background task that renews the token before it expires."""
+        if not settings.KIS_TOKEN_PROACTIVE_REFRESH:
             return
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_token_loop())
 
-        # Request new token from API
-        logger.info(f"[KISClient] No valid cached token, requesting new token...")
-        self._access_token = await self._request_new_token()
+    async def _refresh_token_loop(self) -> None:
+        """
+        Renew the access token ahead of expiry so requests never wait for issuance.
 
-        # Save to file for future use
-        self._token_manager.save_token(self._access_token)
+        Refreshes KIS_TOKEN_REFRESH_MARGIN seconds before expiry, which is
+        earlier than the 5 minute buffer at which ``is_expired`` starts
+        forcing an inline refresh.
+        """
+        while True:
+            # Never renew earlier than halfway through a token's lifetime
+            margin = min(settings.KIS_TOKEN_REFRESH_MARGIN, self._access_token.expires_in / 2)
+            refresh_at = self._access_token.get_expiry_datetime() - timedelta(seconds=margin)
+            await asyncio.sleep(max((refresh_at - datetime.now()).total_seconds(), 0))
+
+            try:
+                async with self._token_lock:
+                    # Adopts a newer token if another client or process already renewed it
+                    logger.info(f"[KISClient] Refreshing access token ahead of expiry")
+                    self._access_token = await self._token_manager.get_or_issue(
+                        self._request_new_token, newer_than=self._access_token
+                    )
+            except Exception as e:
+                logger.error(f"[KISClient] Background token refresh failed: {e}")
+                await asyncio.sleep(TOKEN_REFRESH_RETRY_SECONDS)
+
+    def close(self) -> None:
+        """Stop the background token refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
 
     def _get_headers(self, tr_id: str) -> Dict[str, str]:
         """
@@ -145,32 +327,31 @@ class KISClient:
         logger.info(f"  - App Secret (first 10 chars): {self.app_secret[:10]}...")
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload)
+            response = await self.http_client.post(url, json=payload)
 
-                logger.info(f"[KIS API] Response Status: {response.status_code}")
+            logger.info(f"[KIS API] Response Status: {response.status_code}")
 
-                # Log detailed error information
-                if response.status_code != 200:
-                    logger.error(f"[KIS API] Error Response:")
-                    logger.error(f"  - Status: {response.status_code}")
-                    logger.error(f"  - Body: {response.text}")
-                    logger.error(f"  - Headers: {dict(response.headers)}")
+            # Log detailed error information
+            if response.status_code != 200:
+                logger.error(f"[KIS API] Error Response:")
+                logger.error(f"  - Status: {response.status_code}")
+                logger.error(f"  - Body: {response.text}")
+                logger.error(f"  - Headers: {dict(response.headers)}")
 
-                response.raise_for_status()
-                data = response.json()
+            response.raise_for_status()
+            data = response.json()
 
-                logger.info(f"[KIS API] Token Response:")
-                logger.info(f"  - Access Token (first 20 chars): {data.get('access_token', '')[:20]}...")
-                logger.info(f"  - Expires In: {data.get('expires_in')} seconds")
-                logger.info(f"  - Token Type: {data.get('token_type')}")
+            logger.info(f"[KIS API] Token Response:")
+            logger.info(f"  - Access Token (first 20 chars): {data.get('access_token', '')[:20]}...")
+            logger.info(f"  - Expires In: {data.get('expires_in')} seconds")
+            logger.info(f"  - Token Type: {data.get('token_type')}")
 
-                return KISToken(
-                    access_token=data["access_token"],
-                    token_type=data["token_type"],
-                    expires_in=data["expires_in"],
-                    issued_at=datetime.now(),
-                )
+            return KISToken(
+                access_token=data["access_token"],
+                token_type=data["token_type"],
+                expires_in=data["expires_in"],
+                issued_at=datetime.now(),
+            )
 
         except httpx.HTTPStatusError as e:
             logger.error(f"[KIS API] HTTP Error: {e}")
@@ -180,36 +361,167 @@ class KISClient:
             logger.error(f"[KIS API] Unexpected error: {e}")
             raise
 
-    async def get(self, url: str, headers: Dict[str, str], params: Dict[str, Any]) -> Dict[str, Any]:
+    async def get_approval_key(self, refresh: bool = False) -> str:
+        """
+        Get the approval key for the KIS realtime WebSocket.
+
+        Args:
+            refresh: Issue a new key even if one is cached
+
+        Returns:
+            Approval key
+
+        Raises:
+            httpx.HTTPStatusError: If API returns error status
+        """
+        if self._approval_key is None or refresh:
+            url = f"{self.base_url}/oauth2/Approval"
+            payload = {
+                "grant_type": "client_credentials",
+                "appkey": self.app_key,
+                "secretkey": self.app_secret,
+            }
+
+            logger.info(f"[KIS API] Requesting WebSocket approval key")
+            response = await self.http_client.post(url, json=payload)
+            response.raise_for_status()
+            self._approval_key = response.json()["approval_key"]
+
+        return self._approval_key
+
+    async def get(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        priority: RequestPriority = RequestPriority.QUOTE
+    ) -> Dict[str, Any]:
         """
         Make authenticated GET request to KIS API.
 
+        Waits for a token from the app key's rate limiter first.
+
         Args:
             url: Full API endpoint URL
             headers: Request headers (from _get_headers)
             params: Query parameters
+            priority: Rate limiter lane (default: QUOTE)
 
         Returns:
             API response as dictionary
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            return response.json()
+        await self.rate_limiter.acquire(priority=priority)
+        response = await self.http_client.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return response.json()
 
-    async def post(self, url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def post(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        priority: RequestPriority = RequestPriority.ORDER
+    ) -> Dict[str, Any]:
         """
         Make authenticated POST request to KIS API.
 
+        Waits for a token from the app key's rate limiter first.
+
         Args:
             url: Full API endpoint URL
             headers: Request headers (from _get_headers)
             payload: Request body
+            priority: Rate limiter lane (default: ORDER)
 
         Returns:
             API response as dictionary
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
-            return response.json()
+        await self.rate_limiter.acquire(priority=priority)
+        response = await self.http_client.post(url, headers=headers, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+
+class KISClientRegistry:
+    """
+    Process-wide cache of KISClient instances keyed by (app_key, trading_mode).
+
+    Reusing clients across requests keeps their in-memory access token, so
+    requests skip the token file lookup and constructor logging. Entries are
+    replaced when the secret or account for a key changes and should be
+    invalidated when a user updates or deletes credentials.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._clients: Dict[Tuple[str, str], KISClient] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def _key(app_key: str, trading_mode: str) -> Tuple[str, str]:
+        """Registry key for an app key and trading mode (enum or string)."""
+        return app_key, str(getattr(trading_mode, "value", trading_mode)).upper()
+
+    def get_client(
+        self,
+        app_key: str,
+        app_secret: str,
+        account_number: str,
+        account_code: str,
+        trading_mode: str = "MOCK"
+    ) -> KISClient:
+        """
+        Get the shared client for a set of credentials, creating it if needed.
+
+        Args:
+            app_key: KIS API app key
+            app_secret: KIS API app secret
+            account_number: Trading account number
+            account_code: Trading account code
+            trading_mode: Trading mode ("MOCK" or "REAL")
+
+        Returns:
+            KISClient instance
+        """
+        key = self._key(app_key, trading_mode)
+        client = self._clients.get(key)
+        if client is None or (
+            (client.app_secret, client.account_number, client.account_code)
+            != (app_secret, account_number, account_code)
+        ):
+            if client is not None:
+                client.close()
+            client = KISClient(
+                app_key=app_key,
+                app_secret=app_secret,
+                account_number=account_number,
+                account_code=account_code,
+                trading_mode=key[1]
+            )
+            self._clients[key] = client
+        return client
+
+    def invalidate(self, app_key: Optional[str], trading_mode: str) -> None:
+        """
+        Drop the client for an app key and trading mode.
+
+        Args:
+            app_key: KIS API app key (None is ignored)
+            trading_mode: Trading mode ("MOCK" or "REAL")
+        """
+        client = self._clients.pop(self._key(app_key, trading_mode), None) if app_key else None
+        if client is not None:
+            client.close()
+            logger.info(f"[KISClientRegistry] Invalidated {self._key(app_key, trading_mode)[1]} client")
+
+    def clear(self) -> None:
+        """Drop all clients and stop their background token refresh."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+
+# Process-wide registry shared by all API requests
+kis_client_registry = KISClientRegistry()
@@ -1,13 +1,23 @@
 """KIS API - Market Data & Quotation Services."""
 
 import logging
-from typing import Dict, Any
+from datetime import date, datetime
+from typing import Dict, Any, Optional, Union
 
-from app.services.kis_client import KISClient
+from app.services.kis_client import KISClient, RequestPriority
 
 logger = logging.getLogger(__name__)
 
 
+def _format_date(value: Optional[Union[date, str]]) -> str:
+    """Format a date as the YYYYMMDD string KIS expects (empty for None)."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    return value.strftime("%Y%m%d")
+
+
 class KISQuotation:
     """
     KIS API client for market data and quotation services.
@@ -52,15 +62,24 @@ class KISQuotation:
         self,
         symbol: str,
         period: str = "D",
-        adjusted_price: bool = True
+        adjusted_price: bool = True,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None,
+        priority: RequestPriority = RequestPriority.QUOTE
     ) -> Dict[str, Any]:
         """
         Get daily (or period-based) chart data for a stock.
 
+        Without dates KIS returns the most recent 100 bars. With a range it
+        returns at most 100 bars of that range, newest first.
+
         Args:
             symbol: Stock symbol (e.g., "005930" for Samsung Electronics)
             period: Period code - D(일), W(주), M(월)
             adjusted_price: Whether to use adjusted prices (수정주가)
+            start_date: First date of the range (date or YYYYMMDD)
+            end_date: Last date of the range (default: today when start_date is given)
+            priority: Rate limiter lane (BULK for background collection)
 
         Returns:
             Dictionary containing chart data with OHLCV information
@@ -95,11 +114,14 @@ class KISQuotation:
         url = f"{self.client.base_url}/uapi/domestic-stock/v1/quotations/inquire-daily-itemchartprice"
         headers = self.client._get_headers("FHKST03010100")
 
+        if start_date is not None and end_date is None:
+            end_date = datetime.now().date()
+
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",  # 시장 분류 코드 (J: 주식)
             "FID_INPUT_ISCD": symbol,  # 종목코드
-            "FID_INPUT_DATE_1": "",  # 조회 시작일자 (공백: 당일부터 100개)
-            "FID_INPUT_DATE_2": "",  # 조회 종료일자
+            "FID_INPUT_DATE_1": _format_date(start_date),  # 조회 시작일자 (공백: 당일부터 100개)
+            "FID_INPUT_DATE_2": _format_date(end_date),  # 조회 종료일자
             "FID_PERIOD_DIV_CODE": period,  # 기간분류코드 (D/W/M)
             "FID_ORG_ADJ_PRC": "0" if adjusted_price else "1",  # 수정주가 원주가 가격
         }
@@ -108,8 +130,10 @@ class KISQuotation:
         logger.info(f"  - URL: {url}")
         logger.info(f"  - Symbol: {symbol}")
         logger.info(f"  - Period: {period}")
+        if start_date is not None:
+            logger.info(f"  - Range: {params['FID_INPUT_DATE_1']} ~ {params['FID_INPUT_DATE_2']}")
 
-        result = await self.client.get(url, headers, params)
+        result = await self.client.get(url, headers, params, priority=priority)
 
         # Log response structure
         if 'rt_cd' in result:
@@ -0,0 +1,368 @@
+"""
+Korea Investment & Securities realtime WebSocket feed.
+
+KIS pushes execution prices (체결가) and order-book updates (호가) as
+pipe-delimited frames::
+
+    0|H0STCNT0|001|005930^093354^71900^5^-100^-0.14^...
+
+The fields are: encryption flag, TR ID, record count and ``^``-separated
+record values (``count`` records back to back). Control messages such as
+subscription acknowledgements and PINGPONG heartbeats are JSON.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+import aiohttp
+from pydantic import BaseModel
+
+from app.config import settings
+from app.schemas.market_data import PriceResponse
+from app.services.kis_client import KISClient
+
+logger = logging.getLogger(__name__)
+
+# KIS WebSocket URLs
+KIS_REAL_WS_URL = "ws://ops.koreainvestment.com:21000"  # 실전투자
+KIS_MOCK_WS_URL = "ws://ops.koreainvestment.com:31000"  # 모의투자
+
+# TR IDs
+TR_ID_EXECUTION = "H0STCNT0"  # 국내주식 실시간체결가
+TR_ID_ORDER_BOOK = "H0STASP0"  # 국내주식 실시간호가
+
+# KIS accepts at most 41 registrations per WebSocket session
+MAX_SUBSCRIPTIONS = 41
+
+RECONNECT_MIN_DELAY = 1.0
+
+ORDER_BOOK_DEPTH = 10
+
+
+class RealtimeTick(BaseModel):
+    """Realtime execution (H0STCNT0)."""
+    symbol: str
+    timestamp: datetime
+    price: float
+    change: float
+    change_percent: float
+    open: float
+    high: float
+    low: float
+    volume: float  # Volume of this execution
+    accumulated_volume: float
+
+    def to_price_response(self) -> PriceResponse:
+        """Convert to the PriceResponse served by /market/price and /market/stream."""
+        return PriceResponse(
+            symbol=self.symbol,
+            price=self.price,
+            change=self.change,
+            change_percent=self.change_percent,
+            volume=self.accumulated_volume,
+            timestamp=self.timestamp
+        )
+
+
+class RealtimeOrderBook(BaseModel):
+    """Realtime order book (H0STASP0), best price first."""
+    symbol: str
+    timestamp: datetime
+    ask_prices: List[float]
+    bid_prices: List[float]
+    ask_volumes: List[float]
+    bid_volumes: List[float]
+    total_ask_volume: float
+    total_bid_volume: float
+
+
+RealtimeEvent = Union[RealtimeTick, RealtimeOrderBook]
+
+
+def _parse_timestamp(trade_date: Optional[str], trade_time: str) -> datetime:
+    """Combine YYYYMMDD (default: today) and HHMMSS fields."""
+    day = datetime.strptime(trade_date, "%Y%m%d").date() if trade_date else date.today()
+    return datetime.combine(day, datetime.strptime(trade_time, "%H%M%S").time())
+
+
+def _parse_execution(values: List[str]) -> RealtimeTick:
+    """Parse one H0STCNT0 record."""
+    # 0 종목코드, 1 체결시간, 2 현재가, 4 전일대비, 5 전일대비율, 7 시가, 8 고가, 9 저가,
+    # 12 체결거래량, 13 누적거래량, 33 영업일자
+    if len(values) < 14:
+        raise ValueError(f"H0STCNT0 record has {len(values)} fields, expected at least 14")
+
+    return RealtimeTick(
+        symbol=values[0],
+        timestamp=_parse_timestamp(values[33] if len(values) > 33 else None, values[1]),
+        price=float(values[2]),
+        change=float(values[4]),
+        change_percent=float(values[5]),
+        open=float(values[7]),
+        high=float(values[8]),
+        low=float(values[9]),
+        volume=float(values[12]),
+        accumulated_volume=float(values[13])
+    )
+
+
+def _parse_order_book(values: List[str]) -> RealtimeOrderBook:
+    """Parse one H0STASP0 record."""
+    # 0 종목코드, 1 영업시간, 3-12 매도호가1-10, 13-22 매수호가1-10,
+    # 23-32 매도호가잔량1-10, 33-42 매수호가잔량1-10, 43 총매도호가잔량, 44 총매수호가잔량
+    if len(values) < 45:
+        raise ValueError(f"H0STASP0 record has {len(values)} fields, expected at least 45")
+
+    def levels(start: int) -> List[float]:
+        return [float(value) for value in values[start:start + ORDER_BOOK_DEPTH]]
+
+    return RealtimeOrderBook(
+        symbol=values[0],
+        timestamp=_parse_timestamp(None, values[1]),
+        ask_prices=levels(3),
+        bid_prices=levels(13),
+        ask_volumes=levels(23),
+        bid_volumes=levels(33),
+        total_ask_volume=float(values[43]),
+        total_bid_volume=float(values[44])
+    )
+
+
+FRAME_PARSERS: Dict[str, Callable[[List[str]], RealtimeEvent]] = {
+    TR_ID_EXECUTION: _parse_execution,
+    TR_ID_ORDER_BOOK: _parse_order_book,
+}
+
+
+def parse_frame(frame: str) -> List[RealtimeEvent]:
+    """
+    Parse a pipe-delimited KIS realtime data frame.
+
+    Args:
+        frame: Raw frame (``encrypted|tr_id|count|values``)
+
+    Returns:
+        One event per record in the frame
+
+    Raises:
+        ValueError: If the frame is malformed, encrypted or of an unsupported TR ID
+    """
+    parts = frame.split("|", 3)
+    if len(parts) != 4:
+        raise ValueError(f"Malformed frame: {frame[:50]}")
+
+    encrypted, tr_id, count, payload = parts
+    if encrypted != "0":
+        raise ValueError(f"Encrypted frames are not supported ({tr_id})")
+
+    parser = FRAME_PARSERS.get(tr_id)
+    if parser is None:
+        raise ValueError(f"Unsupported TR ID: {tr_id}")
+
+    records = int(count)
+    values = payload.split("^")
+    if records < 1 or len(values) % records:
+        raise ValueError(f"{len(values)} values do not split into {records} records")
+
+    size = len(values) // records
+    return [parser(values[i * size:(i + 1) * size]) for i in range(records)]
+
+
+class KISRealtimeClient:
+    """
+    Auto-reconnecting client for the KIS realtime WebSocket.
+
+    Subscriptions are kept across reconnects and re-registered on every
+    new session. Parsed events are passed to the registered handlers as
+    soon as their frame arrives.
+    """
+
+    def __init__(self, kis_client: KISClient, url: Optional[str] = None):
+        """
+        Initialize realtime client.
+
+        Args:
+            kis_client: KIS client providing the app key and approval key
+            url: WebSocket URL (default: KIS_REALTIME_URL or the trading mode's URL)
+        """
+        self.kis_client = kis_client
+        if url:
+            self.url = url
+        elif settings.KIS_REALTIME_URL:
+            self.url = settings.KIS_REALTIME_URL
+        elif kis_client.trading_mode == "REAL":
+            self.url = KIS_REAL_WS_URL
+        else:
+            self.url = KIS_MOCK_WS_URL
+
+        self.subscriptions: Set[Tuple[str, str]] = set()
+        self._handlers: List[Callable[[RealtimeEvent], Any]] = []
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+        self.connected = asyncio.Event()
+
+        self.messages = 0
+        self.parse_errors = 0
+        self.reconnects = 0
+
+    def add_handler(self, handler: Callable[[RealtimeEvent], Any]) -> None:
+        """
+        Register a callback for parsed events.
+
+        Handlers run on the event loop for every event, so they must not block.
+
+        Args:
+            handler: Callable taking a RealtimeTick or RealtimeOrderBook
+        """
+        self._handlers.append(handler)
+
+    async def subscribe(self, symbol: str, tr_id: str = TR_ID_EXECUTION) -> None:
+        """
+        Subscribe to realtime data for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            tr_id: TR_ID_EXECUTION (default) or TR_ID_ORDER_BOOK
+
+        Raises:
+            ValueError: If the session subscription limit would be exceeded
+        """
+        key = (tr_id, symbol)
+        if key in self.subscriptions:
+            return
+        if len(self.subscriptions) >= MAX_SUBSCRIPTIONS:
+            raise ValueError(f"KIS allows at most {MAX_SUBSCRIPTIONS} realtime subscriptions per session")
+
+        self.subscriptions.add(key)
+        await self._send_registration(tr_id, symbol, register=True)
+
+    async def unsubscribe(self, symbol: str, tr_id: str = TR_ID_EXECUTION) -> None:
+        """
+        Unsubscribe from realtime data for a symbol.
+
+        Args:
+            symbol: Stock symbol
+            tr_id: TR_ID_EXECUTION (default) or TR_ID_ORDER_BOOK
+        """
+        key = (tr_id, symbol)
+        if key not in self.subscriptions:
+            return
+
+        self.subscriptions.discard(key)
+        await self._send_registration(tr_id, symbol, register=False)
+
+    async def _send_registration(self, tr_id: str, symbol: str, register: bool) -> None:
+        """Send a (un)registration message if connected; otherwise it is sent on connect."""
+        if self._ws is None or self._ws.closed:
+            return
+
+        await self._ws.send_str(json.dumps({
+            "header": {
+                "approval_key": await self.kis_client.get_approval_key(),
+                "custtype": "P",
+                "tr_type": "1" if register else "2",
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": symbol}},
+        }))
+
+    def start(self) -> None:
+        """Connect in the background and keep reconnecting until closed."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Disconnect and stop reconnecting."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        """Reconnect loop with exponential backoff."""
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                await self._listen()
+                delay = RECONNECT_MIN_DELAY
+                logger.warning(f"[KIS Realtime] Connection closed by server")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[KIS Realtime] Connection failed: {e}")
+
+            self.reconnects += 1
+            logger.info(f"[KIS Realtime] Reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.KIS_REALTIME_RECONNECT_MAX_DELAY)
+
+    async def _listen(self) -> None:
+        """Run one WebSocket session until it closes."""
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.url) as ws:
+                self._ws = ws
+                try:
+                    logger.info(f"[KIS Realtime] Connected to {self.url}")
+                    for tr_id, symbol in sorted(self.subscriptions):
+                        await self._send_registration(tr_id, symbol, register=True)
+                    self.connected.set()
+
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.TEXT:
+                            await self._handle_message(message.data)
+                        elif message.type == aiohttp.WSMsgType.ERROR:
+                            raise ws.exception() or ConnectionError("WebSocket error")
+                finally:
+                    self.connected.clear()
+                    self._ws = None
+
+    async def _handle_message(self, data: str) -> None:
+        """Dispatch a data frame or answer a control message."""
+        self.messages += 1
+
+        if data[:1] in ("0", "1"):
+            try:
+                events = parse_frame(data)
+            except ValueError as e:
+                self.parse_errors += 1
+                logger.warning(f"[KIS Realtime] {e}")
+                return
+
+            for event in events:
+                for handler in self._handlers:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        logger.error(f"[KIS Realtime] Handler failed: {e}")
+            return
+
+        try:
+            message = json.loads(data)
+        except ValueError:
+            self.parse_errors += 1
+            logger.warning(f"[KIS Realtime] Unrecognized message: {data[:50]}")
+            return
+
+        header = message.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            await self._ws.send_str(data)
+            return
+
+        body = message.get("body", {})
+        if body.get("rt_cd") not in (None, "0"):
+            logger.warning(f"[KIS Realtime] {header.get('tr_id')} {header.get('tr_key')}: {body.get('msg1')}")
+        else:
+            logger.debug(f"[KIS Realtime] {header.get('tr_id')} {header.get('tr_key')}: {body.get('msg1')}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return connection and message counters."""
+        return {
+            "connected": self.connected.is_set(),
+            "subscriptions": len(self.subscriptions),
+            "messages": self.messages,
+            "parse_errors": self.parse_errors,
+            "reconnects": self.reconnects,
+        }
@@ -1,14 +1,28 @@
 """KIS API Token Manager - Handles token persistence and lifecycle."""
 
+import asyncio
 import json
 import logging
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Awaitable, Callable, Optional, Dict, Any
 from pydantic import BaseModel
 
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Process-wide mirror of token files (token file path -> token), so reads on
+# the hot path never touch the disk
+_token_mirror: Dict[Path, "KISToken"] = {}
+
+# Polling interval while another process holds a token file lock
+LOCK_POLL_SECONDS = 0.05
+
 
 class KISToken(BaseModel):
     """KIS authentication token model."""
@@ -44,7 +58,15 @@ class KISToken(BaseModel):
 
 
 class KISTokenManager:
-    """Manages KIS API token persistence and lifecycle."""
+    """
+    Manages KIS API token persistence and lifecycle.
+
+    Tokens are shared between processes (e.g. several uvicorn workers)
+    through the token file. Issuance happens under an exclusive fcntl lock
+    on a sidecar ``.lock`` file and re-checks the file first, so only one
+    process issues a token per key. Reads are served from a process-wide
+    in-memory mirror and only fall back to the file on a miss.
+    """
 
     def __init__(self, app_key: str, trading_mode: str = "mock"):
         """
@@ -64,6 +86,7 @@ class KISTokenManager:
         # Token file path: ~/KIS/tokens/token_{app_key_prefix}_{mode}.json
         app_key_prefix = app_key[:10] if len(app_key) >= 10 else app_key
         self.token_file = self.token_dir / f"token_{app_key_prefix}_{trading_mode}.json"
+        self.lock_file = self.token_file.with_suffix(".lock")
 
         logger.info(f"[TokenManager] Initialized for {trading_mode} mode")
         logger.info(f"[TokenManager] Token file: {self.token_file}")
@@ -84,8 +107,12 @@ class KISTokenManager:
                 "expiry_datetime": token.get_expiry_datetime().isoformat()
             }
 
-            with open(self.token_file, 'w', encoding='utf-8') as f:
+            # Write atomically so other processes never read a partial file
+            tmp_file = self.token_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(token_data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.token_file)
+            _token_mirror[self.token_file] = token
 
             logger.info(f"[TokenManager] Token saved successfully")
             logger.info(f"  - Issued at: {token.issued_at}")
@@ -98,7 +125,19 @@ class KISTokenManager:
 
     def load_token(self) -> Optional[KISToken]:
         """
-        Load token from local file.
+        Load token from the in-memory mirror, falling back to the local file.
+
+        Returns:
+            KISToken object if valid token exists, None otherwise
+        """
+        token = _token_mirror.get(self.token_file)
+        if token is not None and not token.is_expired():
+            return token
+        return self._read_token_file()
+
+    def _read_token_file(self) -> Optional[KISToken]:
+        """
+        Load token from local file and refresh the in-memory mirror.
 
         Returns:
             KISToken object if valid token exists, None otherwise
@@ -131,14 +170,50 @@ class KISTokenManager:
                 return None
 
             logger.info(f"[TokenManager] Token is valid")
+            _token_mirror[self.token_file] = token
             return token
 
         except Exception as e:
             logger.error(f"[TokenManager] Failed to load token: {e}")
             return None
 
+    async def get_or_issue(
+        self,
+        issue: Callable[[], Awaitable[KISToken]],
+        newer_than: Optional[KISToken] = None
+    ) -> KISToken:
+        """
+        Return the stored token, or issue and save one while holding the file lock.
+
+        Concurrent callers in other processes block on the lock, then find
+        the token the first one saved instead of issuing their own.
+
+        Args:
+            issue: Coroutine function requesting a new token from KIS
+            newer_than: Only accept a stored token that expires after this one
+                (used by proactive refresh)
+
+        Returns:
+            Valid KISToken
+        """
+        async with self._file_lock():
+            token = self._read_token_file()
+            if token is not None and (
+                newer_than is None or token.get_expiry_datetime() > newer_than.get_expiry_datetime()
+            ):
+                return token
+
+            token = await issue()
+            self.save_token(token)
+            return token
+
+    def _file_lock(self) -> "_TokenFileLock":
+        """Exclusive cross-process lock for issuing this key's token."""
+        return _TokenFileLock(self.lock_file)
+
     def delete_token(self) -> None:
         """Delete token file."""
+        _token_mirror.pop(self.token_file, None)
         try:
             if self.token_file.exists():
                 self.token_file.unlink()
@@ -169,3 +244,38 @@ class KISTokenManager:
         except Exception as e:
             logger.error(f"[TokenManager] Failed to get token info: {e}")
             return None
+
+
+class _TokenFileLock:
+    """
+    Async context manager holding an exclusive fcntl lock on a file.
+
+    The lock is polled with LOCK_NB so waiting never blocks the event loop
+    and stays cancellable. Without fcntl (Windows) it is a no-op.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    async def __aenter__(self) -> "_TokenFileLock":
+        if fcntl is None:
+            return self
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            while True:
+                try:
+                    fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return self
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_SECONDS)
+        except BaseException:
+            os.close(self._fd)
+            self._fd = None
+            raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
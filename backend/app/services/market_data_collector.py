@@ -0,0 +1,526 @@
+"""Universe-wide market data collection jobs."""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.market_data import TimeInterval
+from app.models.stock import Stock
+from app.schemas.market_data import CollectionProgress, MarketDataCreate
+from app.services.kis_client import RequestPriority
+from app.services.kis_quotation import KISQuotation
+from app.services.market_data_service import PERIOD_INTERVALS, MarketDataService, history_windows
+
+logger = logging.getLogger(__name__)
+
+# Delay before the first retry of a failed symbol (doubled on each attempt)
+RETRY_BASE_DELAY = 0.5
+
+# Symbols per latest-bar lookup query (bounds the IN list)
+LATEST_BARS_CHUNK_SIZE = 1000
+
+_JOB_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def get_checkpoint_dir() -> Path:
+    """
+    Get the directory holding collection job checkpoints.
+
+    Returns:
+        COLLECTOR_CHECKPOINT_DIR, or logs/collector next to the app package
+    """
+    if settings.COLLECTOR_CHECKPOINT_DIR:
+        return Path(settings.COLLECTOR_CHECKPOINT_DIR)
+    return Path(__file__).parent.parent.parent / "logs" / "collector"
+
+
+def _checkpoint_path(job_id: str, checkpoint_dir: Optional[Path] = None) -> Path:
+    """Path of a job's checkpoint file."""
+    if not _JOB_ID_PATTERN.match(job_id):
+        raise ValueError(f"Invalid job id: {job_id}")
+    return (checkpoint_dir or get_checkpoint_dir()) / f"{job_id}.json"
+
+
+def load_checkpoint(job_id: str, checkpoint_dir: Optional[Path] = None) -> Optional[CollectionProgress]:
+    """
+    Load a collection job's checkpoint.
+
+    Args:
+        job_id: Collection job id
+        checkpoint_dir: Checkpoint directory (default: get_checkpoint_dir())
+
+    Returns:
+        CollectionProgress, or None if the job has no checkpoint
+
+    Raises:
+        ValueError: If the job id is not a plain file name
+    """
+    path = _checkpoint_path(job_id, checkpoint_dir)
+    if not path.exists():
+        return None
+    return CollectionProgress.model_validate_json(path.read_text(encoding="utf-8"))
+
+
+def save_checkpoint(progress: CollectionProgress, checkpoint_dir: Optional[Path] = None) -> None:
+    """
+    Atomically write a collection job's checkpoint.
+
+    Args:
+        progress: Job progress to persist
+        checkpoint_dir: Checkpoint directory (default: get_checkpoint_dir())
+    """
+    path = _checkpoint_path(progress.job_id, checkpoint_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(progress.model_dump_json(indent=2), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+class MarketDataCollector:
+    """
+    Collect daily bars for many symbols under a KIS rate limit.
+
+    Workers fetch symbols concurrently. Requests go through the KIS client's
+    per-app-key rate limiter in the BULK lane, so interactive quotes and
+    orders on the same key are served first. Parsed bars are buffered and written with
+    ``MarketDataService.upsert_market_data`` once ``batch_rows`` accumulate.
+    After every write the job's progress is checkpointed to a JSON file, so
+    an interrupted job resumed with the same ``job_id`` skips every symbol
+    whose bars were already saved.
+    """
+
+    def __init__(
+        self,
+        quotation: KISQuotation,
+        session_factory: async_sessionmaker,
+        concurrency: Optional[int] = None,
+        batch_rows: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        prefetch_pages: Optional[int] = None,
+        checkpoint_dir: Optional[Path] = None
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            quotation: KIS quotation service
+            session_factory: Session factory for the batched writes
+            concurrency: Concurrent KIS requests (default: COLLECTOR_CONCURRENCY)
+            batch_rows: Rows buffered per upsert (default: COLLECTOR_BATCH_ROWS)
+            max_retries: Retries per request (default: COLLECTOR_MAX_RETRIES)
+            prefetch_pages: Backfill requests in flight per symbol (default: COLLECTOR_PREFETCH_PAGES)
+            checkpoint_dir: Checkpoint directory (default: get_checkpoint_dir())
+        """
+        self.quotation = quotation
+        self.session_factory = session_factory
+        self.rate_limiter = quotation.client.rate_limiter
+        self.concurrency = concurrency or settings.COLLECTOR_CONCURRENCY
+        self.batch_rows = batch_rows or settings.COLLECTOR_BATCH_ROWS
+        self.max_retries = settings.COLLECTOR_MAX_RETRIES if max_retries is None else max_retries
+        self.prefetch_pages = prefetch_pages or settings.COLLECTOR_PREFETCH_PAGES
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else get_checkpoint_dir()
+
+    @staticmethod
+    async def select_universe(
+        db: AsyncSession,
+        market_type: Optional[str] = None,
+        symbols: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Select symbols to collect from the stocks table.
+
+        Args:
+            db: Database session
+            market_type: Only stocks of this market (KOSPI or KOSDAQ)
+            symbols: Only these symbols (unknown symbols are kept as given)
+
+        Returns:
+            Symbols in a stable order
+        """
+        if symbols:
+            return list(dict.fromkeys(symbols))
+
+        stmt = select(Stock.symbol).order_by(Stock.symbol)
+        if market_type:
+            stmt = stmt.where(Stock.market_type == market_type)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    @staticmethod
+    def new_job_id() -> str:
+        """Generate a job id from the current time."""
+        return f"daily_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+
+    @staticmethod
+    def new_progress(
+        period: str = "D",
+        job_id: Optional[str] = None,
+        incremental: bool = False,
+        history_start: Optional[date] = None,
+        total_symbols: int = 0
+    ) -> CollectionProgress:
+        """
+        Create the progress record of a new job.
+
+        Args:
+            period: Period code (D, W, M)
+            job_id: Job id (default: new_job_id())
+            incremental: Only fetch and save bars after the latest stored one
+            history_start: Backfill bars back to this date
+            total_symbols: Number of symbols to collect
+
+        Returns:
+            CollectionProgress with the period's interval
+
+        Raises:
+            ValueError: If the period code is not D, W or M
+        """
+        if period not in PERIOD_INTERVALS:
+            raise ValueError(f"Invalid period: {period}. Use D, W or M")
+
+        now = datetime.now()
+        return CollectionProgress(
+            job_id=job_id or MarketDataCollector.new_job_id(),
+            interval=PERIOD_INTERVALS[period],
+            period=period,
+            incremental=incremental,
+            history_start=history_start,
+            total_symbols=total_symbols,
+            started_at=now,
+            updated_at=now
+        )
+
+    async def collect_daily(
+        self,
+        symbols: List[str],
+        period: str = "D",
+        job_id: Optional[str] = None,
+        incremental: bool = False,
+        history_start: Optional[date] = None
+    ) -> CollectionProgress:
+        """
+        Collect daily (or weekly/monthly) bars for every symbol.
+
+        In incremental mode the latest stored bar of every symbol is loaded
+        up front; each symbol then only requests the range from that bar to
+        today (paged like a backfill when it spans more than one request),
+        and symbols with nothing new or changed are not written.
+
+        With ``history_start`` each symbol is backfilled instead: its history
+        is paged backwards from today (see ``_fetch_history``) and every page
+        is buffered for the batched writes as soon as it arrives.
+
+        A resumed job keeps the period, mode and ``history_start`` saved in
+        its checkpoint; the corresponding arguments only apply to new jobs.
+
+        Args:
+            symbols: Symbols to collect
+            period: Period code (D: 일, W: 주, M: 월)
+            job_id: Resume this job if it has a checkpoint (default: new job)
+            incremental: Only fetch and save bars after the latest stored one
+            history_start: Backfill bars back to this date (overrides incremental)
+
+        Returns:
+            Final progress with throughput figures
+
+        Raises:
+            ValueError: If the period code or job id is invalid
+        """
+        progress = load_checkpoint(job_id, self.checkpoint_dir) if job_id else None
+        if progress is None:
+            progress = self.new_progress(period, job_id, incremental, history_start)
+        else:
+            period, incremental, history_start = progress.period, progress.incremental, progress.history_start
+            logger.info(
+                f"[Collector] Resuming job {progress.job_id} (period={period}, incremental={incremental}, "
+                f"history_start={history_start}): {len(progress.completed_symbols)} symbols already collected"
+            )
+        interval = PERIOD_INTERVALS[period]
+
+        completed = set(progress.completed_symbols)
+        pending = [symbol for symbol in symbols if symbol not in completed]
+        progress.status = "running"
+        progress.total_symbols = len(completed | set(symbols))
+        progress.failed_symbols = {}
+        save_checkpoint(progress, self.checkpoint_dir)
+
+        logger.info(
+            f"[Collector] Job {progress.job_id}: {len(pending)} symbols to collect, "
+            f"concurrency={self.concurrency}, rate={self.rate_limiter.rate}/s"
+        )
+
+        latest_bars = {}
+        if pending and incremental and history_start is None:
+            latest_bars = await self._load_latest_bars(pending, interval)
+
+        if pending:
+            # Fetch the access token once instead of racing for it in every worker
+            await self.quotation.client._ensure_token()
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for symbol in pending:
+            queue.put_nowait(symbol)
+
+        buffer: List[Tuple[str, List[MarketDataCreate], bool]] = []
+        buffered_rows = 0
+        write_lock = asyncio.Lock()
+        elapsed_before = progress.elapsed_seconds
+        start = time.monotonic()
+        wait_before = self.rate_limiter.lane_wait(RequestPriority.BULK)
+
+        def update_throughput() -> None:
+            run_elapsed = time.monotonic() - start
+            progress.elapsed_seconds = round(elapsed_before + run_elapsed, 3)
+            progress.rate_limit_wait_seconds = round(
+                self.rate_limiter.lane_wait(RequestPriority.BULK) - wait_before, 3
+            )
+            progress.updated_at = datetime.now()
+            if progress.elapsed_seconds > 0:
+                progress.symbols_per_second = round(
+                    len(progress.completed_symbols) / progress.elapsed_seconds, 3
+                )
+                progress.rows_per_second = round(progress.rows_saved / progress.elapsed_seconds, 3)
+
+        async def flush() -> None:
+            nonlocal buffer, buffered_rows
+            async with write_lock:
+                if not buffer:
+                    return
+                batch, buffer, buffered_rows = buffer, [], 0
+                rows = [bar for _, bars, _ in batch for bar in bars]
+                if rows:
+                    async with self.session_factory() as session:
+                        await MarketDataService.upsert_market_data(session, rows, returning=False)
+
+                progress.completed_symbols.extend(symbol for symbol, _, done in batch if done)
+                progress.rows_saved += len(rows)
+                update_throughput()
+                save_checkpoint(progress, self.checkpoint_dir)
+                logger.info(
+                    f"[Collector] {len(progress.completed_symbols)}/{progress.total_symbols} symbols, "
+                    f"{progress.rows_saved} rows, {progress.symbols_per_second} symbols/s, "
+                    f"{progress.rows_per_second} rows/s"
+                )
+
+        async def add(symbol: str, bars: List[MarketDataCreate], done: bool) -> None:
+            # A symbol only counts as completed once its last page is written;
+            # symbols without new bars add no rows and complete at the next flush
+            nonlocal buffered_rows
+            buffer.append((symbol, bars, done))
+            buffered_rows += len(bars)
+            if buffered_rows >= self.batch_rows:
+                await flush()
+
+        async def worker() -> None:
+            while True:
+                try:
+                    symbol = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    if history_start is not None:
+                        async for page in self._fetch_history(symbol, period, progress, history_start):
+                            await add(symbol, page, done=False)
+                        bars = []
+                    else:
+                        latest = latest_bars.get(symbol)
+                        start_date = latest["timestamp"][-1].astype(datetime).date() if latest else None
+                        bars = await self._fetch_range(symbol, period, progress, start_date)
+                        if incremental:
+                            bars = MarketDataService.filter_new_bars(bars, latest)
+                            if not bars:
+                                progress.up_to_date_symbols += 1
+                except Exception as e:
+                    logger.error(f"[Collector] Giving up on {symbol}: {e}")
+                    progress.failed_symbols[symbol] = str(e)
+                    continue
+
+                await add(symbol, bars, done=True)
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(pending)))))
+            await flush()
+        except BaseException:
+            progress.status = "failed"
+            update_throughput()
+            save_checkpoint(progress, self.checkpoint_dir)
+            raise
+
+        progress.status = "completed_with_errors" if progress.failed_symbols else "completed"
+        update_throughput()
+        save_checkpoint(progress, self.checkpoint_dir)
+
+        logger.info(
+            f"[Collector] Job {progress.job_id} {progress.status}: "
+            f"{len(progress.completed_symbols)} symbols, {progress.rows_saved} rows in "
+            f"{progress.elapsed_seconds}s ({progress.symbols_per_second} symbols/s, "
+            f"{progress.rows_per_second} rows/s, {progress.rate_limit_wait_seconds}s rate limited)"
+        )
+        return progress
+
+    async def _load_latest_bars(
+        self,
+        symbols: List[str],
+        interval: TimeInterval = TimeInterval.ONE_DAY
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Load the latest stored bar of every symbol.
+
+        Args:
+            symbols: Stock symbols
+            interval: Time interval of the bars
+
+        Returns:
+            Columnar latest bar per symbol (symbols without data are omitted)
+        """
+        latest_bars = {}
+        async with self.session_factory() as session:
+            for begin in range(0, len(symbols), LATEST_BARS_CHUNK_SIZE):
+                latest_bars.update(await MarketDataService.get_latest_bars(
+                    db=session,
+                    symbols=symbols[begin:begin + LATEST_BARS_CHUNK_SIZE],
+                    interval=interval
+                ))
+        return latest_bars
+
+    async def _fetch_history(
+        self,
+        symbol: str,
+        period: str,
+        progress: CollectionProgress,
+        start_date: date
+    ) -> AsyncIterator[List[MarketDataCreate]]:
+        """
+        Page backwards through a symbol's history down to ``start_date``.
+
+        KIS returns at most 100 bars per request, so the range is split into
+        calendar windows that cannot hold more than 100 bars (see
+        ``history_windows``). Since the windows do not depend on each other's
+        results, up to ``prefetch_pages`` requests are kept in flight while
+        the caller parses and writes the current page. Paging stops at the
+        first empty window after data was found (before the listing date).
+
+        Args:
+            symbol: Stock symbol
+            period: Period code
+            progress: Job progress (request counter)
+            start_date: Oldest date to fetch
+
+        Yields:
+            Parsed bars of each non-empty window, newest window first
+        """
+        windows = deque(history_windows(start_date, datetime.now().date(), period))
+        in_flight: Deque[asyncio.Task] = deque()
+
+        def schedule() -> None:
+            while windows and len(in_flight) < self.prefetch_pages:
+                window_start, window_end = windows.popleft()
+                in_flight.append(asyncio.create_task(
+                    self._fetch_daily(symbol, period, progress, window_start, window_end)
+                ))
+
+        schedule()
+        found_data = False
+        try:
+            while in_flight:
+                bars = await in_flight.popleft()
+                schedule()
+                if bars:
+                    found_data = True
+                    yield bars
+                elif found_data:
+                    break
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def _fetch_range(
+        self,
+        symbol: str,
+        period: str,
+        progress: CollectionProgress,
+        start_date: Optional[date] = None
+    ) -> List[MarketDataCreate]:
+        """
+        Fetch every bar from ``start_date`` to today.
+
+        KIS returns at most 100 bars per request, so a range longer than one
+        ``history_windows`` window is requested window by window instead of
+        silently losing its oldest bars.
+
+        Args:
+            symbol: Stock symbol
+            period: Period code
+            progress: Job progress (request counter)
+            start_date: Oldest date (default: KIS's most recent bars only)
+
+        Returns:
+            Parsed bars in chronological window order
+        """
+        if start_date is None:
+            return await self._fetch_daily(symbol, period, progress)
+
+        bars: List[MarketDataCreate] = []
+        for window_start, window_end in reversed(history_windows(start_date, datetime.now().date(), period)):
+            bars.extend(await self._fetch_daily(symbol, period, progress, window_start, window_end))
+        return bars
+
+    async def _fetch_daily(
+        self,
+        symbol: str,
+        period: str,
+        progress: CollectionProgress,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[MarketDataCreate]:
+        """
+        Fetch and parse one symbol's chart bars, retrying with backoff.
+
+        Args:
+            symbol: Stock symbol
+            period: Period code
+            progress: Job progress (request counter)
+            start_date: Only request bars from this date
+            end_date: Only request bars up to this date (default: today)
+
+        Returns:
+            Parsed bars (empty if KIS has no data for the symbol)
+
+        Raises:
+            Exception: The last error once retries are exhausted
+        """
+        for attempt in range(self.max_retries + 1):
+            progress.requests += 1
+            try:
+                if start_date is not None:
+                    kis_response = await self.quotation.get_daily_chart_data(
+                        symbol, period, start_date=start_date, end_date=end_date,
+                        priority=RequestPriority.BULK
+                    )
+                else:
+                    kis_response = await self.quotation.get_daily_chart_data(
+                        symbol, period, priority=RequestPriority.BULK
+                    )
+                return MarketDataService._parse_daily_chart_data(
+                    symbol=symbol,
+                    kis_response=kis_response,
+                    interval=PERIOD_INTERVALS[period]
+                )
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = RETRY_BASE_DELAY * 2 ** attempt
+                logger.warning(f"[Collector] {symbol} failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+        return []
@@ -1,9 +1,12 @@
 """Market data service for collecting and managing market data."""
 
 import logging
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Dict, Any, Tuple
+import numpy as np
+from sqlalchemy import select, and_, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.market_data import MarketData, TimeInterval
@@ -12,6 +15,68 @@ from app.services.kis_quotation import KISQuotation
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT ... ON CONFLICT statement (8 bind parameters per row keeps
+# this well below PostgreSQL's and SQLite's bind parameter limits)
+UPSERT_CHUNK_SIZE = 500
+
+_UPSERT_DIALECTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Bar length of each fixed-length interval (weeks and months are calendar based)
+INTERVAL_SECONDS = {
+    TimeInterval.ONE_MINUTE: 60,
+    TimeInterval.FIVE_MINUTES: 300,
+    TimeInterval.TEN_MINUTES: 600,
+    TimeInterval.THIRTY_MINUTES: 1800,
+    TimeInterval.ONE_HOUR: 3600,
+    TimeInterval.ONE_DAY: 86400,
+}
+
+# Interval stored for each KIS daily chart period code
+PERIOD_INTERVALS = {
+    "D": TimeInterval.ONE_DAY,
+    "W": TimeInterval.ONE_WEEK,
+    "M": TimeInterval.ONE_MONTH,
+}
+
+# Calendar days per backfill request, chosen so a window can never hold more
+# than the 100 bars KIS returns per call (140 days span exactly 100 weekdays)
+HISTORY_WINDOW_DAYS = {"D": 140, "W": 693, "M": 2999}
+
+# Stored interval each coarser interval is resampled from
+RESAMPLE_SOURCES = {
+    TimeInterval.FIVE_MINUTES: TimeInterval.ONE_MINUTE,
+    TimeInterval.TEN_MINUTES: TimeInterval.ONE_MINUTE,
+    TimeInterval.THIRTY_MINUTES: TimeInterval.ONE_MINUTE,
+    TimeInterval.ONE_HOUR: TimeInterval.ONE_MINUTE,
+    TimeInterval.ONE_WEEK: TimeInterval.ONE_DAY,
+    TimeInterval.ONE_MONTH: TimeInterval.ONE_DAY,
+}
+
+
+def history_windows(start_date: date, end_date: date, period: str = "D") -> List[Tuple[date, date]]:
+    """
+    Split a date range into backfill request windows, newest first.
+
+    Args:
+        start_date: Oldest date
+        end_date: Newest date
+        period: Period code (D, W, M)
+
+    Returns:
+        (window_start, window_end) pairs covering the range without overlap
+    """
+    span = timedelta(days=HISTORY_WINDOW_DAYS[period] - 1)
+    windows = []
+    window_end = end_date
+    while window_end >= start_date:
+        window_start = max(start_date, window_end - span)
+        windows.append((window_start, window_end))
+        window_end = window_start - timedelta(days=1)
+    return windows
+
 
 class MarketDataService:
     """Service for managing market data operations."""
@@ -112,45 +177,98 @@ class MarketDataService:
         return market_data_list
 
     @staticmethod
-    async def collect_daily_data(
+    async def upsert_market_data(
         db: AsyncSession,
-        kis_client: KISQuotation,
-        symbol: str,
-        period: str = "D"
+        market_data_list: List[MarketDataCreate],
+        commit: bool = True,
+        returning: bool = True
     ) -> List[MarketData]:
         """
-        Collect daily chart data from KIS API and save to database.
+        Insert or update bars with multi-row INSERT ... ON CONFLICT statements.
+
+        Conflicts on (symbol, timestamp, interval) (``idx_market_data_unique``)
+        update OHLCV in place. PostgreSQL and SQLite use their native upsert;
+        other dialects fall back to a per-row select-then-write.
 
         Args:
             db: Database session
-            kis_client: KIS API client
-            symbol: Stock symbol
-            period: Period code (D: 일, W: 주, M: 월)
+            market_data_list: Bars to save
+            commit: Whether to commit the session afterwards
+            returning: Whether to load the saved rows back (bulk jobs that
+                only need a row count can skip building ORM objects)
 
         Returns:
-            List of saved MarketData objects
+            Saved MarketData objects in chronological order (empty when
+            ``returning`` is False on PostgreSQL/SQLite)
         """
-        logger.info(f"Collecting daily data for {symbol}, period: {period}")
+        if not market_data_list:
+            return []
 
-        # Get data from KIS API
-        kis_response = await kis_client.get_daily_chart_data(symbol, period)
+        # A single statement may not touch the same row twice; keep the last bar per key
+        rows_by_key = {}
+        for data in market_data_list:
+            rows_by_key[(data.symbol, data.timestamp, data.interval)] = data.model_dump()
+        rows = list(rows_by_key.values())
+
+        dialect = db.get_bind().dialect.name
+        insert = _UPSERT_DIALECTS.get(dialect)
+        if insert is None:
+            saved_data = await MarketDataService._upsert_market_data_per_row(db, rows)
+        else:
+            saved_data = []
+            for begin in range(0, len(rows), UPSERT_CHUNK_SIZE):
+                chunk = rows[begin:begin + UPSERT_CHUNK_SIZE]
+                created_at = datetime.utcnow()
+                stmt = insert(MarketData).values([{**row, "created_at": created_at} for row in chunk])
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["symbol", "timestamp", "interval"],
+                    set_={
+                        "open": stmt.excluded.open,
+                        "high": stmt.excluded.high,
+                        "low": stmt.excluded.low,
+                        "close": stmt.excluded.close,
+                        "volume": stmt.excluded.volume,
+                    }
+                )
 
-        # Parse response
-        market_data_list = MarketDataService._parse_daily_chart_data(
-            symbol=symbol,
-            kis_response=kis_response,
-            interval=TimeInterval.ONE_DAY
-        )
+                if returning:
+                    result = await db.scalars(
+                        stmt.returning(MarketData),
+                        execution_options={"populate_existing": True}
+                    )
+                    saved_data.extend(result.all())
+                else:
+                    await db.execute(stmt)
 
-        # Save to database
+        if commit:
+            await db.commit()
+
+        saved_data.sort(key=lambda d: d.timestamp)
+        return saved_data
+
+    @staticmethod
+    async def _upsert_market_data_per_row(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> List[MarketData]:
+        """
+        Portable upsert for dialects without ON CONFLICT support.
+
+        Args:
+            db: Database session
+            rows: Bar dictionaries (MarketDataCreate fields)
+
+        Returns:
+            Saved MarketData objects
+        """
         saved_data = []
-        for data in market_data_list:
+        for data in rows:
             # Check if data already exists
             stmt = select(MarketData).where(
                 and_(
-                    MarketData.symbol == data.symbol,
-                    MarketData.timestamp == data.timestamp,
-                    MarketData.interval == data.interval
+                    MarketData.symbol == data["symbol"],
+                    MarketData.timestamp == data["timestamp"],
+                    MarketData.interval == data["interval"]
                 )
             )
             result = await db.execute(stmt)
@@ -158,19 +276,128 @@ class MarketDataService:
 
             if existing:
                 # Update existing data
-                existing.open = data.open
-                existing.high = data.high
-                existing.low = data.low
-                existing.close = data.close
-                existing.volume = data.volume
+                existing.open = data["open"]
+                existing.high = data["high"]
+                existing.low = data["low"]
+                existing.close = data["close"]
+                existing.volume = data["volume"]
                 saved_data.append(existing)
             else:
                 # Create new data
-                new_data = MarketData(**data.model_dump())
+                new_data = MarketData(**data)
                 db.add(new_data)
                 saved_data.append(new_data)
 
-        await db.commit()
+        await db.flush()
+        return saved_data
+
+    @staticmethod
+    def filter_new_bars(
+        market_data_list: List[MarketDataCreate],
+        latest: Optional[Dict[str, np.ndarray]]
+    ) -> List[MarketDataCreate]:
+        """
+        Drop bars that are already stored unchanged.
+
+        Keeps bars newer than the latest stored bar, and the bar at the
+        latest timestamp itself if its OHLCV changed (e.g. it was stored
+        while the session was still open).
+
+        Args:
+            market_data_list: Parsed bars
+            latest: Latest stored bar in columnar form (``get_market_data_bulk``
+                with ``limit=1``), or None if the symbol has no data
+
+        Returns:
+            Bars that need to be written
+        """
+        if latest is None:
+            return market_data_list
+
+        latest_timestamp = latest["timestamp"][-1].astype(datetime)
+        stored = tuple(float(latest[column][-1]) for column in ("open", "high", "low", "close", "volume"))
+
+        new_bars = []
+        for data in market_data_list:
+            if data.timestamp > latest_timestamp:
+                new_bars.append(data)
+            elif data.timestamp == latest_timestamp and (
+                (data.open, data.high, data.low, data.close, data.volume) != stored
+            ):
+                new_bars.append(data)
+        return new_bars
+
+    @staticmethod
+    async def collect_daily_data(
+        db: AsyncSession,
+        kis_client: KISQuotation,
+        symbol: str,
+        period: str = "D",
+        incremental: bool = False
+    ) -> List[MarketData]:
+        """
+        Collect daily chart data from KIS API and save to database.
+
+        In incremental mode only the range from the latest stored bar up to
+        today is requested (in ``history_windows`` pages when it is longer
+        than one request can return), and nothing is written if no bar is
+        new or changed.
+
+        Args:
+            db: Database session
+            kis_client: KIS API client
+            symbol: Stock symbol
+            period: Period code (D: 일, W: 주, M: 월)
+            incremental: Only fetch and save bars after the latest stored one
+
+        Returns:
+            List of saved MarketData objects (empty if nothing was new)
+
+        Raises:
+            ValueError: If the period code is not D, W or M
+        """
+        if period not in PERIOD_INTERVALS:
+            raise ValueError(f"Invalid period: {period}. Use D, W or M")
+        interval = PERIOD_INTERVALS[period]
+        logger.info(f"Collecting daily data for {symbol}, period: {period}")
+
+        latest = None
+        start_date = None
+        if incremental:
+            latest_bars = await MarketDataService.get_latest_bars(db=db, symbols=[symbol], interval=interval)
+            latest = latest_bars.get(symbol)
+            if latest is not None:
+                start_date = latest["timestamp"][-1].astype(datetime).date()
+
+        # Get data from KIS API (at most 100 bars per request, so a long
+        # incremental range is requested window by window)
+        if start_date is not None:
+            market_data_list = []
+            for window_start, window_end in reversed(history_windows(start_date, datetime.now().date(), period)):
+                kis_response = await kis_client.get_daily_chart_data(
+                    symbol, period, start_date=window_start, end_date=window_end
+                )
+                market_data_list.extend(MarketDataService._parse_daily_chart_data(
+                    symbol=symbol,
+                    kis_response=kis_response,
+                    interval=interval
+                ))
+        else:
+            kis_response = await kis_client.get_daily_chart_data(symbol, period)
+            market_data_list = MarketDataService._parse_daily_chart_data(
+                symbol=symbol,
+                kis_response=kis_response,
+                interval=interval
+            )
+
+        if incremental:
+            market_data_list = MarketDataService.filter_new_bars(market_data_list, latest)
+            if not market_data_list:
+                logger.info(f"No new daily data for {symbol}")
+                return []
+
+        # Save to database
+        saved_data = await MarketDataService.upsert_market_data(db, market_data_list)
         logger.info(f"Saved {len(saved_data)} daily data records for {symbol}")
 
         return saved_data
@@ -220,34 +447,7 @@ class MarketDataService:
         )
 
         # Save to database
-        saved_data = []
-        for data in market_data_list:
-            # Check if data already exists
-            stmt = select(MarketData).where(
-                and_(
-                    MarketData.symbol == data.symbol,
-                    MarketData.timestamp == data.timestamp,
-                    MarketData.interval == data.interval
-                )
-            )
-            result = await db.execute(stmt)
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing data
-                existing.open = data.open
-                existing.high = data.high
-                existing.low = data.low
-                existing.close = data.close
-                existing.volume = data.volume
-                saved_data.append(existing)
-            else:
-                # Create new data
-                new_data = MarketData(**data.model_dump())
-                db.add(new_data)
-                saved_data.append(new_data)
-
-        await db.commit()
+        saved_data = await MarketDataService.upsert_market_data(db, market_data_list)
         logger.info(f"Saved {len(saved_data)} {interval} data records for {symbol}")
 
         return saved_data
@@ -299,6 +499,399 @@ class MarketDataService:
         # Return in chronological order
         return list(reversed(data))
 
+    @staticmethod
+    async def get_market_data_bulk(
+        db: AsyncSession,
+        symbols: List[str],
+        interval: TimeInterval,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: Optional[int] = 100
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Get the last ``limit`` bars for many symbols in a single query.
+
+        Uses ROW_NUMBER() partitioned by symbol to keep the most recent bars
+        per symbol, and selects plain columns so no ORM objects are built.
+
+        Args:
+            db: Database session
+            symbols: Stock symbols
+            interval: Time interval
+            start_date: Start date (optional)
+            end_date: End date (optional)
+            limit: Maximum number of bars per symbol (None: all bars in range)
+
+        Returns:
+            Columnar arrays per symbol (same format as ``to_columns``), in
+            chronological order; symbols without data are omitted
+        """
+        if not symbols:
+            return {}
+
+        conditions = [
+            MarketData.symbol.in_(symbols),
+            MarketData.interval == interval
+        ]
+        if start_date:
+            conditions.append(MarketData.timestamp >= start_date)
+        if end_date:
+            conditions.append(MarketData.timestamp <= end_date)
+
+        ranked = (
+            select(
+                MarketData.symbol,
+                MarketData.timestamp,
+                MarketData.open,
+                MarketData.high,
+                MarketData.low,
+                MarketData.close,
+                MarketData.volume,
+                func.row_number().over(
+                    partition_by=MarketData.symbol,
+                    order_by=MarketData.timestamp.desc()
+                ).label("rn")
+            )
+            .where(and_(*conditions))
+            .subquery()
+        )
+
+        stmt = (
+            select(
+                ranked.c.symbol,
+                ranked.c.timestamp,
+                ranked.c.open,
+                ranked.c.high,
+                ranked.c.low,
+                ranked.c.close,
+                ranked.c.volume
+            )
+            .order_by(ranked.c.symbol, ranked.c.timestamp)
+        )
+        if limit is not None:
+            stmt = stmt.where(ranked.c.rn <= limit)
+
+        result = await db.execute(stmt)
+        rows = result.all()
+        data = MarketDataService._rows_to_columns(rows)
+
+        logger.info(f"Loaded {len(rows)} bars for {len(data)}/{len(symbols)} symbols in one query")
+        return data
+
+    @staticmethod
+    async def get_latest_bars(
+        db: AsyncSession,
+        symbols: List[str],
+        interval: TimeInterval
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Get the latest stored bar of many symbols in a single query.
+
+        Finds each symbol's ``max(timestamp)`` with GROUP BY (served by the
+        symbol/interval/timestamp index) and joins back for its OHLCV, instead
+        of ranking every stored bar with ROW_NUMBER().
+
+        Args:
+            db: Database session
+            symbols: Stock symbols
+            interval: Time interval
+
+        Returns:
+            One-bar columnar arrays per symbol (same format as
+            ``get_market_data_bulk`` with ``limit=1``); symbols without data
+            are omitted
+        """
+        if not symbols:
+            return {}
+
+        latest = (
+            select(MarketData.symbol, func.max(MarketData.timestamp).label("timestamp"))
+            .where(and_(MarketData.symbol.in_(symbols), MarketData.interval == interval))
+            .group_by(MarketData.symbol)
+            .subquery()
+        )
+        stmt = (
+            select(
+                MarketData.symbol,
+                MarketData.timestamp,
+                MarketData.open,
+                MarketData.high,
+                MarketData.low,
+                MarketData.close,
+                MarketData.volume
+            )
+            .join(latest, and_(
+                MarketData.symbol == latest.c.symbol,
+                MarketData.timestamp == latest.c.timestamp
+            ))
+            .where(MarketData.interval == interval)
+            .order_by(MarketData.symbol)
+        )
+
+        result = await db.execute(stmt)
+        return MarketDataService._rows_to_columns(result.all())
+
+    @staticmethod
+    def _rows_to_columns(rows: List[Any]) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Split (symbol, timestamp, open, high, low, close, volume) rows sorted
+        by symbol into columnar arrays per symbol.
+        """
+        if not rows:
+            return {}
+
+        symbol_col, timestamp_col, *price_cols = zip(*rows)
+        symbol_array = np.array(symbol_col)
+        timestamps = np.array(timestamp_col, dtype="datetime64[us]")
+        values = np.array(price_cols, dtype=np.float64)
+
+        # Rows are sorted by symbol, so each symbol is one contiguous slice
+        bounds = np.concatenate((
+            [0],
+            np.flatnonzero(symbol_array[1:] != symbol_array[:-1]) + 1,
+            [len(rows)]
+        ))
+
+        data = {}
+        for begin, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            data[str(symbol_array[begin])] = {
+                "timestamp": timestamps[begin:end],
+                "open": values[0, begin:end],
+                "high": values[1, begin:end],
+                "low": values[2, begin:end],
+                "close": values[3, begin:end],
+                "volume": values[4, begin:end],
+            }
+        return data
+
+    @staticmethod
+    def to_columns(market_data_list: List[MarketData]) -> Dict[str, np.ndarray]:
+        """
+        Convert chronological MarketData rows to columnar arrays.
+
+        Args:
+            market_data_list: MarketData objects in chronological order
+
+        Returns:
+            Dictionary with "timestamp" (datetime64) and float "open", "high",
+            "low", "close", "volume" arrays
+        """
+        return {
+            "timestamp": np.array([d.timestamp for d in market_data_list], dtype="datetime64[us]"),
+            "open": np.array([d.open for d in market_data_list], dtype=np.float64),
+            "high": np.array([d.high for d in market_data_list], dtype=np.float64),
+            "low": np.array([d.low for d in market_data_list], dtype=np.float64),
+            "close": np.array([d.close for d in market_data_list], dtype=np.float64),
+            "volume": np.array([d.volume for d in market_data_list], dtype=np.float64),
+        }
+
+    @staticmethod
+    def bucket_starts(timestamps: np.ndarray, interval: TimeInterval) -> np.ndarray:
+        """
+        Start of the ``interval`` bucket containing each timestamp.
+
+        Fixed-length intervals are aligned to midnight, weeks start on
+        Monday and months on the 1st.
+
+        Args:
+            timestamps: datetime64 array
+            interval: Target interval
+
+        Returns:
+            datetime64[us] array of bucket starts
+        """
+        timestamps = timestamps.astype("datetime64[us]")
+        if interval == TimeInterval.ONE_MONTH:
+            return timestamps.astype("datetime64[M]").astype("datetime64[us]")
+        if interval == TimeInterval.ONE_WEEK:
+            days = timestamps.astype("datetime64[D]")
+            # 1970-01-01 was a Thursday (weekday 3)
+            weekday = (days.astype(np.int64) + 3) % 7
+            return (days - weekday).astype("datetime64[us]")
+
+        width = np.int64(INTERVAL_SECONDS[interval] * 1_000_000)
+        micros = timestamps.astype(np.int64)
+        return (micros - micros % width).astype("datetime64[us]")
+
+    @staticmethod
+    def resample_columns(columns: Dict[str, np.ndarray], interval: TimeInterval) -> Dict[str, np.ndarray]:
+        """
+        Aggregate chronological bars into coarser ``interval`` bars.
+
+        Fully vectorized: bucket boundaries are found with one comparison
+        and OHLCV is reduced per bucket with ``ufunc.reduceat``.
+
+        Args:
+            columns: Columnar bars in chronological order (``to_columns`` format)
+            interval: Target interval
+
+        Returns:
+            Columnar bars labelled with their bucket start
+        """
+        if len(columns["timestamp"]) == 0:
+            return {key: values[:0] for key, values in columns.items()}
+
+        buckets = MarketDataService.bucket_starts(columns["timestamp"], interval)
+        starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+
+        bars = MarketDataService._merge_bars(columns, starts)
+        bars["timestamp"] = buckets[starts]
+        return bars
+
+    @staticmethod
+    def _merge_bars(columns: Dict[str, np.ndarray], starts: np.ndarray) -> Dict[str, np.ndarray]:
+        """Merge each run of bars beginning at ``starts`` into one OHLCV bar."""
+        ends = np.append(starts[1:], len(columns["timestamp"])) - 1
+        return {
+            "timestamp": columns["timestamp"][starts],
+            "open": columns["open"][starts],
+            "high": np.maximum.reduceat(columns["high"], starts),
+            "low": np.minimum.reduceat(columns["low"], starts),
+            "close": columns["close"][ends],
+            "volume": np.add.reduceat(columns["volume"], starts),
+        }
+
+    @staticmethod
+    def downsample_ohlc(columns: Dict[str, np.ndarray], max_points: int) -> Dict[str, np.ndarray]:
+        """
+        Reduce bars to at most ``max_points`` by merging equal-sized runs.
+
+        Each merged bar keeps the run's first open, highest high, lowest
+        low, last close and total volume, so candles keep their extremes.
+
+        Args:
+            columns: Columnar bars in chronological order
+            max_points: Maximum number of bars to return
+
+        Returns:
+            Columnar bars labelled with the first timestamp of each run
+        """
+        n = len(columns["timestamp"])
+        if n <= max_points:
+            return columns
+
+        starts = np.linspace(0, n, max_points, endpoint=False).astype(np.int64)
+        return MarketDataService._merge_bars(columns, starts)
+
+    @staticmethod
+    def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+        """
+        Select points with Largest-Triangle-Three-Buckets.
+
+        Keeps the first and last points and, from each of ``max_points - 2``
+        equal buckets in between, the point forming the largest triangle
+        with the previously kept point and the next bucket's average.
+
+        Args:
+            x: Monotonic x values (e.g. timestamps as integers)
+            y: Values to preserve the shape of
+            max_points: Number of points to keep (at least 3)
+
+        Returns:
+            Sorted indices of the kept points
+        """
+        n = len(y)
+        if n <= max_points or max_points < 3:
+            return np.arange(n)
+
+        x = x.astype(np.float64)
+        y = y.astype(np.float64)
+        edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+        edges = np.append(edges, n)
+
+        selected = np.empty(max_points, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+        previous = 0
+        for bucket in range(max_points - 2):
+            begin, end = edges[bucket], edges[bucket + 1]
+            next_end = edges[bucket + 2]
+            avg_x = x[end:next_end].mean()
+            avg_y = y[end:next_end].mean()
+
+            area = np.abs(
+                (x[previous] - avg_x) * (y[begin:end] - y[previous])
+                - (x[previous] - x[begin:end]) * (avg_y - y[previous])
+            )
+            previous = begin + int(np.argmax(area))
+            selected[bucket + 1] = previous
+
+        return selected
+
+    @staticmethod
+    async def resample_market_data(
+        db: AsyncSession,
+        symbols: List[str],
+        interval: TimeInterval,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, List[MarketDataCreate]]:
+        """
+        Derive ``interval`` bars from stored finer bars instead of downloading them.
+
+        Intraday intervals are built from 1m rows and weekly/monthly bars
+        from 1d rows (see ``RESAMPLE_SOURCES``). Source rows of all symbols
+        are loaded in one columnar query. Callers choose whether to save
+        the result with ``upsert_market_data``.
+
+        Args:
+            db: Database session
+            symbols: Stock symbols
+            interval: Target interval
+            start_date: Start of the source range (optional; align it to a
+                bucket start to avoid a partial first bar)
+            end_date: End of the source range (optional)
+
+        Returns:
+            Resampled bars per symbol in chronological order (symbols
+            without source data are omitted)
+
+        Raises:
+            ValueError: If the interval cannot be resampled from stored bars
+        """
+        source = RESAMPLE_SOURCES.get(interval)
+        if source is None:
+            raise ValueError(f"{interval.value} bars cannot be resampled from stored bars")
+
+        data = await MarketDataService.get_market_data_bulk(
+            db=db,
+            symbols=symbols,
+            interval=source,
+            start_date=start_date,
+            end_date=end_date,
+            limit=None
+        )
+
+        resampled = {}
+        for symbol, columns in data.items():
+            bars = MarketDataService.resample_columns(columns, interval)
+            resampled[symbol] = [
+                MarketDataCreate(
+                    symbol=symbol,
+                    timestamp=timestamp,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume,
+                    interval=interval
+                )
+                for timestamp, open_, high, low, close, volume in zip(
+                    bars["timestamp"].tolist(),
+                    bars["open"].tolist(),
+                    bars["high"].tolist(),
+                    bars["low"].tolist(),
+                    bars["close"].tolist(),
+                    bars["volume"].tolist()
+                )
+            ]
+
+        logger.info(
+            f"Resampled {source.value} bars of {len(resampled)} symbols into "
+            f"{sum(len(bars) for bars in resampled.values())} {interval.value} bars"
+        )
+        return resampled
+
     @staticmethod
     async def get_latest_price(
         db: AsyncSession,
@@ -0,0 +1,143 @@
+"""
+Short-TTL cache for KIS current-price quotes.
+
+Many users polling the same symbol would otherwise each cost a KIS
+``inquire-price`` call. Quotes are cached per trading mode and symbol for
+a short TTL, and concurrent misses for the same key share one in-flight
+KIS request.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, time as dt_time
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+from app.services.kis_quotation import KISQuotation
+
+logger = logging.getLogger(__name__)
+
+KRX_TIMEZONE = ZoneInfo("Asia/Seoul")
+KRX_MARKET_OPEN = dt_time(9, 0)
+KRX_MARKET_CLOSE = dt_time(15, 30)
+
+
+def is_market_hours(now: Optional[datetime] = None) -> bool:
+    """
+    Check whether the KRX regular session is open.
+
+    Args:
+        now: Time to check (default: current time)
+
+    Returns:
+        True on weekdays between 09:00 and 15:30 KST
+    """
+    now = (now or datetime.now(KRX_TIMEZONE)).astimezone(KRX_TIMEZONE)
+    return now.weekday() < 5 and KRX_MARKET_OPEN <= now.time() <= KRX_MARKET_CLOSE
+
+
+def quote_ttl(now: Optional[datetime] = None) -> float:
+    """
+    TTL for a freshly fetched quote.
+
+    Args:
+        now: Time of the fetch (default: current time)
+
+    Returns:
+        Seconds the quote may be served from cache
+    """
+    if is_market_hours(now):
+        return settings.QUOTE_CACHE_TTL_MARKET_HOURS
+    return settings.QUOTE_CACHE_TTL_AFTER_HOURS
+
+
+class QuoteCache:
+    """
+    Per-symbol quote cache with request coalescing.
+
+    Entries are keyed by ``(trading_mode, symbol)`` since real and mock
+    servers report their own prices. Failed fetches are not cached.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def get_current_price(self, quotation: KISQuotation, symbol: str) -> Dict[str, Any]:
+        """
+        Get the current price of a symbol, from cache when fresh.
+
+        Args:
+            quotation: KIS quotation service used on a cache miss
+            symbol: Stock symbol
+
+        Returns:
+            KIS ``inquire-price`` response
+
+        Raises:
+            Exception: Whatever the KIS request raised, for every waiter
+        """
+        key = (quotation.client.trading_mode, symbol)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(self._fetch(key, quotation, symbol))
+            self._in_flight[key] = task
+        else:
+            self.coalesced += 1
+
+        # Shield so one cancelled request does not cancel the others' fetch
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: Tuple[str, str], quotation: KISQuotation, symbol: str) -> Dict[str, Any]:
+        """Fetch a quote from KIS and cache it."""
+        try:
+            response = await quotation.get_current_price(symbol)
+            ttl = quote_ttl()
+            if ttl > 0 and "output" in response:
+                self._entries[key] = (time.monotonic() + ttl, response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        Drop cached quotes.
+
+        Args:
+            symbol: Only drop this symbol (default: everything)
+        """
+        if symbol is None:
+            self._entries.clear()
+        else:
+            for key in [key for key in self._entries if key[1] == symbol]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss and coalescing counters."""
+        now = time.monotonic()
+        return {
+            "entries": sum(1 for expires_at, _ in self._entries.values() if expires_at > now),
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "ttl_seconds": quote_ttl(),
+        }
+
+
+# Process-wide quote cache
+quote_cache = QuoteCache()
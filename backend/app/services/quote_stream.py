@@ -0,0 +1,321 @@
+"""
+Server-side fan-out of realtime quotes.
+
+Each ``(trading_mode, symbol)`` with at least one subscriber has a single
+upstream poller, however many connections watch it. Pollers read through
+the quote cache, so stream subscribers and ``/market/price`` share the
+same KIS calls. Updates are pushed to per-connection queues.
+
+A poller calls KIS with the client of one of its subscribers. When that
+subscriber leaves, the poller switches to another subscriber's client; when
+an app key's credentials are changed or deleted, every subscription using
+it is revoked so no poller keeps the old client.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.schemas.market_data import PriceResponse
+from app.services.kis_quotation import KISQuotation
+from app.services.quote_cache import quote_cache
+
+logger = logging.getLogger(__name__)
+
+QuoteKey = Tuple[str, str]
+
+POLL_ERROR_BACKOFF_SECONDS = 5.0
+
+
+def _mode_name(trading_mode: Any) -> str:
+    """Normalize a TradingMode or string to "REAL" / "MOCK"."""
+    return str(getattr(trading_mode, "value", trading_mode)).upper()
+
+
+def to_price_response(symbol: str, kis_response: Dict[str, Any]) -> PriceResponse:
+    """
+    Convert a KIS ``inquire-price`` response to a PriceResponse.
+
+    Args:
+        symbol: Stock symbol
+        kis_response: KIS response containing ``output``
+
+    Returns:
+        PriceResponse with price, change, volume and trade timestamp
+    """
+    output = kis_response['output']
+
+    # stck_bsop_date: 영업일자 (YYYYMMDD), stck_cntg_hour: 체결시간 (HHMMSS)
+    trade_date = output.get('stck_bsop_date', '')
+    trade_time = output.get('stck_cntg_hour', '')
+    if trade_date and trade_time:
+        try:
+            timestamp = datetime.strptime(f"{trade_date}{trade_time}", "%Y%m%d%H%M%S")
+        except ValueError:
+            logger.warning(f"Failed to parse KIS timestamp: {trade_date}{trade_time}")
+            timestamp = datetime.now()
+    else:
+        logger.warning("KIS API response missing date/time fields")
+        timestamp = datetime.now()
+
+    return PriceResponse(
+        symbol=symbol,
+        price=float(output.get('stck_prpr', 0)),  # 현재가
+        change=float(output.get('prdy_vrss', 0)),  # 전일대비
+        change_percent=float(output.get('prdy_ctrt', 0)),  # 전일대비율
+        volume=float(output.get('acml_vol', 0)),  # 누적거래량
+        timestamp=timestamp
+    )
+
+
+class QuoteSubscription:
+    """
+    One client connection's view of the hub.
+
+    Quotes for the subscribed symbols arrive on ``queue``. When the client
+    falls behind, the oldest queued quote is dropped so it always catches
+    up to the latest prices.
+    """
+
+    def __init__(self, hub: "QuoteStreamHub", quotation: KISQuotation, queue_size: int):
+        """
+        Initialize subscription.
+
+        Args:
+            hub: Hub delivering the quotes
+            quotation: KIS quotation service used to start pollers
+            queue_size: Maximum number of undelivered quotes
+        """
+        self.hub = hub
+        self.quotation = quotation
+        self.trading_mode = quotation.client.trading_mode
+        self.symbols: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.revoked = False
+
+    def subscribe(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Start receiving quotes for symbols.
+
+        Args:
+            symbols: Symbols to add
+
+        Returns:
+            Symbols that were newly subscribed
+
+        Raises:
+            ValueError: If the subscription was revoked or the per-connection
+                symbol limit would be exceeded
+        """
+        if self.revoked:
+            raise ValueError("KIS credentials changed; reconnect to keep streaming")
+
+        added = [symbol for symbol in dict.fromkeys(symbols) if symbol not in self.symbols]
+        if len(self.symbols) + len(added) > settings.QUOTE_STREAM_MAX_SYMBOLS:
+            raise ValueError(f"At most {settings.QUOTE_STREAM_MAX_SYMBOLS} symbols per connection")
+
+        for symbol in added:
+            self.symbols.add(symbol)
+            self.hub._attach(self, symbol)
+        return added
+
+    def unsubscribe(self, symbols: Iterable[str]) -> List[str]:
+        """
+        Stop receiving quotes for symbols.
+
+        Args:
+            symbols: Symbols to remove
+
+        Returns:
+            Symbols that were unsubscribed
+        """
+        removed = [symbol for symbol in dict.fromkeys(symbols) if symbol in self.symbols]
+        for symbol in removed:
+            self.symbols.discard(symbol)
+            self.hub._detach(self, symbol)
+        return removed
+
+    def close(self) -> None:
+        """Unsubscribe from everything and leave the hub."""
+        self.unsubscribe(list(self.symbols))
+        self.hub._connections.discard(self)
+
+    def revoke(self) -> None:
+        """Close because the credentials behind ``quotation`` are no longer valid."""
+        self.revoked = True
+        self.close()
+        # Wake the consumer with the end-of-stream marker
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    def deliver(self, quote: Dict[str, Any]) -> None:
+        """Queue a quote, dropping the oldest one if the queue is full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(quote)
+
+    async def get(self) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the next quote.
+
+        Returns:
+            Next quote, or None once the subscription has been revoked
+        """
+        return await self.queue.get()
+
+
+class QuoteStreamHub:
+    """Shares one upstream quote source per symbol among all subscribers."""
+
+    def __init__(self):
+        """Initialize hub with no pollers."""
+        self._subscribers: Dict[QuoteKey, Set[QuoteSubscription]] = {}
+        self._connections: Set[QuoteSubscription] = set()
+        # Subscriber whose KIS client each poller uses
+        self._sources: Dict[QuoteKey, QuoteSubscription] = {}
+        self._pollers: Dict[QuoteKey, asyncio.Task] = {}
+        self._latest: Dict[QuoteKey, Dict[str, Any]] = {}
+        self.published = 0
+
+    def connect(self, quotation: KISQuotation) -> QuoteSubscription:
+        """
+        Open a subscription for one client connection.
+
+        Args:
+            quotation: KIS quotation service of the connecting user
+
+        Returns:
+            Subscription with no symbols yet
+        """
+        subscription = QuoteSubscription(self, quotation, settings.QUOTE_STREAM_QUEUE_SIZE)
+        self._connections.add(subscription)
+        return subscription
+
+    def revoke(self, app_key: Optional[str], trading_mode: Any) -> int:
+        """
+        Revoke every subscription using an app key whose credentials changed.
+
+        Pollers that used one of their clients switch to another subscriber's
+        client, or stop if none is left.
+
+        Args:
+            app_key: KIS API app key (None is ignored)
+            trading_mode: Trading mode of the credentials
+
+        Returns:
+            Number of revoked subscriptions
+        """
+        if not app_key:
+            return 0
+
+        mode = _mode_name(trading_mode)
+        revoked = [
+            subscription for subscription in self._connections
+            if getattr(subscription.quotation.client, "app_key", None) == app_key
+            and _mode_name(subscription.trading_mode) == mode
+        ]
+        for subscription in revoked:
+            subscription.revoke()
+
+        if revoked:
+            logger.info(f"[QuoteStream] Revoked {len(revoked)} subscription(s) for a {mode} app key")
+        return len(revoked)
+
+    def _attach(self, subscription: QuoteSubscription, symbol: str) -> None:
+        """Add a subscriber to a symbol, starting its poller if needed."""
+        key = (subscription.trading_mode, symbol)
+        self._subscribers.setdefault(key, set()).add(subscription)
+
+        if key not in self._pollers:
+            self._sources[key] = subscription
+            self._pollers[key] = asyncio.create_task(self._poll(key))
+            logger.info(f"[QuoteStream] Started poller for {symbol} ({key[0]})")
+        elif key in self._latest:
+            # Late joiners get the current quote right away
+            subscription.deliver(self._latest[key])
+
+    def _detach(self, subscription: QuoteSubscription, symbol: str) -> None:
+        """Remove a subscriber, rebinding or stopping the poller if it used its client."""
+        key = (subscription.trading_mode, symbol)
+        subscribers = self._subscribers.get(key)
+        if subscribers is None:
+            return
+
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[key]
+            self._latest.pop(key, None)
+            self._sources.pop(key, None)
+            poller = self._pollers.pop(key, None)
+            if poller is not None:
+                poller.cancel()
+            logger.info(f"[QuoteStream] Stopped poller for {symbol} ({key[0]})")
+        elif self._sources.get(key) is subscription:
+            self._sources[key] = next(iter(subscribers))
+            logger.info(f"[QuoteStream] Rebound poller for {symbol} ({key[0]}) to another subscriber")
+
+    def publish(self, key: QuoteKey, quote: Dict[str, Any]) -> None:
+        """
+        Fan a quote out to every subscriber of its symbol.
+
+        Quotes identical to the last published one are not resent.
+
+        Args:
+            key: ``(trading_mode, symbol)``
+            quote: JSON-serializable quote
+        """
+        if self._latest.get(key) == quote or key not in self._subscribers:
+            return
+
+        self._latest[key] = quote
+        self.published += 1
+        for subscription in self._subscribers[key]:
+            subscription.deliver(quote)
+
+    async def _poll(self, key: QuoteKey) -> None:
+        """Poll KIS for one symbol until cancelled, using the current source's client."""
+        symbol = key[1]
+        while True:
+            delay = settings.QUOTE_STREAM_POLL_INTERVAL
+            try:
+                quotation = self._sources[key].quotation
+                response = await quote_cache.get_current_price(quotation, symbol)
+                if 'output' in response:
+                    self.publish(key, to_price_response(symbol, response).model_dump(mode="json"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"[QuoteStream] Poll failed for {symbol}: {e}")
+                delay = max(delay, POLL_ERROR_BACKOFF_SECONDS)
+
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return poller and subscriber counts."""
+        return {
+            "pollers": len(self._pollers),
+            "subscriptions": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "published": self.published,
+        }
+
+    async def close(self) -> None:
+        """Stop all pollers."""
+        pollers = list(self._pollers.values())
+        for poller in pollers:
+            poller.cancel()
+        await asyncio.gather(*pollers, return_exceptions=True)
+
+        self._pollers.clear()
+        self._subscribers.clear()
+        self._connections.clear()
+        self._sources.clear()
+        self._latest.clear()
+
+
+# Process-wide quote stream hub
+quote_stream_hub = QuoteStreamHub()
@@ -0,0 +1,183 @@
+"""Strategy execution service for running strategies over many symbols."""
+
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.strategy import BaseStrategy, ColumnarMarketData, Signal
+from app.models.market_data import TimeInterval
+from app.services.market_data_service import MarketDataService
+
+logger = logging.getLogger(__name__)
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Get the shared process pool for CPU-heavy strategy evaluation.
+
+    Returns:
+        ProcessPoolExecutor, or None if STRATEGY_PROCESS_POOL_WORKERS is 0
+    """
+    global _process_pool
+    if settings.STRATEGY_PROCESS_POOL_WORKERS <= 0:
+        return None
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=settings.STRATEGY_PROCESS_POOL_WORKERS)
+        logger.info(
+            f"[StrategyExecution] Started process pool with "
+            f"{settings.STRATEGY_PROCESS_POOL_WORKERS} workers"
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool (application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=True, cancel_futures=True)
+        _process_pool = None
+        logger.info("[StrategyExecution] Process pool shut down")
+
+
+def _run_batch_in_process(
+    strategy: BaseStrategy,
+    market_data_by_symbol: Dict[str, ColumnarMarketData]
+) -> Dict[str, List[Signal]]:
+    """Process pool entry point: evaluate a strategy batch in a worker."""
+    return asyncio.run(strategy.generate_signals_batch(market_data_by_symbol))
+
+
+class StrategyExecutionService:
+    """Service for loading market data and evaluating strategies over symbol lists."""
+
+    @staticmethod
+    async def load_market_data(
+        db: AsyncSession,
+        symbols: List[str],
+        interval: TimeInterval,
+        start_date: datetime,
+        end_date: datetime,
+        limit: int = 100,
+        concurrency: int = 1,
+        session_factory: Optional[async_sessionmaker] = None
+    ) -> Dict[str, ColumnarMarketData]:
+        """
+        Load columnar market data for many symbols.
+
+        Symbols are loaded with ``MarketDataService.get_market_data_bulk``.
+        With ``concurrency`` of 1 that is a single query on ``db``; higher
+        values split the symbols into ``concurrency`` chunks queried at once,
+        each on its own session from ``session_factory`` (an AsyncSession
+        must not be shared between concurrent tasks).
+
+        Args:
+            db: Request database session (single-query mode)
+            symbols: Stock symbols
+            interval: Time interval
+            start_date: Start date
+            end_date: End date
+            limit: Maximum number of bars per symbol
+            concurrency: Maximum number of concurrent queries
+            session_factory: Session factory for concurrent mode
+
+        Returns:
+            Columnar market data per symbol, in request order; symbols without
+            data or whose query failed are omitted
+        """
+        symbols = list(dict.fromkeys(symbols))
+
+        async def load(session: AsyncSession, chunk: List[str]) -> Dict[str, ColumnarMarketData]:
+            try:
+                return await MarketDataService.get_market_data_bulk(
+                    db=session,
+                    symbols=chunk,
+                    interval=interval,
+                    start_date=start_date,
+                    end_date=end_date,
+                    limit=limit
+                )
+            except Exception as e:
+                logger.error(
+                    f"[StrategyExecution] Error loading market data for "
+                    f"{len(chunk)} symbol(s) ({chunk[0]}...): {e}"
+                )
+                return {}
+
+        if concurrency <= 1 or session_factory is None or len(symbols) <= 1:
+            loaded = await load(db, symbols)
+        else:
+            chunk_size = -(-len(symbols) // concurrency)
+            chunks = [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+            async def load_with_own_session(chunk: List[str]) -> Dict[str, ColumnarMarketData]:
+                async with session_factory() as session:
+                    return await load(session, chunk)
+
+            loaded = {}
+            for part in await asyncio.gather(*(load_with_own_session(c) for c in chunks)):
+                loaded.update(part)
+
+        missing = [symbol for symbol in symbols if symbol not in loaded]
+        if missing:
+            logger.warning(
+                f"[StrategyExecution] No market data found for {len(missing)} symbol(s), "
+                f"skipping: {', '.join(missing[:10])}{'...' if len(missing) > 10 else ''}"
+            )
+
+        return {symbol: loaded[symbol] for symbol in symbols if symbol in loaded}
+
+    @staticmethod
+    async def generate_signals(
+        strategy: BaseStrategy,
+        market_data_by_symbol: Dict[str, ColumnarMarketData]
+    ) -> Dict[str, List[Signal]]:
+        """
+        Evaluate a strategy over all loaded symbols.
+
+        Large batches are offloaded to the process pool when one is
+        configured, keeping indicator math off the event loop. The symbols
+        are split into one chunk per worker and the results merged.
+
+        Args:
+            strategy: Strategy instance
+            market_data_by_symbol: Columnar market data per symbol
+
+        Returns:
+            Signals per evaluated symbol
+        """
+        pool = None
+        if len(market_data_by_symbol) >= settings.STRATEGY_PROCESS_POOL_MIN_SYMBOLS:
+            pool = get_process_pool()
+
+        if pool is None:
+            return await strategy.generate_signals_batch(market_data_by_symbol)
+
+        symbols = list(market_data_by_symbol)
+        workers = max(1, min(settings.STRATEGY_PROCESS_POOL_WORKERS, len(symbols)))
+        chunk_size = -(-len(symbols) // workers)
+        chunks = [
+            {symbol: market_data_by_symbol[symbol] for symbol in symbols[i:i + chunk_size]}
+            for i in range(0, len(symbols), chunk_size)
+        ]
+
+        logger.info(
+            f"[StrategyExecution] Offloading {len(symbols)} symbols "
+            f"to process pool in {len(chunks)} chunk(s)"
+        )
+        loop = asyncio.get_running_loop()
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, _run_batch_in_process, strategy, chunk)
+            for chunk in chunks
+        ))
+
+        signals_by_symbol: Dict[str, List[Signal]] = {}
+        for part in parts:
+            signals_by_symbol.update(part)
+        return signals_by_symbol
@@ -0,0 +1,153 @@
+"""Async token-bucket rate limiter with priority lanes."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Any, Dict, List, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket shared by concurrent coroutines.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire`` waits until enough tokens are available, so any number of
+    workers can share one bucket without exceeding the configured rate.
+    Any one-second window can admit up to ``capacity + rate`` requests, so
+    the default capacity of 1 paces requests evenly instead of letting a
+    full bucket double the budget after an idle period.
+
+    Waiters are served by priority (lower value first) and in arrival order
+    within a priority, so a high-priority request that arrives while others
+    are queued takes the next available token. Wait times are tracked per
+    priority lane.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: 1, no bursts)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+        # Heap of [priority, sequence, tokens, future]
+        self._waiters: List[List[Any]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.acquired = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self._lanes: Dict[int, Dict[str, float]] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of coroutines waiting for tokens."""
+        return sum(1 for waiter in self._waiters if not waiter[3].done())
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0, priority: int = 0) -> float:
+        """
+        Take tokens from the bucket, waiting for them if necessary.
+
+        Args:
+            tokens: Number of tokens to take
+            priority: Lane of the request (lower values are served first)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket holds
+        """
+        if tokens > self.capacity:
+            raise ValueError("tokens exceeds bucket capacity")
+
+        start = time.monotonic()
+        self._refill()
+        if not self.queue_depth and self._tokens >= tokens:
+            self._tokens -= tokens
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, [priority, next(self._sequence), tokens, future])
+            if self._dispatcher is None or self._dispatcher.done():
+                self._dispatcher = asyncio.create_task(self._dispatch())
+            await future
+
+        waited = time.monotonic() - start
+        self._record(priority, waited)
+        return waited
+
+    async def _dispatch(self) -> None:
+        """Hand out tokens to queued waiters as they refill."""
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            self._refill()
+            if self._tokens >= tokens:
+                heapq.heappop(self._waiters)
+                self._tokens -= tokens
+                future.set_result(None)
+            else:
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def _record(self, priority: int, waited: float) -> None:
+        """Update overall and per-lane wait metrics."""
+        lane = self._lanes.setdefault(
+            priority, {"acquired": 0, "waits": 0, "total_wait_seconds": 0.0, "max_wait_seconds": 0.0}
+        )
+        self.acquired += 1
+        lane["acquired"] += 1
+        if waited > 0.001:
+            self.waits += 1
+            self.total_wait += waited
+            lane["waits"] += 1
+            lane["total_wait_seconds"] += waited
+            lane["max_wait_seconds"] = max(lane["max_wait_seconds"], waited)
+
+    def lane_wait(self, priority: int) -> float:
+        """Total seconds requests of one priority have waited."""
+        return self._lanes.get(priority, {}).get("total_wait_seconds", 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return acquisition, queue and per-lane wait counters."""
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "acquired": self.acquired,
+            "waits": self.waits,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "queue_depth": self.queue_depth,
+            "lanes": {
+                priority: {
+                    "acquired": lane["acquired"],
+                    "waits": lane["waits"],
+                    "total_wait_seconds": round(lane["total_wait_seconds"], 3),
+                    "max_wait_seconds": round(lane["max_wait_seconds"], 3),
+                    "avg_wait_seconds": round(lane["total_wait_seconds"] / lane["acquired"], 4),
+                }
+                for priority, lane in sorted(self._lanes.items())
+            },
+        }
@@ -0,0 +1,78 @@
+"""
+Collect daily market data for every stock in the stocks table
+- Uses the KIS credentials from settings (KIS_APP_KEY, KIS_APP_SECRET, ...)
+- Resume an interrupted run with --job-id
+- Backfill years of history with --history-start YYYY-MM-DD
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import asyncio
+from datetime import date
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.services.kis_client import KISClient, KIS_REAL_URL
+from app.services.kis_quotation import KISQuotation
+from app.services.market_data_collector import MarketDataCollector
+
+
+async def collect_daily_data(args):
+    """Collect daily bars for the selected universe"""
+    if not settings.KIS_APP_KEY or not settings.KIS_APP_SECRET:
+        print("KIS_APP_KEY and KIS_APP_SECRET must be set")
+        return
+
+    kis_client = KISClient(
+        app_key=settings.KIS_APP_KEY,
+        app_secret=settings.KIS_APP_SECRET,
+        account_number=settings.KIS_ACCOUNT_NUMBER or "",
+        account_code=settings.KIS_ACCOUNT_CODE or "",
+        trading_mode="REAL" if settings.KIS_BASE_URL == KIS_REAL_URL else "MOCK",
+        base_url=settings.KIS_BASE_URL
+    )
+
+    async with AsyncSessionLocal() as session:
+        symbols = await MarketDataCollector.select_universe(
+            session,
+            market_type=args.market,
+            symbols=args.symbols
+        )
+
+    print(f"Collecting daily data for {len(symbols)} symbols...")
+    collector = MarketDataCollector(
+        quotation=KISQuotation(kis_client),
+        session_factory=AsyncSessionLocal,
+        concurrency=args.concurrency
+    )
+    progress = await collector.collect_daily(
+        symbols,
+        period=args.period,
+        job_id=args.job_id,
+        incremental=not args.full,
+        history_start=args.history_start
+    )
+
+    print(f"Job {progress.job_id}: {progress.status}")
+    print(f"  Symbols: {len(progress.completed_symbols)}/{progress.total_symbols}")
+    print(f"  Rows: {progress.rows_saved} ({progress.up_to_date_symbols} symbols already up to date)")
+    print(f"  Throughput: {progress.symbols_per_second} symbols/s, {progress.rows_per_second} rows/s")
+    print(f"  Rate limited: {progress.rate_limit_wait_seconds}s")
+    if progress.failed_symbols:
+        print(f"  Failed: {len(progress.failed_symbols)} symbols (rerun with --job-id {progress.job_id})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collect daily market data for all stocks")
+    parser.add_argument("--market", choices=["KOSPI", "KOSDAQ"], help="Only stocks of this market")
+    parser.add_argument("--symbols", nargs="+", help="Only these symbols")
+    parser.add_argument("--period", default="D", choices=["D", "W", "M"])
+    parser.add_argument("--concurrency", type=int, help="Concurrent KIS requests")
+    parser.add_argument("--job-id", help="Resume an interrupted job with its saved period and mode")
+    parser.add_argument("--full", action="store_true", help="Refetch the latest 100 bars of every symbol")
+    parser.add_argument("--history-start", type=date.fromisoformat, help="Backfill history back to this date")
+    asyncio.run(collect_daily_data(parser.parse_args()))
@@ -0,0 +1,64 @@
+"""
+Build live 1m/5m/10m/30m/1h/1d bars from the KIS realtime feed
+- Uses the KIS credentials from settings (KIS_APP_KEY, KIS_APP_SECRET, ...)
+- Writes closed bars to market_data in batches until interrupted
+- KIS allows 41 realtime subscriptions per session
+"""
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import asyncio
+
+from app.config import settings
+from app.db.session import AsyncSessionLocal
+from app.services.bar_aggregator import BarAggregator
+from app.services.kis_client import KISClient, KIS_REAL_URL
+from app.services.kis_realtime import KISRealtimeClient
+
+
+async def stream_live_bars(args):
+    """Aggregate realtime executions of the given symbols into bars"""
+    if not settings.KIS_APP_KEY or not settings.KIS_APP_SECRET:
+        print("KIS_APP_KEY and KIS_APP_SECRET must be set")
+        return
+
+    kis_client = KISClient(
+        app_key=settings.KIS_APP_KEY,
+        app_secret=settings.KIS_APP_SECRET,
+        account_number=settings.KIS_ACCOUNT_NUMBER or "",
+        account_code=settings.KIS_ACCOUNT_CODE or "",
+        trading_mode="REAL" if settings.KIS_BASE_URL == KIS_REAL_URL else "MOCK",
+        base_url=settings.KIS_BASE_URL
+    )
+
+    aggregator = BarAggregator(AsyncSessionLocal)
+    realtime = KISRealtimeClient(kis_client)
+    realtime.add_handler(aggregator.handle_event)
+    for symbol in args.symbols:
+        await realtime.subscribe(symbol)
+
+    print(f"Streaming {len(args.symbols)} symbols from {realtime.url} (Ctrl-C to stop)...")
+    realtime.start()
+    aggregator.start()
+    try:
+        while True:
+            await asyncio.sleep(args.report_every)
+            print(f"  {realtime.stats()} {aggregator.stats()}")
+    finally:
+        await realtime.close()
+        await aggregator.stop()
+        print(f"Stopped: {aggregator.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build live bars from the KIS realtime feed")
+    parser.add_argument("symbols", nargs="+", help="Symbols to subscribe to (at most 41)")
+    parser.add_argument("--report-every", type=float, default=60.0, help="Seconds between progress reports")
+    try:
+        asyncio.run(stream_live_bars(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from sqlalchemy.pool import StaticPool
 
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_db, get_session_factory
 from app.config import settings
 
 # Import all models to ensure they are registered with Base.metadata
@@ -65,6 +65,12 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture
+def session_factory(db_session: AsyncSession) -> async_sessionmaker:
+    """Session factory sharing the test database (for code opening its own sessions)."""
+    return TestSessionLocal
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client."""
@@ -77,6 +83,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestSessionLocal
 
     # Create test client with custom transport
     transport = ASGITransport(app=app)
@@ -97,6 +104,17 @@ def test_user_data() -> dict:
     }
 
 
+@pytest_asyncio.fixture
+async def auth_headers(client: AsyncClient, test_user_data: dict) -> dict:
+    """Register and log in the test user."""
+    await client.post("/api/v1/auth/register", json=test_user_data)
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": test_user_data["email"], "password": test_user_data["password"]},
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
 @pytest.fixture
 def test_user_data_2() -> dict:
     """Another test user data."""
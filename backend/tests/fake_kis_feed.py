@@ -0,0 +1,154 @@
+"""
+Local stand-in for the KIS realtime WebSocket server.
+
+Serves ``POST /oauth2/Approval`` and a WebSocket at ``/`` that speaks the
+KIS subscription protocol, so KISRealtimeClient can be exercised offline:
+
+    server = FakeKISFeedServer()
+    await server.start()
+    client = KISClient(..., base_url=server.http_url)
+    realtime = KISRealtimeClient(client, url=server.ws_url)
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import List, Optional, Set, Tuple
+
+from aiohttp import web
+
+from app.services.kis_realtime import TR_ID_EXECUTION, TR_ID_ORDER_BOOK
+
+APPROVAL_KEY = "fake-approval-key"
+
+
+def execution_values(symbol: str, price: float, volume: float, timestamp: datetime) -> List[str]:
+    """Build the 46 H0STCNT0 fields for one execution."""
+    values = ["0"] * 46
+    values[0] = symbol
+    values[1] = timestamp.strftime("%H%M%S")
+    values[2] = f"{price:.0f}"
+    values[4] = "-100"
+    values[5] = "-0.14"
+    values[7] = values[8] = values[9] = f"{price:.0f}"
+    values[12] = f"{volume:.0f}"
+    values[13] = f"{volume:.0f}"
+    values[33] = timestamp.strftime("%Y%m%d")
+    return values
+
+
+def order_book_values(symbol: str, best_ask: float, best_bid: float, timestamp: datetime) -> List[str]:
+    """Build the 59 H0STASP0 fields for one order book."""
+    values = ["0"] * 59
+    values[0] = symbol
+    values[1] = timestamp.strftime("%H%M%S")
+    for level in range(10):
+        values[3 + level] = f"{best_ask + level * 100:.0f}"
+        values[13 + level] = f"{best_bid - level * 100:.0f}"
+        values[23 + level] = values[33 + level] = "10"
+    values[43] = values[44] = "100"
+    return values
+
+
+class FakeKISFeedServer:
+    """In-process KIS realtime feed on an ephemeral localhost port."""
+
+    def __init__(self):
+        self.connections: Set[web.WebSocketResponse] = set()
+        self.subscriptions: Set[Tuple[str, str]] = set()
+        self.registrations: List[dict] = []
+        self.connection_count = 0
+        self.pongs = 0
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+        self.app = web.Application()
+        self.app.router.add_post("/oauth2/Approval", self._approval)
+        self.app.router.add_get("/", self._websocket)
+
+    @property
+    def http_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/"
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        await self.drop_connections()
+        await self._runner.cleanup()
+
+    async def _approval(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        assert body["grant_type"] == "client_credentials"
+        return web.json_response({"approval_key": APPROVAL_KEY})
+
+    async def _websocket(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections.add(ws)
+        self.connection_count += 1
+        try:
+            async for message in ws:
+                data = json.loads(message.data)
+                if data.get("header", {}).get("tr_id") == "PINGPONG":
+                    self.pongs += 1
+                    continue
+
+                self.registrations.append(data)
+                header, request_input = data["header"], data["body"]["input"]
+                key = (request_input["tr_id"], request_input["tr_key"])
+                if header["approval_key"] != APPROVAL_KEY:
+                    rt_cd, msg = "1", "invalid approval : NOT FOUND"
+                elif header["tr_type"] == "1":
+                    self.subscriptions.add(key)
+                    rt_cd, msg = "0", "SUBSCRIBE SUCCESS"
+                else:
+                    self.subscriptions.discard(key)
+                    rt_cd, msg = "0", "UNSUBSCRIBE SUCCESS"
+
+                await ws.send_str(json.dumps({
+                    "header": {"tr_id": key[0], "tr_key": key[1], "encrypt": "N"},
+                    "body": {"rt_cd": rt_cd, "msg_cd": "OPSP0000", "msg1": msg},
+                }))
+        finally:
+            self.connections.discard(ws)
+        return ws
+
+    async def send(self, frame: str) -> None:
+        """Send a raw frame to every connection."""
+        for ws in list(self.connections):
+            await ws.send_str(frame)
+
+    async def push_executions(self, symbol: str, prices: List[float], volume: float = 10) -> None:
+        """Push one frame with an execution record per price, if subscribed."""
+        if (TR_ID_EXECUTION, symbol) not in self.subscriptions:
+            return
+        now = datetime.now()
+        values = [v for price in prices for v in execution_values(symbol, price, volume, now)]
+        await self.send(f"0|{TR_ID_EXECUTION}|{len(prices):03d}|{'^'.join(values)}")
+
+    async def push_order_book(self, symbol: str, best_ask: float, best_bid: float) -> None:
+        """Push an order book frame, if subscribed."""
+        if (TR_ID_ORDER_BOOK, symbol) not in self.subscriptions:
+            return
+        values = order_book_values(symbol, best_ask, best_bid, datetime.now())
+        await self.send(f"0|{TR_ID_ORDER_BOOK}|001|{'^'.join(values)}")
+
+    async def ping(self) -> None:
+        """Send a PINGPONG heartbeat."""
+        await self.send(json.dumps({"header": {"tr_id": "PINGPONG", "datetime": datetime.now().strftime("%Y%m%d%H%M%S")}}))
+
+    async def drop_connections(self) -> None:
+        """Close every connection (simulates a server-side disconnect)."""
+        for ws in list(self.connections):
+            await ws.close()
+        self.subscriptions.clear()
+        await asyncio.sleep(0)
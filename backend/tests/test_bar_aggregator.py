@@ -0,0 +1,146 @@
+"""Test cases for the live bar aggregator."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.market_data import TimeInterval
+from app.services.bar_aggregator import BarAggregator
+from app.services.kis_realtime import RealtimeTick
+from app.services.market_data_service import MarketDataService
+
+OPEN_TIME = datetime(2024, 3, 4, 9, 0)
+
+
+def ohlcv(bar) -> tuple:
+    """OHLCV of a MarketData row."""
+    return (bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+
+class TestBarAggregator:
+    """Test tick-to-bar aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_builds_all_intervals_from_ticks(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """Closed bars of every interval are written with the right OHLCV."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE, TimeInterval.FIVE_MINUTES])
+
+        # 08:59 primes the aggregator (its bars are partial and not written)
+        aggregator.add_tick("005930", OPEN_TIME - timedelta(seconds=5), 99, 1)
+        for second, price, volume in [(0, 100, 10), (20, 103, 5), (40, 98, 7), (59, 101, 3), (61, 102, 4)]:
+            aggregator.add_tick("005930", OPEN_TIME + timedelta(seconds=second), price, volume)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=5), 104, 2)
+        await aggregator.flush()
+
+        minute = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_MINUTE)
+        five = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.FIVE_MINUTES)
+
+        assert [bar.timestamp for bar in minute] == [OPEN_TIME, OPEN_TIME + timedelta(minutes=1)]
+        assert ohlcv(minute[0]) == (100, 103, 98, 101, 25)
+        assert ohlcv(minute[1]) == (102, 102, 102, 102, 4)
+        assert [(bar.timestamp, ohlcv(bar)) for bar in five] == [(OPEN_TIME, (100, 103, 98, 102, 29))]
+        assert aggregator.current_bars("005930")[TimeInterval.FIVE_MINUTES]["close"] == 104
+        assert aggregator.stats()["bars_written"] == 3
+
+    @pytest.mark.asyncio
+    async def test_first_bar_after_start_is_not_written(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """A bar that started before the first tick seen would overwrite complete data."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE])
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(seconds=30), 100, 1)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(seconds=90), 101, 1)
+        await aggregator.flush()
+
+        assert await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_MINUTE) == []
+        assert aggregator.stats()["bars_closed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_elapsed_without_new_tick(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """Bars of quiet symbols close once their bucket has passed."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE])
+        aggregator.add_tick("005930", OPEN_TIME - timedelta(seconds=1), 99, 1)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(seconds=10), 100, 1)
+
+        assert aggregator.close_elapsed(OPEN_TIME + timedelta(seconds=59)) == 0
+        assert aggregator.close_elapsed(OPEN_TIME + timedelta(minutes=1)) == 1
+
+        # The next bar opens complete even though the row was reset
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=3, seconds=5), 105, 2)
+        aggregator.close_elapsed(OPEN_TIME + timedelta(minutes=4))
+        await aggregator.stop()
+
+        bars = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_MINUTE)
+        assert [bar.timestamp for bar in bars] == [OPEN_TIME, OPEN_TIME + timedelta(minutes=3)]
+        assert ohlcv(bars[1]) == (105, 105, 105, 105, 2)
+
+    @pytest.mark.asyncio
+    async def test_tick_after_time_based_close_is_late(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """A late tick for a bar closed by close_elapsed must not reopen and overwrite it."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE])
+        aggregator.add_tick("005930", OPEN_TIME - timedelta(seconds=1), 99, 1)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=1, seconds=10), 100, 5)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=1, seconds=30), 102, 3)
+        assert aggregator.close_elapsed(OPEN_TIME + timedelta(minutes=2)) == 1
+
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=1, seconds=50), 90, 1)
+        assert aggregator.current_bars("005930") == {}
+        assert aggregator.stats()["late_ticks"] == 1
+
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=2, seconds=5), 101, 2)
+        await aggregator.stop()
+
+        bars = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_MINUTE)
+        assert [(bar.timestamp, ohlcv(bar)) for bar in bars] == [
+            (OPEN_TIME + timedelta(minutes=1), (100, 102, 100, 102, 8)),
+            (OPEN_TIME + timedelta(minutes=2), (101, 101, 101, 101, 2)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_daily_bar_uses_session_values(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """Realtime ticks carry the day's open/high/low/volume for the daily bar."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_DAY])
+        aggregator.handle_event(RealtimeTick(
+            symbol="005930", timestamp=OPEN_TIME + timedelta(hours=5), price=71900, change=0, change_percent=0,
+            open=71000, high=72500, low=70500, volume=10, accumulated_volume=1500000
+        ))
+        aggregator.close_elapsed(OPEN_TIME + timedelta(days=1))
+        await aggregator.flush()
+
+        (bar,) = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_DAY)
+        assert bar.timestamp == datetime(2024, 3, 4)
+        assert ohlcv(bar) == (71000, 72500, 70500, 71900, 1500000)
+
+    def test_late_ticks_ignored(self, session_factory: async_sessionmaker):
+        """Ticks older than the open bar do not change it."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE, TimeInterval.FIVE_MINUTES])
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=1), 100, 1)
+        aggregator.add_tick("005930", OPEN_TIME + timedelta(seconds=30), 90, 1)
+
+        bars = aggregator.current_bars("005930")
+        assert bars[TimeInterval.ONE_MINUTE]["low"] == 100
+        assert bars[TimeInterval.FIVE_MINUTES]["low"] == 90
+        assert aggregator.stats()["late_ticks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batched_flush_and_retry(self, session_factory: async_sessionmaker, db_session: AsyncSession):
+        """Enough closed bars trigger a background write; failed writes are retried."""
+        aggregator = BarAggregator(session_factory, intervals=[TimeInterval.ONE_MINUTE], flush_rows=3)
+
+        def broken_factory():
+            raise RuntimeError("database unavailable")
+
+        aggregator.session_factory = broken_factory
+        for minute in range(4):
+            aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=minute), 100 + minute, 1)
+        assert await aggregator.flush() == 0
+        assert aggregator.stats()["pending"] == 2
+
+        aggregator.session_factory = session_factory
+        for minute in range(4, 6):
+            aggregator.add_tick("005930", OPEN_TIME + timedelta(minutes=minute), 100 + minute, 1)
+        await asyncio.sleep(0.05)
+
+        assert aggregator.stats()["pending"] == 0
+        bars = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_MINUTE)
+        assert [bar.close for bar in bars] == [101, 102, 103, 104]
@@ -0,0 +1,430 @@
+"""Test cases for technical indicators."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.core.indicators import (
+    calculate_sma,
+    calculate_ema,
+    calculate_sma_grid,
+    calculate_ema_grid,
+    detect_crossover,
+    find_crossovers,
+    vectorized,
+    IndicatorCache,
+    build_price_matrix,
+    compute_crossover_matrices,
+    SMAState,
+    EMAState,
+    RSIState,
+    MACDState,
+    ATRState,
+    CrossoverState,
+)
+
+
+def reference_sma(data, period):
+    """Per-bar window SMA used as the reference implementation."""
+    result = [None] * (period - 1)
+    for i in range(period - 1, len(data)):
+        result.append(sum(data[i - period + 1:i + 1]) / period)
+    return result
+
+
+def reference_ema(data, period):
+    """Per-bar recursive EMA used as the reference implementation."""
+    multiplier = 2 / (period + 1)
+    result = [None] * (period - 1)
+    result.append(sum(data[:period]) / period)
+    for i in range(period, len(data)):
+        result.append((data[i] - result[-1]) * multiplier + result[-1])
+    return result
+
+
+@pytest.fixture
+def prices() -> list:
+    """Random-walk closing prices."""
+    rng = np.random.default_rng(42)
+    return (70000 + np.cumsum(rng.normal(0, 500, 1500))).tolist()
+
+
+def assert_series_equal(actual, expected):
+    """Compare two list-API series, including None warm-up positions."""
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None
+        else:
+            assert a == pytest.approx(e, rel=1e-9)
+
+
+class TestMovingAverages:
+    """Test list API moving averages against reference loops."""
+
+    @pytest.mark.parametrize("period", [1, 5, 20, 120])
+    def test_sma_matches_reference(self, prices: list, period: int):
+        """Cumulative-sum SMA matches the per-window sum."""
+        assert_series_equal(calculate_sma(prices, period), reference_sma(prices, period))
+
+    @pytest.mark.parametrize("period", [1, 5, 20, 120])
+    def test_ema_matches_reference(self, prices: list, period: int):
+        """Block-filtered EMA matches the bar-by-bar recursion."""
+        assert_series_equal(calculate_ema(prices, period), reference_ema(prices, period))
+
+    def test_edge_cases(self):
+        """Empty input, invalid period and short input keep list semantics."""
+        assert calculate_sma([], 5) == []
+        assert calculate_ema([1.0, 2.0], 0) == []
+        assert calculate_sma([1.0, 2.0], 5) == [None, None]
+        assert calculate_ema([1.0, 2.0], 5) == [None, None]
+
+
+class TestGrids:
+    """Test multi-period sweeps against single-period calls."""
+
+    def test_sma_grid(self, prices: list):
+        """Every grid row equals calculate_sma for that period."""
+        periods = list(range(2, 62))
+        grid = calculate_sma_grid(prices, periods)
+
+        assert list(grid) == periods
+        for period in (2, 17, 61):
+            assert_series_equal(grid[period], calculate_sma(prices, period))
+
+    @pytest.mark.parametrize("grid", [calculate_sma_grid, calculate_ema_grid])
+    def test_grid_rejects_non_positive_periods(self, prices: list, grid):
+        """Invalid periods raise instead of being dropped from the result."""
+        with pytest.raises(ValueError):
+            grid(prices, [5, 0])
+        with pytest.raises(ValueError):
+            grid([], [-1])
+
+    def test_ema_grid(self, prices: list):
+        """Every grid row equals calculate_ema for that period."""
+        periods = [1, 3, 12, 26, 120, 2000]
+        grid = calculate_ema_grid(prices, periods)
+
+        for period in periods:
+            assert_series_equal(grid[period], calculate_ema(prices, period))
+
+
+class TestCrossovers:
+    """Test full-history crossover detection."""
+
+    def test_find_crossovers_matches_prefix_scan(self, prices: list):
+        """Every event equals detect_crossover on the corresponding prefix."""
+        fast = calculate_sma(prices, 5)
+        slow = calculate_sma(prices, 20)
+        expected = [
+            (i, detect_crossover(fast[:i + 1], slow[:i + 1]))
+            for i in range(len(prices))
+        ]
+        expected = [(i, c) for i, c in expected if c != "none"]
+
+        assert expected
+        assert find_crossovers(fast, slow) == expected
+
+    def test_find_crossovers_warm_up(self):
+        """None warm-up values never produce events."""
+        assert find_crossovers([None, None, 1.0, 3.0], [None, 2.0, 2.0, 2.0]) == [(3, "golden")]
+        assert find_crossovers([], []) == []
+
+
+class TestVectorized:
+    """Test NumPy indicator engine."""
+
+    def test_sma_matrix_with_padding(self, prices: list):
+        """Rows left-padded with NaN warm up from their first valid bar."""
+        row = np.array(prices[:50])
+        padded = np.concatenate([np.full(10, np.nan), row[10:]])
+        result = vectorized.sma(np.vstack([row, padded]), 5)
+
+        assert np.allclose(result[0], vectorized.sma(row, 5), equal_nan=True)
+        assert np.isnan(result[1, :14]).all()
+        assert np.allclose(result[1, 14:], result[0, 14:])
+
+    def test_ema_matrix_with_padding(self, prices: list):
+        """EMA seeds each row at its own first full window."""
+        row = np.array(prices[:50])
+        padded = np.concatenate([np.full(10, np.nan), row[10:]])
+        result = vectorized.ema(np.vstack([row, padded]), 5)
+
+        assert np.allclose(result[0], vectorized.ema(row, 5), equal_nan=True)
+        assert np.isnan(result[1, :14]).all()
+        assert np.allclose(result[1, 14:], vectorized.ema(row[10:], 5)[4:])
+
+
+class TestStreaming:
+    """Test incremental indicator states against the batch functions."""
+
+    def test_sma_state_matches_batch(self, prices: list):
+        """SMAState reproduces calculate_sma bar by bar."""
+        state = SMAState(20)
+        streamed = [state.update(p) for p in prices]
+        assert_series_equal(streamed, calculate_sma(prices, 20))
+
+    def test_ema_state_matches_batch(self, prices: list):
+        """EMAState reproduces calculate_ema bar by bar."""
+        state = EMAState(12)
+        streamed = [state.update(p) for p in prices]
+        assert_series_equal(streamed, calculate_ema(prices, 12))
+
+    def test_rsi_state_matches_batch(self, ohlcv: dict):
+        """RSIState reproduces vectorized.rsi bar by bar."""
+        state = RSIState(14)
+        streamed = [state.update(c) for c in ohlcv["close"]]
+        assert_series_equal(streamed, vectorized.to_list(vectorized.rsi(ohlcv["close"], 14)))
+
+    def test_macd_state_matches_batch(self, ohlcv: dict):
+        """MACDState reproduces all three vectorized.macd series."""
+        state = MACDState(12, 26, 9)
+        streamed = [state.update(c) for c in ohlcv["close"]]
+        batch = vectorized.macd(ohlcv["close"], 12, 26, 9)
+        for name in ("macd", "signal", "histogram"):
+            assert_series_equal([bar[name] for bar in streamed], vectorized.to_list(batch[name]))
+
+    def test_atr_state_matches_batch(self, ohlcv: dict):
+        """ATRState reproduces vectorized.atr bar by bar."""
+        high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+        state = ATRState(14)
+        streamed = [state.update(h, l, c) for h, l, c in zip(high, low, close)]
+        assert_series_equal(streamed, vectorized.to_list(vectorized.atr(high, low, close, 14)))
+        assert ATRState.from_history(high, low, close, 14).value == pytest.approx(streamed[-1])
+
+    @pytest.mark.parametrize("ma_type", ["SMA", "EMA"])
+    def test_crossover_state_matches_detect(self, prices: list, ma_type: str):
+        """CrossoverState agrees with detect_crossover on every prefix."""
+        batch = calculate_ema if ma_type == "EMA" else calculate_sma
+        state = CrossoverState(5, 20, ma_type)
+        for i, price in enumerate(prices[:300]):
+            window = prices[:i + 1]
+            expected = detect_crossover(batch(window, 5), batch(window, 20))
+            assert state.update(price) == expected
+
+
+class TestCrossSectional:
+    """Test universe matrix computation."""
+
+    def test_matrix_matches_per_symbol(self, prices: list):
+        """Each row of the matrix result equals the single-symbol computation."""
+        series = {
+            "005930": prices[:120],
+            "000660": prices[200:290],
+            "035420": prices[400:430],
+        }
+        symbols, closes = build_price_matrix(series)
+        result = compute_crossover_matrices(closes, 5, 20, "EMA")
+
+        assert symbols == list(series.keys())
+        assert closes.shape == (3, 120)
+        for row, symbol in enumerate(symbols):
+            data = series[symbol]
+            fast = calculate_ema(data, 5)
+            slow = calculate_ema(data, 20)
+            offset = closes.shape[1] - len(data)
+            assert_series_equal(vectorized.to_list(result["fast"][row, offset:]), fast)
+            assert_series_equal(vectorized.to_list(result["slow"][row, offset:]), slow)
+
+            expected = {"golden": 1, "death": -1, "none": 0}[detect_crossover(fast, slow)]
+            assert result["crossover"][row, -1] == expected
+
+
+@pytest.fixture
+def ohlcv(prices: list) -> dict:
+    """OHLCV arrays derived from the random-walk closes."""
+    rng = np.random.default_rng(7)
+    close = np.array(prices[:400])
+    open_ = close + rng.normal(0, 200, close.size)
+    high = np.maximum(open_, close) + rng.uniform(0, 300, close.size)
+    low = np.minimum(open_, close) - rng.uniform(0, 300, close.size)
+    volume = rng.integers(1000, 100000, close.size).astype(float)
+    return {"open": open_, "high": high, "low": low, "close": close, "volume": volume}
+
+
+def reference_wilder(values, period):
+    """Wilder smoothing seeded with the mean of the first ``period`` values."""
+    result = [None] * period
+    avg = sum(values[1:period + 1]) / period
+    result.append(avg)
+    for v in values[period + 1:]:
+        avg = (avg * (period - 1) + v) / period
+        result.append(avg)
+    return result[1:]
+
+
+class TestOscillators:
+    """Test extended indicator library against reference values."""
+
+    def test_rsi_published_values(self):
+        """RSI(14) matches the classic Wilder worked example."""
+        closes = [
+            44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84, 46.08,
+            45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41, 46.22, 45.64,
+            46.21, 46.25, 45.71, 46.45, 45.78, 45.35, 44.03, 44.18, 44.22, 44.57,
+            43.42, 42.66, 43.13,
+        ]
+        expected = [
+            70.53, 66.32, 66.55, 69.41, 66.36, 57.97, 62.93, 63.26, 56.06, 62.38,
+            54.71, 50.42, 39.99, 41.46, 41.87, 45.46, 37.30, 33.08, 37.77,
+        ]
+        result = vectorized.rsi(closes, 14)
+
+        assert np.isnan(result[:14]).all()
+        assert result[14:] == pytest.approx(expected, abs=0.1)
+
+    def test_rsi_matches_reference(self, ohlcv: dict):
+        """RSI equals a bar-by-bar Wilder computation."""
+        close = ohlcv["close"].tolist()
+        changes = [0.0] + [b - a for a, b in zip(close, close[1:])]
+        gains = reference_wilder([max(c, 0.0) for c in changes], 14)
+        losses = reference_wilder([max(-c, 0.0) for c in changes], 14)
+        expected = [100 - 100 / (1 + g / l) for g, l in zip(gains[13:], losses[13:])]
+
+        assert vectorized.rsi(ohlcv["close"], 14)[14:] == pytest.approx(expected, rel=1e-9)
+
+    def test_macd_matches_ema(self, ohlcv: dict):
+        """MACD line, signal and histogram follow their EMA definitions."""
+        close = ohlcv["close"].tolist()
+        result = vectorized.macd(ohlcv["close"], 12, 26, 9)
+        line = [f - s for f, s in zip(calculate_ema(close, 12)[25:], calculate_ema(close, 26)[25:])]
+        signal = calculate_ema(line, 9)
+
+        assert result["macd"][25:] == pytest.approx(line, rel=1e-9)
+        assert_series_equal(vectorized.to_list(result["signal"][25:]), signal)
+        assert np.allclose(result["histogram"], result["macd"] - result["signal"], equal_nan=True)
+
+    def test_bollinger_matches_reference(self, ohlcv: dict):
+        """Bands are SMA +/- 2 population standard deviations."""
+        close = ohlcv["close"]
+        result = vectorized.bollinger_bands(close, 20, 2.0)
+        expected_std = np.array([close[i - 19:i + 1].std() for i in range(19, close.size)])
+
+        assert np.isnan(result["middle"][:19]).all()
+        assert result["upper"][19:] == pytest.approx(result["middle"][19:] + 2 * expected_std, rel=1e-9)
+        assert result["lower"][19:] == pytest.approx(result["middle"][19:] - 2 * expected_std, rel=1e-9)
+
+    def test_atr_matches_reference(self, ohlcv: dict):
+        """ATR is the Wilder-smoothed true range."""
+        high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+        tr = [0.0] + [
+            max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+            for i in range(1, close.size)
+        ]
+        expected = reference_wilder(tr, 14)[13:]
+
+        result = vectorized.atr(high, low, close, 14)
+        assert np.isnan(result[:14]).all()
+        assert result[14:] == pytest.approx(expected, rel=1e-9)
+
+    def test_stochastic_matches_reference(self, ohlcv: dict):
+        """%K uses rolling extremes and %D is its SMA."""
+        high, low, close = ohlcv["high"], ohlcv["low"], ohlcv["close"]
+        expected_k = [
+            100 * (close[i] - low[i - 13:i + 1].min()) / (high[i - 13:i + 1].max() - low[i - 13:i + 1].min())
+            for i in range(13, close.size)
+        ]
+        result = vectorized.stochastic(high, low, close, 14, 3)
+
+        assert result["k"][13:] == pytest.approx(expected_k, rel=1e-9)
+        assert_series_equal(vectorized.to_list(result["d"][13:]), calculate_sma(expected_k, 3))
+
+    def test_rolling_extremes(self, ohlcv: dict):
+        """Block-based rolling max/min equal the naive window scan."""
+        values = ohlcv["close"]
+        for period in (1, 3, 14, 50):
+            expected_max = [values[i - period + 1:i + 1].max() for i in range(period - 1, values.size)]
+            expected_min = [values[i - period + 1:i + 1].min() for i in range(period - 1, values.size)]
+            assert vectorized.rolling_max(values, period)[period - 1:].tolist() == expected_max
+            assert vectorized.rolling_min(values, period)[period - 1:].tolist() == expected_min
+
+    def test_obv_matches_reference(self, ohlcv: dict):
+        """OBV adds/subtracts volume on up/down closes."""
+        close, volume = ohlcv["close"], ohlcv["volume"]
+        expected = [volume[0]]
+        for i in range(1, close.size):
+            step = volume[i] if close[i] > close[i - 1] else -volume[i] if close[i] < close[i - 1] else 0.0
+            expected.append(expected[-1] + step)
+
+        assert vectorized.obv(close, volume) == pytest.approx(expected)
+
+    def test_vwap_resets_per_session(self, ohlcv: dict):
+        """VWAP restarts its running average at each session boundary."""
+        high, low, close, volume = ohlcv["high"], ohlcv["low"], ohlcv["close"], ohlcv["volume"]
+        sessions = np.repeat(np.arange(4), 100)
+        result = vectorized.vwap(high, low, close, volume, sessions)
+
+        typical = (high + low + close) / 3
+        for session in range(4):
+            part = slice(session * 100, (session + 1) * 100)
+            expected = np.cumsum(typical[part] * volume[part]) / np.cumsum(volume[part])
+            assert result[part] == pytest.approx(expected, rel=1e-9)
+
+
+class TestIndicatorCache:
+    """Test indicator memoization and incremental extension."""
+
+    @pytest.fixture
+    def timestamps(self, prices: list) -> list:
+        """Daily timestamps aligned with the price fixture."""
+        start = datetime(2020, 1, 1)
+        return [start + timedelta(days=i) for i in range(len(prices))]
+
+    @pytest.mark.parametrize("indicator", ["sma", "ema"])
+    def test_hit_and_append(self, prices: list, timestamps: list, indicator: str):
+        """Same last bar hits; one appended bar is extended, not recomputed."""
+        cache = IndicatorCache()
+        compute = vectorized.sma if indicator == "sma" else vectorized.ema
+        params = {"period": 20}
+
+        first = cache.get("005930", "1d", indicator, params, timestamps[:100], prices[:100])
+        again = cache.get("005930", "1d", indicator, params, timestamps[:100], prices[:100])
+        extended = cache.get("005930", "1d", indicator, params, timestamps[:101], prices[:101])
+
+        assert again is first
+        assert np.allclose(extended, compute(prices[:101], 20), equal_nan=True)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["extensions"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ema_extended_through_warm_up(self, prices: list, timestamps: list):
+        """Growing a series past the period seeds the EMA instead of staying NaN."""
+        cache = IndicatorCache()
+        for n in range(3, 30):
+            result = cache.get("005930", "1d", "ema", {"period": 10}, timestamps[:n], prices[:n])
+            assert_series_equal(vectorized.to_list(result), calculate_ema(prices[:n], 10))
+        assert cache.stats()["extensions"] == 26
+
+    def test_sliding_window_sma(self, prices: list, timestamps: list):
+        """A fixed-length window moving forward one bar is extended exactly."""
+        cache = IndicatorCache()
+        cache.get("005930", "1d", "sma", {"period": 5}, timestamps[:100], prices[:100])
+        result = cache.get("005930", "1d", "sma", {"period": 5}, timestamps[1:101], prices[1:101])
+
+        assert np.allclose(result, vectorized.sma(prices[1:101], 5), equal_nan=True)
+        assert cache.extensions == 1
+
+    def test_revised_last_bar_recomputes(self, prices: list, timestamps: list):
+        """An intraday update of the same bar is not served from cache."""
+        cache = IndicatorCache()
+        cache.get("005930", "1d", "sma", {"period": 5}, timestamps[:50], prices[:50])
+        revised = prices[:49] + [prices[49] + 100]
+        result = cache.get("005930", "1d", "sma", {"period": 5}, timestamps[:50], revised)
+
+        assert result[-1] == pytest.approx(np.mean(revised[-5:]))
+        assert cache.misses == 2
+
+    def test_lru_eviction_and_memory_cap(self, prices: list, timestamps: list):
+        """Least recently used entries are evicted to respect the caps."""
+        cache = IndicatorCache(max_entries=2)
+        for symbol in ("A", "B", "C"):
+            cache.get(symbol, "1d", "sma", {"period": 5}, timestamps[:50], prices[:50])
+        assert len(cache) == 2
+        assert [key[0] for key in cache._entries] == ["B", "C"]
+
+        small = IndicatorCache(max_bytes=1500)
+        for symbol in ("A", "B", "C"):
+            small.get(symbol, "1d", "sma", {"period": 5}, timestamps[:100], prices[:100])
+        assert small.size_bytes <= 1500
+        assert len(small) == 1
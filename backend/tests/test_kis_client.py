@@ -0,0 +1,372 @@
+"""Test cases for the KIS base client."""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1 import account
+from app.config import settings
+from app.models.user import TradingMode
+from app.services import kis_client as kis_client_module
+from app.services.kis_client import (
+    KISClient,
+    KISClientRegistry,
+    RequestPriority,
+    close_http_clients,
+    get_http_client,
+)
+from app.services.kis_token_manager import KISToken, KISTokenManager
+from app.utils.rate_limiter import TokenBucket
+
+
+@pytest.fixture
+def kis_requests(monkeypatch, tmp_path) -> list:
+    """Route KIS HTTP traffic to an in-process handler and record requests."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/oauth2/tokenP":
+            await asyncio.sleep(0.01)
+            issued = sum(1 for r in requests if isinstance(r, httpx.Request) and r.url.path == "/oauth2/tokenP")
+            return httpx.Response(200, json={
+                "access_token": f"token-{issued}", "token_type": "Bearer", "expires_in": 86400,
+            })
+        return httpx.Response(200, json={"rt_cd": "0", "output": {"stck_prpr": "70000"}})
+
+    def create_http_client(base_url: str) -> httpx.AsyncClient:
+        requests.append(("connect", base_url))
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(kis_client_module, "_create_http_client", create_http_client)
+    monkeypatch.setattr(kis_client_module, "_http_clients", {})
+    monkeypatch.setattr(kis_client_module, "_rate_limiters", {})
+    monkeypatch.setattr(kis_client_module, "_token_locks", {})
+    monkeypatch.setattr(settings, "KIS_TOKEN_PROACTIVE_REFRESH", False)
+    yield requests
+
+
+def make_client(trading_mode: str = "MOCK") -> KISClient:
+    """Create a KIS client with dummy credentials."""
+    return KISClient(
+        app_key="test_app_key_123",
+        app_secret="test_app_secret",
+        account_number="50156093",
+        account_code="01",
+        trading_mode=trading_mode,
+    )
+
+
+class TestConnectionPool:
+    """Test shared pooled HTTP clients."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_pool_per_base_url(self, kis_requests: list):
+        """Every KISClient for the same base URL reuses one HTTP client."""
+        first, second, real = make_client(), make_client(), make_client("REAL")
+
+        assert first.http_client is second.http_client
+        assert first.http_client is not real.http_client
+        assert [r for r in kis_requests if isinstance(r, tuple)] == [
+            ("connect", first.base_url),
+            ("connect", real.base_url),
+        ]
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_shared_pool(self, kis_requests: list):
+        """Token and API requests use the pooled client, which reopens after shutdown."""
+        client = make_client()
+        await client._ensure_token()
+        url = f"{client.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
+        response = await client.get(url, client._get_headers("FHKST01010100"), {"FID_INPUT_ISCD": "005930"})
+
+        assert response["output"]["stck_prpr"] == "70000"
+        http_requests = [r for r in kis_requests if isinstance(r, httpx.Request)]
+        assert [r.url.path for r in http_requests] == [
+            "/oauth2/tokenP",
+            "/uapi/domestic-stock/v1/quotations/inquire-price",
+        ]
+        assert http_requests[1].headers["authorization"] == "Bearer token-1"
+
+        pool = client.http_client
+        await close_http_clients()
+        assert pool.is_closed
+        assert get_http_client(client.base_url) is not pool
+        await close_http_clients()
+
+
+class TestClientRegistry:
+    """Test the process-wide KISClient registry."""
+
+    def test_reuses_clients_per_key(self, kis_requests: list):
+        """Same credentials share a client; a changed secret or mode gets a new one."""
+        registry = KISClientRegistry()
+        credentials = {
+            "app_key": "app_key_1", "app_secret": "secret",
+            "account_number": "50156093", "account_code": "01",
+        }
+        client = registry.get_client(**credentials, trading_mode=TradingMode.MOCK)
+
+        assert registry.get_client(**credentials, trading_mode="MOCK") is client
+        assert registry.get_client(**credentials, trading_mode="REAL") is not client
+        assert len(registry) == 2
+
+        rotated = registry.get_client(**{**credentials, "app_secret": "rotated"}, trading_mode="MOCK")
+        assert rotated is not client
+        assert rotated.app_secret == "rotated"
+
+        registry.invalidate("app_key_1", TradingMode.MOCK)
+        registry.invalidate(None, TradingMode.REAL)
+        assert len(registry) == 1
+        assert registry.get_client(**credentials, trading_mode="MOCK") is not rotated
+
+    @pytest.mark.asyncio
+    async def test_credential_update_invalidates_client(
+        self, client: AsyncClient, auth_headers: dict, kis_requests: list, monkeypatch
+    ):
+        """Updating or deleting credentials drops the cached client for the old key."""
+        registry = KISClientRegistry()
+        monkeypatch.setattr(account, "kis_client_registry", registry)
+        credentials = {
+            "mock_app_key": "old_key", "mock_app_secret": "secret",
+            "mock_account_number": "50156093", "mock_account_code": "01",
+        }
+        response = await client.put("/api/v1/account/kis-credentials/mock", json=credentials, headers=auth_headers)
+        assert response.status_code == 200
+
+        registry.get_client("old_key", "secret", "50156093", "01", "MOCK")
+        response = await client.put(
+            "/api/v1/account/kis-credentials/mock",
+            json={**credentials, "mock_app_key": "new_key"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert len(registry) == 0
+
+        registry.get_client("new_key", "secret", "50156093", "01", "MOCK")
+        response = await client.delete("/api/v1/account/kis-credentials/mock", headers=auth_headers)
+        assert response.status_code == 204
+        assert len(registry) == 0
+
+
+class TestRateLimiter:
+    """Test per-app-key token-bucket rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_limits_rate(self):
+        """Requests beyond the burst wait for tokens to refill."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.09
+        stats = bucket.stats()
+        assert stats["acquired"] == 6
+        assert stats["waits"] >= 4
+        assert stats["queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_default_capacity_keeps_every_second_within_rate(self):
+        """Without an explicit capacity no one-second window exceeds the rate."""
+        bucket = TokenBucket(rate=settings.KIS_REAL_REQUESTS_PER_SECOND)
+        times = []
+
+        async def request():
+            await bucket.acquire()
+            times.append(time.monotonic())
+
+        await asyncio.gather(*(request() for _ in range(int(bucket.rate * 1.5))))
+
+        for start in times:
+            in_window = sum(1 for t in times if start <= t < start + 1.0 - 1e-3)
+            assert in_window <= bucket.rate
+
+    @pytest.mark.asyncio
+    async def test_priority_lanes(self):
+        """Queued orders are served before queued quotes and bulk requests."""
+        bucket = TokenBucket(rate=100, capacity=1)
+        await bucket.acquire()
+        served = []
+
+        async def request(name: str, priority: RequestPriority):
+            await bucket.acquire(priority=priority)
+            served.append(name)
+
+        tasks = [asyncio.create_task(request(f"bulk{i}", RequestPriority.BULK)) for i in range(3)]
+        tasks += [asyncio.create_task(request(f"quote{i}", RequestPriority.QUOTE)) for i in range(2)]
+        await asyncio.sleep(0)
+        assert bucket.queue_depth == 5
+        tasks.append(asyncio.create_task(request("order", RequestPriority.ORDER)))
+        await asyncio.gather(*tasks)
+
+        assert served == ["order", "quote0", "quote1", "bulk0", "bulk1", "bulk2"]
+        lanes = bucket.stats()["lanes"]
+        assert lanes[RequestPriority.BULK]["acquired"] == 3
+        assert lanes[RequestPriority.BULK]["max_wait_seconds"] > lanes[RequestPriority.ORDER]["max_wait_seconds"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        """A cancelled request does not consume a token."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        await bucket.acquire()
+        cancelled = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        waited = await bucket.acquire()
+        assert waited < 0.05
+        assert bucket.queue_depth == 0
+
+    def test_budget_split_across_processes(self, kis_requests: list, monkeypatch):
+        """Each of N processes sharing an app key gets 1/N of its budget."""
+        monkeypatch.setattr(settings, "KIS_RATE_LIMIT_PROCESSES", 4)
+        client = make_client("REAL")
+        assert client.rate_limiter.rate == settings.KIS_REAL_REQUESTS_PER_SECOND / 4
+
+    @pytest.mark.asyncio
+    async def test_clients_share_budget_per_app_key(self, kis_requests: list, monkeypatch):
+        """Clients for one app key share a bucket; mock keys get the mock budget."""
+        monkeypatch.setattr(settings, "KIS_MOCK_REQUESTS_PER_SECOND", 3.0)
+        first, second, real = make_client(), make_client(), make_client("REAL")
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter.rate == 3.0
+        assert real.rate_limiter.capacity == 1
+        assert real.rate_limiter.rate == settings.KIS_REAL_REQUESTS_PER_SECOND
+
+        await first._ensure_token()
+        await second._ensure_token()
+        url = f"{first.base_url}/uapi/domestic-stock/v1/quotations/inquire-price"
+        await first.get(url, first._get_headers("FHKST01010100"), {})
+        await second.get(url, second._get_headers("FHKST01010100"), {}, priority=RequestPriority.BULK)
+
+        lanes = first.rate_limiter.stats()["lanes"]
+        assert lanes[RequestPriority.QUOTE]["acquired"] == 1
+        assert lanes[RequestPriority.BULK]["acquired"] == 1
+        await close_http_clients()
+
+
+def token_requests(kis_requests: list) -> list:
+    """Token issuance requests recorded by the kis_requests fixture."""
+    return [r for r in kis_requests if isinstance(r, httpx.Request) and r.url.path == "/oauth2/tokenP"]
+
+
+class TestTokenRefresh:
+    """Test single-flight and proactive token refresh."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_issuance(self, kis_requests: list):
+        """A burst of callers without a token triggers exactly one token request."""
+        clients = [make_client() for _ in range(3)]
+        await asyncio.gather(*(client._ensure_token() for client in clients for _ in range(10)))
+
+        assert len(token_requests(kis_requests)) == 1
+        assert {client._access_token.access_token for client in clients} == {"token-1"}
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_refreshed_once(self, kis_requests: list):
+        """Concurrent callers holding an expired token wait for one refresh."""
+        client = make_client()
+        await client._ensure_token()
+        client._access_token = KISToken(
+            access_token="stale", token_type="Bearer", expires_in=60, issued_at=datetime.now()
+        )
+        client._token_manager.delete_token()
+
+        await asyncio.gather(*(client._ensure_token() for _ in range(10)))
+
+        assert len(token_requests(kis_requests)) == 2
+        assert client._access_token.access_token == "token-2"
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_proactive_refresh_before_expiry(self, kis_requests: list, monkeypatch):
+        """The background task renews the token before requests see it expire."""
+        monkeypatch.setattr(settings, "KIS_TOKEN_PROACTIVE_REFRESH", True)
+        client = make_client()
+        await client._ensure_token()
+        assert client._access_token.access_token == "token-1"
+        client.close()
+
+        # Token 0.05s away from the refresh margin, with no newer token on disk
+        lifetime = 86400
+        client._access_token = KISToken(
+            access_token="token-1", token_type="Bearer", expires_in=lifetime,
+            issued_at=datetime.now() - timedelta(seconds=lifetime - settings.KIS_TOKEN_REFRESH_MARGIN - 0.05),
+        )
+        client._token_manager.delete_token()
+        client._schedule_token_refresh()
+
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if client._access_token.access_token != "token-1":
+                break
+
+        assert client._access_token.access_token == "token-2"
+        assert client._token_manager.load_token().access_token == "token-2"
+        client.close()
+        await close_http_clients()
+
+
+def issue_token_in_process(home: str, log_path: str) -> None:
+    """Worker process: get or issue the shared token and log what happened."""
+    os.environ["HOME"] = home
+    manager = KISTokenManager(app_key="test_app_key_123", trading_mode="mock")
+
+    async def issue() -> KISToken:
+        with open(log_path, "a") as f:
+            f.write("issued\n")
+        await asyncio.sleep(0.2)
+        return KISToken(
+            access_token=f"token-{os.getpid()}", token_type="Bearer",
+            expires_in=86400, issued_at=datetime.now(),
+        )
+
+    token = asyncio.run(manager.get_or_issue(issue))
+    with open(log_path, "a") as f:
+        f.write(f"{token.access_token}\n")
+
+
+class TestSharedTokenStore:
+    """Test the cross-process token store."""
+
+    def test_one_issuance_across_processes(self, tmp_path):
+        """Concurrent worker processes issue exactly one token per key."""
+        log_path = tmp_path / "log.txt"
+        context = multiprocessing.get_context("fork")
+        processes = [
+            context.Process(target=issue_token_in_process, args=(str(tmp_path), str(log_path)))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=10)
+            assert process.exitcode == 0
+
+        lines = log_path.read_text().splitlines()
+        assert lines.count("issued") == 1
+        assert len(set(lines) - {"issued"}) == 1
+
+    def test_reads_served_from_memory(self, tmp_path, monkeypatch):
+        """Saved tokens are read back from the in-memory mirror without the file."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        manager = KISTokenManager(app_key="test_app_key_123", trading_mode="mock")
+        token = KISToken(access_token="token-1", token_type="Bearer", expires_in=86400, issued_at=datetime.now())
+        manager.save_token(token)
+
+        os.remove(manager.token_file)
+        assert KISTokenManager(app_key="test_app_key_123", trading_mode="mock").load_token() == token
+
+        manager.delete_token()
+        assert manager.load_token() is None
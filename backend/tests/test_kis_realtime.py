@@ -0,0 +1,164 @@
+"""Test cases for the KIS realtime WebSocket client."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+
+from app.services import kis_client as kis_client_module
+from app.services import kis_realtime
+from app.services.kis_client import KISClient
+from app.services.kis_realtime import (
+    KISRealtimeClient,
+    RealtimeOrderBook,
+    RealtimeTick,
+    TR_ID_EXECUTION,
+    TR_ID_ORDER_BOOK,
+    parse_frame,
+)
+from tests.fake_kis_feed import FakeKISFeedServer, execution_values, order_book_values
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    """Poll until condition() is true."""
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest_asyncio.fixture
+async def feed(monkeypatch, tmp_path):
+    """Fake feed server and a realtime client connected to it."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(kis_client_module, "_http_clients", {})
+    monkeypatch.setattr(kis_realtime, "RECONNECT_MIN_DELAY", 0.05)
+
+    server = FakeKISFeedServer()
+    await server.start()
+    client = KISClient(
+        app_key="test_app_key_123",
+        app_secret="test_app_secret",
+        account_number="12345678",
+        account_code="01",
+        base_url=server.http_url
+    )
+    realtime = KISRealtimeClient(client, url=server.ws_url)
+    events = []
+    realtime.add_handler(events.append)
+
+    yield server, realtime, events
+
+    await realtime.close()
+    await server.stop()
+    await kis_client_module.close_http_clients()
+
+
+class TestFrameParser:
+    """Test parsing of pipe-delimited frames."""
+
+    def test_execution_frame_with_several_records(self):
+        """Multi-record frames yield one tick per record."""
+        timestamp = datetime(2024, 3, 4, 9, 33, 54)
+        values = execution_values("005930", 71900, 5, timestamp) + execution_values("005930", 72000, 7, timestamp)
+
+        ticks = parse_frame(f"0|{TR_ID_EXECUTION}|002|{'^'.join(values)}")
+
+        assert [tick.price for tick in ticks] == [71900.0, 72000.0]
+        assert [tick.volume for tick in ticks] == [5.0, 7.0]
+        assert ticks[0] == RealtimeTick(
+            symbol="005930", timestamp=timestamp, price=71900, change=-100, change_percent=-0.14,
+            open=71900, high=71900, low=71900, volume=5, accumulated_volume=5
+        )
+        assert ticks[0].to_price_response().volume == 5.0
+
+    def test_order_book_frame(self):
+        """Order book frames yield ten levels per side."""
+        values = order_book_values("005930", 72000, 71900, datetime(2024, 3, 4, 9, 33, 54))
+
+        (book,) = parse_frame(f"0|{TR_ID_ORDER_BOOK}|001|{'^'.join(values)}")
+
+        assert isinstance(book, RealtimeOrderBook)
+        assert book.ask_prices[:2] == [72000.0, 72100.0]
+        assert book.bid_prices[:2] == [71900.0, 71800.0]
+        assert len(book.ask_volumes) == len(book.bid_volumes) == 10
+        assert book.total_bid_volume == 100.0
+
+    @pytest.mark.parametrize("frame", [
+        "not a frame",
+        "1|H0STCNI0|001|encrypted",
+        "0|H0STXXX0|001|a^b",
+        f"0|{TR_ID_EXECUTION}|002|a^b^c",
+        f"0|{TR_ID_EXECUTION}|001|005930^093354",
+    ])
+    def test_rejects_bad_frames(self, frame):
+        """Malformed, encrypted, unknown and truncated frames raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_frame(frame)
+
+
+class TestRealtimeClient:
+    """Test the client against the fake feed server."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe_and_receive(self, feed):
+        """Subscriptions are registered with the approval key and ticks are dispatched."""
+        server, realtime, events = feed
+        await realtime.subscribe("005930")
+        realtime.start()
+        await wait_for(lambda: (TR_ID_EXECUTION, "005930") in server.subscriptions)
+
+        await realtime.subscribe("000660", TR_ID_ORDER_BOOK)
+        await wait_for(lambda: len(server.subscriptions) == 2)
+        await server.push_executions("005930", [71900, 72000])
+        await server.push_order_book("000660", 130000, 129900)
+        await wait_for(lambda: len(events) == 3)
+
+        assert [event.price for event in events[:2]] == [71900.0, 72000.0]
+        assert events[2].bid_prices[0] == 129900.0
+        assert server.registrations[0]["header"]["approval_key"] == "fake-approval-key"
+
+        await realtime.unsubscribe("005930")
+        await wait_for(lambda: (TR_ID_EXECUTION, "005930") not in server.subscriptions)
+
+    @pytest.mark.asyncio
+    async def test_reconnects_and_resubscribes(self, feed):
+        """After a disconnect the client reconnects and re-registers its symbols."""
+        server, realtime, events = feed
+        await realtime.subscribe("005930")
+        realtime.start()
+        await wait_for(lambda: server.subscriptions)
+
+        await server.drop_connections()
+        await wait_for(lambda: server.connection_count == 2 and server.subscriptions)
+        await server.push_executions("005930", [73000])
+        await wait_for(lambda: events)
+
+        assert events[0].price == 73000.0
+        assert realtime.stats()["reconnects"] == 1
+
+    @pytest.mark.asyncio
+    async def test_answers_pingpong_and_skips_bad_frames(self, feed):
+        """Heartbeats are echoed; unparseable frames are counted, not fatal."""
+        server, realtime, events = feed
+        await realtime.subscribe("005930")
+        realtime.start()
+        await wait_for(lambda: server.subscriptions)
+
+        await server.ping()
+        await server.send("0|H0STXXX0|001|a^b")
+        await server.push_executions("005930", [71900])
+        await wait_for(lambda: events and server.pongs == 1)
+
+        assert realtime.stats()["parse_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_subscription_limit(self, feed):
+        """KIS's per-session registration limit is enforced locally."""
+        _, realtime, _ = feed
+        for i in range(kis_realtime.MAX_SUBSCRIPTIONS):
+            await realtime.subscribe(f"{i:06d}")
+
+        with pytest.raises(ValueError):
+            await realtime.subscribe("999999")
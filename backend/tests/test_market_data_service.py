@@ -0,0 +1,584 @@
+"""Test cases for market data service."""
+
+from datetime import datetime, timedelta
+
+import asyncio
+from datetime import date
+
+import numpy as np
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.market_data import MarketData, TimeInterval
+from app.models.stock import Stock
+from app.services.kis_client import RequestPriority
+from app.services.market_data_collector import MarketDataCollector, load_checkpoint
+from app.services.market_data_service import MarketDataService, history_windows
+from app.utils.rate_limiter import TokenBucket
+
+
+async def add_daily_bars(db: AsyncSession, symbol: str, closes: list, start: datetime) -> None:
+    """Insert consecutive daily bars for a symbol."""
+    for i, close in enumerate(closes):
+        db.add(MarketData(
+            symbol=symbol,
+            timestamp=start + timedelta(days=i),
+            open=close, high=close + 1, low=close - 1, close=close, volume=1000 + i,
+            interval=TimeInterval.ONE_DAY
+        ))
+    await db.commit()
+
+
+class TestBulkLoad:
+    """Test single-query bulk market data loading."""
+
+    @pytest.mark.asyncio
+    async def test_last_n_bars_per_symbol(self, db_session: AsyncSession):
+        """Each symbol gets its own most recent bars in chronological order."""
+        start = datetime(2024, 1, 1)
+        await add_daily_bars(db_session, "005930", [float(v) for v in range(100, 130)], start)
+        await add_daily_bars(db_session, "000660", [float(v) for v in range(200, 205)], start)
+
+        data = await MarketDataService.get_market_data_bulk(
+            db=db_session,
+            symbols=["005930", "000660", "999999"],
+            interval=TimeInterval.ONE_DAY,
+            limit=10
+        )
+
+        assert set(data) == {"005930", "000660"}
+        assert data["005930"]["close"].tolist() == [float(v) for v in range(120, 130)]
+        assert data["000660"]["close"].tolist() == [200.0, 201.0, 202.0, 203.0, 204.0]
+        assert data["005930"]["timestamp"][-1] == np.datetime64(start + timedelta(days=29))
+        assert data["005930"]["high"][0] == 121.0
+
+    @pytest.mark.asyncio
+    async def test_matches_per_symbol_query(self, db_session: AsyncSession):
+        """Bulk results equal get_market_data + to_columns for the same window."""
+        start = datetime(2024, 1, 1)
+        await add_daily_bars(db_session, "005930", [float(v) for v in range(100, 160)], start)
+
+        window = {
+            "interval": TimeInterval.ONE_DAY,
+            "start_date": start + timedelta(days=5),
+            "end_date": start + timedelta(days=40),
+            "limit": 20,
+        }
+        bulk = await MarketDataService.get_market_data_bulk(db=db_session, symbols=["005930"], **window)
+        rows = await MarketDataService.get_market_data(db=db_session, symbol="005930", **window)
+        expected = MarketDataService.to_columns(rows)
+
+        for column, values in expected.items():
+            assert np.array_equal(bulk["005930"][column], values)
+
+
+class FakeKISClient:
+    """Stand-in for KISClient with no-op authentication."""
+
+    trading_mode = "MOCK"
+
+    def __init__(self):
+        self.rate_limiter = TokenBucket(rate=1000)
+
+    async def _ensure_token(self) -> None:
+        pass
+
+
+class FakeQuotation:
+    """Stand-in for KISQuotation returning canned daily chart responses."""
+
+    def __init__(self, bars: list, failing: set = frozenset()):
+        self.client = FakeKISClient()
+        self.bars = bars
+        self.failing = set(failing)
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_daily_chart_data(self, symbol: str, period: str = "D", **kwargs) -> dict:
+        self.calls.append({"symbol": symbol, "period": period, **kwargs})
+        await self.client.rate_limiter.acquire(priority=kwargs.get("priority", 0))
+        if symbol in self.failing:
+            raise RuntimeError(f"KIS error for {symbol}")
+        start = kwargs.get("start_date")
+        end = kwargs.get("end_date")
+        bars = [
+            bar for bar in self.bars
+            if (start is None or bar[0] >= start.strftime("%Y%m%d"))
+            and (end is None or bar[0] <= end.strftime("%Y%m%d"))
+        ][-100:]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return {
+            "rt_cd": "0",
+            "output2": [
+                {
+                    "stck_bsop_date": date,
+                    "stck_oprc": str(close),
+                    "stck_hgpr": str(close + 10),
+                    "stck_lwpr": str(close - 10),
+                    "stck_clpr": str(close),
+                    "acml_vol": "1000",
+                }
+                for date, close in reversed(bars)
+            ],
+        }
+
+
+class TestUpsert:
+    """Test bulk ON CONFLICT upsert of bars."""
+
+    @pytest.mark.asyncio
+    async def test_collect_daily_data_upserts(self, db_session: AsyncSession):
+        """Re-collecting updates existing bars instead of duplicating them."""
+        quotation = FakeQuotation([("20240102", 100), ("20240103", 110)])
+        saved = await MarketDataService.collect_daily_data(db_session, quotation, "005930")
+        assert [d.close for d in saved] == [100.0, 110.0]
+
+        quotation.bars = [("20240103", 115), ("20240104", 120)]
+        saved = await MarketDataService.collect_daily_data(db_session, quotation, "005930")
+        assert [d.close for d in saved] == [115.0, 120.0]
+        assert all(d.id is not None and d.created_at is not None for d in saved)
+
+        rows = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_DAY)
+        assert [(d.timestamp.day, d.close) for d in rows] == [(2, 100.0), (3, 115.0), (4, 120.0)]
+
+    @pytest.mark.asyncio
+    async def test_incremental_collection(self, db_session: AsyncSession, monkeypatch):
+        """Incremental collection requests only the missing range and skips unchanged data."""
+        quotation = FakeQuotation([("20240102", 100), ("20240103", 110)])
+        await MarketDataService.collect_daily_data(db_session, quotation, "005930", incremental=True)
+        assert "start_date" not in quotation.calls[-1]
+
+        upserts = []
+        original_upsert = MarketDataService.upsert_market_data
+
+        async def spy_upsert(db, market_data_list, **kwargs):
+            upserts.append(market_data_list)
+            return await original_upsert(db, market_data_list, **kwargs)
+
+        monkeypatch.setattr(MarketDataService, "upsert_market_data", spy_upsert)
+
+        first_call = len(quotation.calls)
+        saved = await MarketDataService.collect_daily_data(db_session, quotation, "005930", incremental=True)
+        assert saved == []
+        assert upserts == []
+        # The range to today is paged oldest window first
+        assert quotation.calls[first_call]["start_date"] == datetime(2024, 1, 3).date()
+        assert quotation.calls[-1]["end_date"] == datetime.now().date()
+
+        quotation.bars = [("20240102", 100), ("20240103", 112), ("20240104", 120)]
+        saved = await MarketDataService.collect_daily_data(db_session, quotation, "005930", incremental=True)
+        assert [(d.timestamp.day, d.close) for d in saved] == [(3, 112.0), (4, 120.0)]
+
+    @pytest.mark.asyncio
+    async def test_upsert_deduplicates_and_chunks(self, db_session: AsyncSession, monkeypatch):
+        """Duplicate keys keep the last bar and chunks cover every row."""
+        from app.schemas.market_data import MarketDataCreate
+        from app.services import market_data_service
+
+        monkeypatch.setattr(market_data_service, "UPSERT_CHUNK_SIZE", 7)
+        start = datetime(2024, 1, 1)
+        bars = [
+            MarketDataCreate(
+                symbol="005930", timestamp=start + timedelta(days=i % 20),
+                open=100 + i, high=100 + i, low=100 + i, close=100 + i, volume=1,
+                interval=TimeInterval.ONE_DAY
+            )
+            for i in range(25)
+        ]
+        saved = await MarketDataService.upsert_market_data(db_session, bars)
+
+        assert len(saved) == 20
+        assert saved[0].close == 120.0
+        assert saved[-1].close == 119.0
+
+
+class TestUniverseCollector:
+    """Test rate-limited universe-wide collection."""
+
+    @pytest.mark.asyncio
+    async def test_collects_stocks_in_batches(
+        self, db_session: AsyncSession, session_factory: async_sessionmaker, tmp_path
+    ):
+        """Every stock of the market is collected and the checkpoint reports throughput."""
+        for symbol, market in [("005930", "KOSPI"), ("000660", "KOSPI"), ("035720", "KOSDAQ")]:
+            db_session.add(Stock(symbol=symbol, standard_code=symbol, name=symbol, market_type=market))
+        await db_session.commit()
+
+        symbols = await MarketDataCollector.select_universe(db_session, market_type="KOSPI")
+        assert symbols == ["000660", "005930"]
+
+        quotation = FakeQuotation([("20240102", 100), ("20240103", 110)])
+        collector = MarketDataCollector(
+            quotation, session_factory,
+            concurrency=2, batch_rows=2, checkpoint_dir=tmp_path
+        )
+        progress = await collector.collect_daily(symbols)
+
+        assert progress.status == "completed"
+        assert sorted(progress.completed_symbols) == symbols
+        assert progress.rows_saved == 4
+        assert progress.requests == 2
+        assert {c["priority"] for c in quotation.calls} == {RequestPriority.BULK}
+        assert progress.rows_per_second > 0
+        assert load_checkpoint(progress.job_id, tmp_path) == progress
+
+        bulk = await MarketDataService.get_market_data_bulk(db_session, symbols, TimeInterval.ONE_DAY)
+        assert {symbol: bulk[symbol]["close"].tolist() for symbol in bulk} == {
+            "000660": [100.0, 110.0],
+            "005930": [100.0, 110.0],
+        }
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_symbols(
+        self, session_factory: async_sessionmaker, tmp_path, monkeypatch
+    ):
+        """A resumed job only fetches symbols that failed or were never saved."""
+        from app.services import market_data_collector
+
+        monkeypatch.setattr(market_data_collector, "RETRY_BASE_DELAY", 0)
+        quotation = FakeQuotation([("20240102", 100)], failing={"000660"})
+        collector = MarketDataCollector(
+            quotation, session_factory,
+            max_retries=1, checkpoint_dir=tmp_path
+        )
+        progress = await collector.collect_daily(["005930", "000660", "035720"])
+
+        assert progress.status == "completed_with_errors"
+        assert list(progress.failed_symbols) == ["000660"]
+        assert [c["symbol"] for c in quotation.calls].count("000660") == 2
+
+        quotation.failing.clear()
+        quotation.calls.clear()
+        resumed = await collector.collect_daily(["005930", "000660", "035720"], job_id=progress.job_id)
+
+        assert [c["symbol"] for c in quotation.calls] == ["000660"]
+        assert resumed.status == "completed"
+        assert resumed.failed_symbols == {}
+        assert resumed.rows_saved == 3
+        assert resumed.started_at == progress.started_at
+
+    @pytest.mark.asyncio
+    async def test_incremental_skips_up_to_date_symbols(self, session_factory: async_sessionmaker, tmp_path):
+        """Incremental jobs write only new bars and count symbols with nothing new."""
+        quotation = FakeQuotation([("20240102", 100), ("20240103", 110)])
+        collector = MarketDataCollector(
+            quotation, session_factory, checkpoint_dir=tmp_path
+        )
+        await collector.collect_daily(["005930", "000660"], incremental=True)
+
+        quotation.bars.append(("20240104", 120))
+        quotation.calls.clear()
+        async with session_factory() as session:
+            await MarketDataService.collect_daily_data(session, quotation, "005930")
+        quotation.calls.clear()
+
+        progress = await collector.collect_daily(["005930", "000660"], incremental=True)
+
+        assert progress.incremental
+        assert progress.rows_saved == 1
+        assert progress.up_to_date_symbols == 1
+        assert sorted(progress.completed_symbols) == ["000660", "005930"]
+        first_calls = {}
+        for call in quotation.calls:
+            first_calls.setdefault(call["symbol"], call["start_date"])
+        assert first_calls == {"005930": date(2024, 1, 4), "000660": date(2024, 1, 3)}
+
+    @pytest.mark.asyncio
+    async def test_incremental_pages_long_gaps(
+        self, db_session: AsyncSession, session_factory: async_sessionmaker, tmp_path
+    ):
+        """A gap longer than one 100-bar response is fetched window by window."""
+        weekdays = np.arange(np.datetime64("2024-01-02"), np.datetime64(datetime.now().date()))
+        weekdays = weekdays[np.is_busday(weekdays)]
+        quotation = FakeQuotation([
+            (str(day).replace("-", ""), 100 + i) for i, day in enumerate(weekdays.tolist())
+        ])
+        await add_daily_bars(db_session, "005930", [100.0], datetime(2024, 1, 2))
+        collector = MarketDataCollector(quotation, session_factory, checkpoint_dir=tmp_path)
+
+        progress = await collector.collect_daily(["005930"], incremental=True)
+
+        assert progress.requests == len(history_windows(date(2024, 1, 2), datetime.now().date()))
+        assert progress.requests > 1
+        rows = await MarketDataService.get_market_data(
+            db_session, "005930", TimeInterval.ONE_DAY, limit=10000
+        )
+        assert len(rows) == weekdays.size
+        assert [row.close for row in rows[-2:]] == [98.0 + weekdays.size, 99.0 + weekdays.size]
+
+    @pytest.mark.asyncio
+    async def test_latest_bars_lookup(self, db_session: AsyncSession):
+        """get_latest_bars returns the newest bar of each symbol like a limit=1 bulk load."""
+        start = datetime(2024, 1, 1)
+        await add_daily_bars(db_session, "005930", [float(v) for v in range(100, 130)], start)
+        await add_daily_bars(db_session, "000660", [200.0, 201.0], start)
+
+        latest = await MarketDataService.get_latest_bars(
+            db_session, ["005930", "000660", "999999"], TimeInterval.ONE_DAY
+        )
+        bulk = await MarketDataService.get_market_data_bulk(
+            db_session, ["005930", "000660", "999999"], TimeInterval.ONE_DAY, limit=1
+        )
+
+        assert set(latest) == {"005930", "000660"}
+        for symbol, columns in bulk.items():
+            for column, values in columns.items():
+                assert np.array_equal(latest[symbol][column], values)
+
+    @pytest.mark.asyncio
+    async def test_weekly_period_stored_as_weekly_bars(
+        self, db_session: AsyncSession, session_factory: async_sessionmaker, tmp_path
+    ):
+        """W candles are saved as 1w bars instead of overwriting the 1d rows."""
+        await add_daily_bars(db_session, "005930", [100.0, 101.0], datetime(2024, 1, 1))
+        quotation = FakeQuotation([("20240101", 200)])
+        collector = MarketDataCollector(quotation, session_factory, checkpoint_dir=tmp_path)
+
+        progress = await collector.collect_daily(["005930"], period="W")
+
+        assert progress.interval == TimeInterval.ONE_WEEK
+        assert quotation.calls[0]["period"] == "W"
+        daily = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_DAY)
+        weekly = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.ONE_WEEK)
+        assert [bar.close for bar in daily] == [100.0, 101.0]
+        assert [(bar.timestamp, bar.close) for bar in weekly] == [(datetime(2024, 1, 1), 200.0)]
+
+        with pytest.raises(ValueError):
+            await collector.collect_daily(["005930"], period="Y")
+
+    @pytest.mark.asyncio
+    async def test_resume_keeps_saved_settings(
+        self, db_session: AsyncSession, session_factory: async_sessionmaker, tmp_path, monkeypatch
+    ):
+        """A resumed W job stays weekly even when only the job id is passed."""
+        from app.services import market_data_collector
+
+        monkeypatch.setattr(market_data_collector, "RETRY_BASE_DELAY", 0)
+        quotation = FakeQuotation([("20240101", 200)], failing={"000660"})
+        collector = MarketDataCollector(quotation, session_factory, max_retries=1, checkpoint_dir=tmp_path)
+        progress = await collector.collect_daily(["005930", "000660"], period="W", incremental=True)
+
+        quotation.failing.clear()
+        quotation.calls.clear()
+        resumed = await collector.collect_daily(["005930", "000660"], job_id=progress.job_id)
+
+        assert resumed.status == "completed"
+        assert (resumed.period, resumed.interval, resumed.incremental) == ("W", TimeInterval.ONE_WEEK, True)
+        assert [call["period"] for call in quotation.calls] == ["W"]
+        assert await MarketDataService.get_market_data(db_session, "000660", TimeInterval.ONE_DAY) == []
+        weekly = await MarketDataService.get_market_data(db_session, "000660", TimeInterval.ONE_WEEK)
+        assert [bar.close for bar in weekly] == [200.0]
+        assert MarketDataCollector.new_progress("M", total_symbols=2).interval == TimeInterval.ONE_MONTH
+
+    def test_history_windows_fit_one_request(self):
+        """Backfill windows tile the range and hold at most 100 weekdays each."""
+        windows = history_windows(date(2015, 1, 1), date(2024, 12, 31))
+
+        assert windows[0][1] == date(2024, 12, 31)
+        assert windows[-1][0] == date(2015, 1, 1)
+        for (_, older_end), (newer_start, _) in zip(windows[1:], windows[:-1]):
+            assert (newer_start - older_end).days == 1
+        for window_start, window_end in windows:
+            days = np.arange(np.datetime64(window_start), np.datetime64(window_end) + 1)
+            assert np.is_busday(days).sum() <= 100
+
+    @pytest.mark.asyncio
+    async def test_backfill_pages_history(
+        self, db_session: AsyncSession, session_factory: async_sessionmaker, tmp_path
+    ):
+        """Backfill pages back to the start date with requests in flight ahead of writes."""
+        weekdays = np.arange(np.datetime64("2023-01-02"), np.datetime64(datetime.now().date()))
+        weekdays = weekdays[np.is_busday(weekdays)]
+        quotation = FakeQuotation([
+            (str(day).replace("-", ""), 100 + i) for i, day in enumerate(weekdays.tolist())
+        ])
+        collector = MarketDataCollector(
+            quotation, session_factory,
+            prefetch_pages=3, batch_rows=150,
+            checkpoint_dir=tmp_path
+        )
+        progress = await collector.collect_daily(["005930"], history_start=date(2020, 1, 1))
+
+        assert progress.status == "completed"
+        assert progress.completed_symbols == ["005930"]
+        assert progress.rows_saved == weekdays.size
+        assert quotation.max_in_flight == 3
+        # Stops at the first empty window before the listing date (plus prefetched pages)
+        windows = history_windows(date(2020, 1, 1), datetime.now().date())
+        with_data = sum(1 for _, end in windows if end >= date(2023, 1, 2))
+        assert with_data < progress.requests <= with_data + 3
+
+        rows = await MarketDataService.get_market_data(
+            db_session, "005930", TimeInterval.ONE_DAY, limit=10000
+        )
+        assert len(rows) == weekdays.size
+        assert rows[0].timestamp.date() == date(2023, 1, 2)
+
+
+async def add_minute_bars(db: AsyncSession, symbol: str, start: datetime, count: int) -> None:
+    """Insert consecutive 1m bars with close = 100 + minute index."""
+    for i in range(count):
+        db.add(MarketData(
+            symbol=symbol,
+            timestamp=start + timedelta(minutes=i),
+            open=100 + i, high=101 + i, low=99 + i, close=100 + i, volume=10,
+            interval=TimeInterval.ONE_MINUTE
+        ))
+    await db.commit()
+
+
+class TestResample:
+    """Test resampling of stored bars to coarser intervals."""
+
+    def test_resample_columns_minutes(self):
+        """5m bars take the first open, max high, min low, last close and summed volume."""
+        start = datetime(2024, 3, 4, 9, 0)
+        columns = {
+            "timestamp": np.array([start + timedelta(minutes=i) for i in range(12)], dtype="datetime64[us]"),
+            "open": np.arange(12, dtype=np.float64) + 100,
+            "high": np.arange(12, dtype=np.float64) + 101,
+            "low": np.arange(12, dtype=np.float64) + 99,
+            "close": np.arange(12, dtype=np.float64) + 100,
+            "volume": np.ones(12),
+        }
+
+        bars = MarketDataService.resample_columns(columns, TimeInterval.FIVE_MINUTES)
+
+        assert bars["timestamp"].tolist() == [start, start + timedelta(minutes=5), start + timedelta(minutes=10)]
+        assert bars["open"].tolist() == [100, 105, 110]
+        assert bars["high"].tolist() == [105, 110, 112]
+        assert bars["low"].tolist() == [99, 104, 109]
+        assert bars["close"].tolist() == [104, 109, 111]
+        assert bars["volume"].tolist() == [5, 5, 2]
+
+    def test_calendar_buckets(self):
+        """Weeks start on Monday and months on the 1st."""
+        timestamps = np.array(
+            [datetime(2024, 2, 29), datetime(2024, 3, 3), datetime(2024, 3, 4), datetime(2024, 3, 31)],
+            dtype="datetime64[us]"
+        )
+
+        weeks = MarketDataService.bucket_starts(timestamps, TimeInterval.ONE_WEEK)
+        months = MarketDataService.bucket_starts(timestamps, TimeInterval.ONE_MONTH)
+
+        assert weeks.tolist() == [datetime(2024, 2, 26), datetime(2024, 2, 26), datetime(2024, 3, 4), datetime(2024, 3, 25)]
+        assert months.tolist() == [datetime(2024, 2, 1), datetime(2024, 3, 1), datetime(2024, 3, 1), datetime(2024, 3, 1)]
+
+    @pytest.mark.asyncio
+    async def test_resample_stored_bars(self, db_session: AsyncSession):
+        """Weekly bars of several symbols come from stored daily bars in one pass."""
+        # 2024-01-01 is a Monday: three full weeks and one day
+        await add_daily_bars(db_session, "005930", [float(v) for v in range(100, 122)], datetime(2024, 1, 1))
+        await add_daily_bars(db_session, "000660", [200.0, 201.0], datetime(2024, 1, 7))
+
+        resampled = await MarketDataService.resample_market_data(
+            db_session, ["005930", "000660", "999999"], TimeInterval.ONE_WEEK
+        )
+
+        assert set(resampled) == {"005930", "000660"}
+        weekly = resampled["005930"]
+        assert [bar.timestamp for bar in weekly] == [datetime(2024, 1, d) for d in (1, 8, 15, 22)]
+        assert [(bar.open, bar.high, bar.low, bar.close) for bar in weekly[:2]] == [
+            (100, 107, 99, 106), (107, 114, 106, 113)
+        ]
+        assert weekly[0].volume == sum(1000 + i for i in range(7))
+        assert [bar.timestamp for bar in resampled["000660"]] == [datetime(2024, 1, 1), datetime(2024, 1, 8)]
+
+        with pytest.raises(ValueError):
+            await MarketDataService.resample_market_data(db_session, ["005930"], TimeInterval.ONE_MINUTE)
+
+    @pytest.mark.asyncio
+    async def test_resample_endpoint_and_chart_fallback(self, client, auth_headers, db_session: AsyncSession):
+        """Charts of unstored intervals are resampled on the fly; the endpoint saves them."""
+        start = (datetime.now() - timedelta(hours=2)).replace(minute=0, second=0, microsecond=0)
+        await add_minute_bars(db_session, "005930", start, 90)
+
+        response = await client.get(
+            "/api/v1/market/chart/005930", params={"interval": "1h", "days": 1}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert [point["close"] for point in response.json()["data"]] == [159, 189]
+
+        response = await client.post(
+            "/api/v1/market/resample/005930", params={"interval": "30m", "days": 1}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.json()["total"] == 3
+
+        stored = await MarketDataService.get_market_data(db_session, "005930", TimeInterval.THIRTY_MINUTES)
+        assert [bar.volume for bar in stored] == [300, 300, 300]
+
+        response = await client.post(
+            "/api/v1/market/resample/005930", params={"interval": "1d"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestDownsample:
+    """Test server-side chart downsampling."""
+
+    @staticmethod
+    def columns(n: int) -> dict:
+        """Sine-shaped bars with a spike in the middle."""
+        close = 100 + 10 * np.sin(np.linspace(0, 6 * np.pi, n))
+        close[n // 2] = 200
+        return {
+            "timestamp": np.datetime64("2024-01-01T00:00") + np.arange(n).astype("timedelta64[m]"),
+            "open": close - 1,
+            "high": close + 1,
+            "low": close - 2,
+            "close": close,
+            "volume": np.full(n, 10.0),
+        }
+
+    def test_ohlc_keeps_extremes_and_volume(self):
+        """Merged candles keep the overall high, low, first open, last close and total volume."""
+        columns = self.columns(1000)
+
+        bars = MarketDataService.downsample_ohlc(columns, 300)
+
+        assert len(bars["timestamp"]) == 300
+        assert bars["timestamp"][0] == columns["timestamp"][0]
+        assert bars["open"][0] == columns["open"][0]
+        assert bars["close"][-1] == columns["close"][-1]
+        assert bars["high"].max() == columns["high"].max()
+        assert bars["low"].min() == columns["low"].min()
+        assert bars["volume"].sum() == columns["volume"].sum()
+        assert MarketDataService.downsample_ohlc(columns, 2000) is columns
+
+    def test_lttb_keeps_endpoints_and_spike(self):
+        """LTTB keeps the first, last and most prominent points."""
+        columns = self.columns(1000)
+
+        indices = MarketDataService.lttb_indices(columns["timestamp"].astype(np.int64), columns["close"], 100)
+
+        assert len(indices) == 100
+        assert indices[0] == 0 and indices[-1] == 999
+        assert np.all(np.diff(indices) > 0)
+        assert 500 in indices
+        assert MarketDataService.lttb_indices(np.arange(50), np.arange(50), 100).tolist() == list(range(50))
+
+    @pytest.mark.asyncio
+    async def test_chart_max_points(self, client, auth_headers, db_session: AsyncSession):
+        """The chart endpoint returns at most max_points points."""
+        start = (datetime.now() - timedelta(days=1)).replace(second=0, microsecond=0)
+        await add_minute_bars(db_session, "005930", start, 600)
+        url = "/api/v1/market/chart/005930"
+        params = {"interval": "1m", "days": 2}
+
+        full = await client.get(url, params=params, headers=auth_headers)
+        ohlc = await client.get(url, params={**params, "max_points": 60}, headers=auth_headers)
+        lttb = await client.get(url, params={**params, "max_points": 60, "downsample": "lttb"}, headers=auth_headers)
+        invalid = await client.get(url, params={**params, "max_points": 60, "downsample": "x"}, headers=auth_headers)
+
+        assert len(full.json()["data"]) == 600
+        assert len(ohlc.json()["data"]) == 60
+        assert ohlc.json()["data"][0]["volume"] == 100
+        assert max(point["high"] for point in ohlc.json()["data"]) == 700
+        assert len(lttb.json()["data"]) == 60
+        assert lttb.json()["data"][-1]["close"] == 699
+        assert invalid.status_code == 422
@@ -0,0 +1,120 @@
+"""Test cases for the quote cache."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.config import settings
+from app.services.quote_cache import QuoteCache, is_market_hours, KRX_TIMEZONE
+
+
+class FakeQuotation:
+    """Stand-in for KISQuotation that counts inquire-price calls."""
+
+    def __init__(self, trading_mode: str = "REAL", delay: float = 0.05, fail: bool = False):
+        self.client = type("Client", (), {"trading_mode": trading_mode})()
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def get_current_price(self, symbol: str) -> dict:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("KIS unavailable")
+        return {"output": {"stck_prpr": str(70000 + self.calls)}}
+
+
+@pytest.fixture
+def long_ttl(monkeypatch):
+    """Cache quotes for a minute regardless of the clock."""
+    monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_MARKET_HOURS", 60.0)
+    monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_AFTER_HOURS", 60.0)
+
+
+class TestQuoteCache:
+    """Test quote caching and request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesce(self, long_ttl):
+        """Concurrent misses for one symbol share a single KIS call."""
+        cache = QuoteCache()
+        quotation = FakeQuotation()
+
+        responses = await asyncio.gather(*(cache.get_current_price(quotation, "005930") for _ in range(20)))
+
+        assert quotation.calls == 1
+        assert all(response is responses[0] for response in responses)
+        assert cache.stats()["coalesced"] == 19
+
+    @pytest.mark.asyncio
+    async def test_cached_until_ttl_expires(self, monkeypatch):
+        """Fresh quotes come from cache; expired ones are refetched."""
+        monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_MARKET_HOURS", 0.1)
+        monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_AFTER_HOURS", 0.1)
+        cache = QuoteCache()
+        quotation = FakeQuotation(delay=0)
+
+        first = await cache.get_current_price(quotation, "005930")
+        assert await cache.get_current_price(quotation, "005930") is first
+        assert quotation.calls == 1
+
+        await asyncio.sleep(0.15)
+        assert await cache.get_current_price(quotation, "005930") is not first
+        assert quotation.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_keyed_by_trading_mode_and_symbol(self, long_ttl):
+        """Different symbols and trading modes are cached separately."""
+        cache = QuoteCache()
+        real, mock = FakeQuotation("REAL", delay=0), FakeQuotation("MOCK", delay=0)
+
+        await cache.get_current_price(real, "005930")
+        await cache.get_current_price(real, "000660")
+        await cache.get_current_price(mock, "005930")
+
+        assert real.calls == 2
+        assert mock.calls == 1
+
+        cache.invalidate("005930")
+        await cache.get_current_price(real, "005930")
+        await cache.get_current_price(real, "000660")
+        assert real.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_shared_and_not_cached(self, long_ttl):
+        """A failed fetch raises for every waiter and is retried next time."""
+        cache = QuoteCache()
+        quotation = FakeQuotation(fail=True)
+
+        results = await asyncio.gather(
+            *(cache.get_current_price(quotation, "005930") for _ in range(5)),
+            return_exceptions=True
+        )
+        assert quotation.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        quotation.fail = False
+        response = await cache.get_current_price(quotation, "005930")
+        assert response["output"]["stck_prpr"] == "70002"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_fetch(self, long_ttl):
+        """Cancelling one request leaves the shared fetch running for the others."""
+        cache = QuoteCache()
+        quotation = FakeQuotation()
+
+        cancelled = asyncio.create_task(cache.get_current_price(quotation, "005930"))
+        other = asyncio.create_task(cache.get_current_price(quotation, "005930"))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+
+        assert (await other)["output"]["stck_prpr"] == "70001"
+        assert quotation.calls == 1
+
+    def test_market_hours(self):
+        """Regular session is weekdays 09:00-15:30 KST."""
+        assert is_market_hours(datetime(2024, 3, 4, 10, 0, tzinfo=KRX_TIMEZONE))
+        assert not is_market_hours(datetime(2024, 3, 4, 16, 0, tzinfo=KRX_TIMEZONE))
+        assert not is_market_hours(datetime(2024, 3, 2, 10, 0, tzinfo=KRX_TIMEZONE))
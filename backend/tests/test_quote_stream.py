@@ -0,0 +1,242 @@
+"""Test cases for the realtime quote stream."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.websockets import WebSocketDisconnect
+
+from app.config import settings
+from app.db.session import get_db, get_session_factory
+from app.services.kis_quotation import KISQuotation
+from app.services.quote_cache import quote_cache
+from app.services.quote_stream import QuoteStreamHub
+from tests.test_quote_cache import FakeQuotation
+
+
+@pytest.fixture
+def fast_polling(monkeypatch):
+    """Poll every 10ms with caching disabled."""
+    monkeypatch.setattr(settings, "QUOTE_STREAM_POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_MARKET_HOURS", 0.0)
+    monkeypatch.setattr(settings, "QUOTE_CACHE_TTL_AFTER_HOURS", 0.0)
+
+
+class TestQuoteStreamHub:
+    """Test upstream sharing and fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_one_poller_per_symbol(self, fast_polling):
+        """Many subscribers of a symbol share one upstream poller."""
+        hub = QuoteStreamHub()
+        quotation = FakeQuotation(delay=0)
+        subscriptions = [hub.connect(quotation) for _ in range(10)]
+        for subscription in subscriptions:
+            subscription.subscribe(["005930"])
+
+        quotes = await asyncio.gather(*(subscription.get() for subscription in subscriptions))
+        await asyncio.sleep(0.05)
+
+        assert hub.stats()["pollers"] == 1
+        assert all(quote["symbol"] == "005930" for quote in quotes)
+        # One upstream call per poll interval, not one per subscriber
+        assert quotation.calls < 20
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_poller_stops_after_last_unsubscribe(self, fast_polling):
+        """The poller runs only while someone is subscribed."""
+        hub = QuoteStreamHub()
+        quotation = FakeQuotation(delay=0)
+        first, second = hub.connect(quotation), hub.connect(quotation)
+        first.subscribe(["005930", "000660"])
+        second.subscribe(["005930"])
+        await first.get()
+
+        first.close()
+        assert hub.stats() == {"pollers": 1, "subscriptions": 1, "published": hub.published}
+
+        second.unsubscribe(["005930"])
+        await asyncio.sleep(0.02)
+        calls = quotation.calls
+        await asyncio.sleep(0.05)
+
+        assert hub.stats()["pollers"] == 0
+        assert quotation.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_poller_rebinds_to_remaining_subscriber(self, fast_polling):
+        """When the subscriber whose client polls leaves, another one's client takes over."""
+        hub = QuoteStreamHub()
+        first_quotation, second_quotation = FakeQuotation(delay=0), FakeQuotation(delay=0)
+        first, second = hub.connect(first_quotation), hub.connect(second_quotation)
+        first.subscribe(["005930"])
+        second.subscribe(["005930"])
+        await second.get()
+
+        first.close()
+        calls = first_quotation.calls
+        await asyncio.sleep(0.05)
+
+        assert first_quotation.calls == calls
+        assert second_quotation.calls > 0
+        assert hub.stats()["pollers"] == 1
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_revoke_drops_subscriptions_of_app_key(self, fast_polling):
+        """Changed credentials revoke their subscriptions and stop using their client."""
+        hub = QuoteStreamHub()
+        old_quotation, other_quotation = FakeQuotation(delay=0), FakeQuotation(delay=0)
+        old_quotation.client.app_key = "old_key"
+        other_quotation.client.app_key = "other_key"
+        old, other = hub.connect(old_quotation), hub.connect(other_quotation)
+        old.subscribe(["005930", "000660"])
+        other.subscribe(["005930"])
+        await old.get()
+
+        assert hub.revoke("old_key", "MOCK") == 0
+        assert hub.revoke("old_key", "REAL") == 1
+
+        while await old.get() is not None:
+            pass
+        assert old.revoked and old.symbols == set()
+        with pytest.raises(ValueError):
+            old.subscribe(["005930"])
+
+        calls = old_quotation.calls
+        await asyncio.sleep(0.05)
+        assert old_quotation.calls == calls
+        assert hub.stats()["pollers"] == 1
+        assert hub.stats()["subscriptions"] == 1
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_quotes_not_resent(self):
+        """Publishing the same quote twice delivers it once."""
+        hub = QuoteStreamHub()
+        subscription = hub.connect(FakeQuotation())
+        hub._subscribers[("REAL", "005930")] = {subscription}
+
+        hub.publish(("REAL", "005930"), {"price": 1.0})
+        hub.publish(("REAL", "005930"), {"price": 1.0})
+        hub.publish(("REAL", "005930"), {"price": 2.0})
+
+        assert subscription.queue.qsize() == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_keeps_latest(self, monkeypatch):
+        """A full queue drops the oldest quotes."""
+        monkeypatch.setattr(settings, "QUOTE_STREAM_QUEUE_SIZE", 2)
+        hub = QuoteStreamHub()
+        subscription = hub.connect(FakeQuotation())
+        hub._subscribers[("REAL", "005930")] = {subscription}
+
+        for price in range(5):
+            hub.publish(("REAL", "005930"), {"price": price})
+
+        assert subscription.dropped == 3
+        assert [await subscription.get(), await subscription.get()] == [{"price": 3}, {"price": 4}]
+
+    def test_symbol_limit(self, monkeypatch):
+        """A connection cannot subscribe to more than the configured symbols."""
+        monkeypatch.setattr(settings, "QUOTE_STREAM_MAX_SYMBOLS", 2)
+        subscription = QuoteStreamHub().connect(FakeQuotation())
+
+        with pytest.raises(ValueError):
+            subscription.subscribe(["005930", "000660", "035420"])
+        assert subscription.symbols == set()
+
+
+class TestStreamEndpoint:
+    """Test the /market/stream WebSocket."""
+
+    def test_subscribe_and_receive(self, db_session: AsyncSession, session_factory, monkeypatch, tmp_path):
+        """An authenticated client receives quotes for its symbols."""
+        from app.main import app
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        fake = FakeQuotation(delay=0)
+
+        async def get_current_price(self, symbol):
+            response = await fake.get_current_price(symbol)
+            response["output"].update({"stck_bsop_date": "20240304", "stck_cntg_hour": "100000"})
+            return response
+
+        monkeypatch.setattr(KISQuotation, "get_current_price", get_current_price)
+
+        async def override_get_db():
+            async with session_factory() as session:
+                yield session
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_session_factory] = lambda: session_factory
+
+        try:
+            with TestClient(app) as test_client:
+                user = {"email": "stream@example.com", "password": "Test1234!", "full_name": "Stream"}
+                test_client.post("/api/v1/auth/register", json=user)
+                token = test_client.post(
+                    "/api/v1/auth/login", json={"email": user["email"], "password": user["password"]}
+                ).json()["access_token"]
+
+                # The first message must authenticate
+                with test_client.websocket_connect("/api/v1/market/stream") as ws:
+                    ws.send_json({"action": "subscribe", "symbols": ["005930"]})
+                    assert ws.receive_json()["type"] == "error"
+                    with pytest.raises(WebSocketDisconnect) as closed:
+                        ws.receive_json()
+                    assert closed.value.code == 1008
+
+                with test_client.websocket_connect("/api/v1/market/stream") as ws:
+                    ws.send_json({"action": "auth", "token": "invalid"})
+                    assert ws.receive_json()["type"] == "error"
+                    with pytest.raises(WebSocketDisconnect):
+                        ws.receive_json()
+
+                # No KIS credentials yet
+                with test_client.websocket_connect("/api/v1/market/stream") as ws:
+                    ws.send_json({"action": "auth", "token": token})
+                    assert ws.receive_json()["type"] == "error"
+                    with pytest.raises(WebSocketDisconnect) as closed:
+                        ws.receive_json()
+                    assert closed.value.code == 1008
+
+                test_client.put(
+                    "/api/v1/account/kis-credentials/mock",
+                    json={
+                        "mock_app_key": "stream_app_key",
+                        "mock_app_secret": "stream_app_secret",
+                        "mock_account_number": "12345678",
+                        "mock_account_code": "01",
+                    },
+                    headers={"Authorization": f"Bearer {token}"},
+                )
+
+                with test_client.websocket_connect("/api/v1/market/stream") as ws:
+                    ws.send_json({"action": "auth", "token": token})
+                    ws.send_text("not json")
+                    assert ws.receive_json()["type"] == "error"
+
+                    ws.send_json({"action": "subscribe", "symbols": ["005930"]})
+                    messages = {message["type"]: message for message in (ws.receive_json(), ws.receive_json())}
+
+                    assert messages["subscribed"]["symbols"] == ["005930"]
+                    assert messages["quote"]["data"]["symbol"] == "005930"
+                    assert messages["quote"]["data"]["timestamp"] == "2024-03-04T10:00:00"
+
+                    # Deleting the credentials ends the stream
+                    test_client.delete(
+                        "/api/v1/account/kis-credentials/mock",
+                        headers={"Authorization": f"Bearer {token}"},
+                    )
+                    while (message := ws.receive_json())["type"] == "quote":
+                        pass
+                    assert message == {"type": "error", "detail": "KIS credentials changed; reconnect"}
+                    with pytest.raises(WebSocketDisconnect) as closed:
+                        ws.receive_json()
+                    assert closed.value.code == 1012
+        finally:
+            app.dependency_overrides.clear()
+            quote_cache.invalidate()
@@ -0,0 +1,171 @@
+"""Test cases for strategy signal generation."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.indicators import IndicatorCache, calculate_sma, find_crossovers
+from app.core.strategy import BaseStrategy, MomentumStrategy
+from app.config import settings
+from app.models.market_data import MarketData, TimeInterval
+from app.services.strategy_execution_service import (
+    StrategyExecutionService,
+    shutdown_process_pool,
+)
+
+
+@pytest.fixture
+def market_data_by_symbol() -> dict:
+    """Columnar data for symbols ending on golden, death and no crossover."""
+    rng = np.random.default_rng(3)
+    closes = 50000 + np.cumsum(rng.normal(0, 400, 600))
+    fast = calculate_sma(closes.tolist(), 5)
+    slow = calculate_sma(closes.tolist(), 20)
+    events = dict((kind, index) for index, kind in find_crossovers(fast, slow))
+
+    ends = {
+        "005930": events["golden"] + 1,
+        "000660": events["death"] + 1,
+        "035420": events["golden"] + 3,
+        "051910": 12,  # Not enough data for the slow MA
+    }
+    start = datetime(2024, 1, 1)
+    data = {}
+    for symbol, end in ends.items():
+        close = closes[max(0, end - 100):end]
+        data[symbol] = {
+            "timestamp": np.array(
+                [start + timedelta(days=i) for i in range(close.size)], dtype="datetime64[us]"
+            ),
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": np.ones_like(close),
+        }
+    return data
+
+
+class TestBatchSignals:
+    """Test universe-wide batch signal generation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ma_type", ["SMA", "EMA"])
+    async def test_momentum_batch_matches_per_symbol(self, market_data_by_symbol: dict, ma_type: str):
+        """Vectorized path produces the same signals as per-symbol calls."""
+        strategy = MomentumStrategy(
+            name="test",
+            parameters={"fast_period": 5, "slow_period": 20, "ma_type": ma_type}
+        )
+
+        batch = await strategy.generate_signals_batch(market_data_by_symbol)
+        fallback = await BaseStrategy.generate_signals_batch(strategy, market_data_by_symbol)
+
+        assert "051910" not in batch
+        for symbol in batch:
+            expected = [(s.signal_type, s.price, s.confidence, s.reason) for s in fallback[symbol]]
+            actual = [(s.signal_type, s.price, s.confidence, s.reason) for s in batch[symbol]]
+            assert actual == expected
+
+    @pytest.mark.asyncio
+    async def test_momentum_batch_signal_types(self, market_data_by_symbol: dict):
+        """Golden and death crosses on the last bar become BUY and SELL."""
+        strategy = MomentumStrategy(name="test", parameters={"fast_period": 5, "slow_period": 20})
+        batch = await strategy.generate_signals_batch(market_data_by_symbol)
+
+        assert batch["005930"][0].signal_type.value == "BUY"
+        assert batch["000660"][0].signal_type.value == "SELL"
+        assert batch["035420"] == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ma_type", ["SMA", "EMA"])
+    async def test_momentum_batch_uses_indicator_cache(self, market_data_by_symbol: dict, ma_type: str):
+        """The batch path fills the cache and is served from it on the next run."""
+        parameters = {"fast_period": 5, "slow_period": 20, "ma_type": ma_type}
+        cache = IndicatorCache()
+        cached = MomentumStrategy(name="test", parameters=parameters, indicator_cache=cache, interval="1d")
+        expected = await MomentumStrategy(name="test", parameters=parameters).generate_signals_batch(market_data_by_symbol)
+
+        first = await cached.generate_signals_batch(market_data_by_symbol)
+        second = await cached.generate_signals_batch(market_data_by_symbol)
+
+        for result in (first, second):
+            assert {k: [(s.signal_type, s.confidence) for s in v] for k, v in result.items()} == {
+                k: [(s.signal_type, s.confidence) for s in v] for k, v in expected.items()
+            }
+        assert cache.stats()["misses"] == 6
+        assert cache.stats()["hits"] == 6
+        assert {key[1] for key in cache._entries} == {"1d"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("workers", [1, 2])
+    async def test_process_pool_offload(self, market_data_by_symbol: dict, monkeypatch, workers: int):
+        """Batches split across worker processes return the same merged signals."""
+        strategy = MomentumStrategy(name="test", parameters={"fast_period": 5, "slow_period": 20})
+        expected = await strategy.generate_signals_batch(market_data_by_symbol)
+
+        monkeypatch.setattr(settings, "STRATEGY_PROCESS_POOL_WORKERS", workers)
+        monkeypatch.setattr(settings, "STRATEGY_PROCESS_POOL_MIN_SYMBOLS", 1)
+        try:
+            result = await StrategyExecutionService.generate_signals(strategy, market_data_by_symbol)
+        finally:
+            shutdown_process_pool()
+
+        assert {k: [s.signal_type for s in v] for k, v in result.items()} == {
+            k: [s.signal_type for s in v] for k, v in expected.items()
+        }
+
+
+class TestExecuteStrategy:
+    """Test strategy execution endpoint."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [None, 4])
+    async def test_execute_strategy(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        auth_headers: dict,
+        market_data_by_symbol: dict,
+        concurrency: int
+    ):
+        """Signals are generated for every symbol with stored daily bars."""
+        end = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        for symbol in ("005930", "000660", "035420"):
+            close = market_data_by_symbol[symbol]["close"][-40:]
+            for i, price in enumerate(close.tolist()):
+                db_session.add(MarketData(
+                    symbol=symbol,
+                    timestamp=end - timedelta(days=close.size - 1 - i),
+                    open=price, high=price, low=price, close=price, volume=1000,
+                    interval=TimeInterval.ONE_DAY
+                ))
+        await db_session.commit()
+
+        response = await client.post(
+            "/api/v1/strategies",
+            json={
+                "name": "MA 5/20",
+                "strategy_type": "MOMENTUM",
+                "parameters": {"fast_period": 5, "slow_period": 20, "ma_type": "SMA"},
+            },
+            headers=auth_headers,
+        )
+        strategy_id = response.json()["id"]
+
+        response = await client.post(
+            f"/api/v1/strategies/{strategy_id}/execute",
+            json={"symbols": ["005930", "000660", "035420", "999999"], "concurrency": concurrency},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_symbols"] == 4
+        assert {(s["symbol"], s["signal_type"]) for s in data["signals"]} == {
+            ("005930", "BUY"),
+            ("000660", "SELL"),
+        }
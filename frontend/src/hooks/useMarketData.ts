@@ -1,14 +1,34 @@
 import { useState, useEffect, useCallback } from 'react';
 import { apiClient } from '@/lib/api';
+import { useAuthStore } from '@/store/authStore';
 import type { ChartDataResponse, PriceResponse, MarketDataListResponse, TimeInterval } from '@/types/market';
 
+const STREAM_URL = `${(process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000').replace(/^http/, 'ws')}/api/v1/market/stream`;
+const STREAM_RECONNECT_MAX_DELAY = 30000;
+// Close code for failed authentication; retrying with the same token cannot succeed
+const STREAM_POLICY_VIOLATION = 1008;
+
+// /market/stream sends PriceResponse fields in snake_case
+function toPriceResponse(data: any): PriceResponse {
+  return {
+    symbol: data.symbol,
+    price: data.price,
+    change: data.change,
+    changePercent: data.change_percent,
+    volume: data.volume,
+    timestamp: data.timestamp,
+  };
+}
+
 export function useMarketData(symbol: string, interval: TimeInterval, days: number) {
   const [chartData, setChartData] = useState<ChartDataResponse | null>(null);
   const [currentPrice, setCurrentPrice] = useState<PriceResponse | null>(null);
   const [isLoadingChart, setIsLoadingChart] = useState(false);
   const [isLoadingPrice, setIsLoadingPrice] = useState(false);
   const [isCollecting, setIsCollecting] = useState(false);
+  const [isStreaming, setIsStreaming] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const accessToken = useAuthStore((state) => state.accessToken);
 
   // Get chart data from database
   const fetchChartData = useCallback(async () => {
@@ -34,7 +54,7 @@ export function useMarketData(symbol: string, interval: TimeInterval, days: numb
     }
   }, [symbol, interval, days]);
 
-  // Get current price from KIS API
+  // Get a one-off current price from KIS API (live updates come from the stream)
   const fetchCurrentPrice = useCallback(async () => {
     if (!symbol) return;
 
@@ -108,10 +128,55 @@ export function useMarketData(symbol: string, interval: TimeInterval, days: numb
     fetchChartData();
   }, [fetchChartData]);
 
-  // Auto-fetch current price on mount
+  // Stream the current price over /market/stream instead of polling /market/price
   useEffect(() => {
-    fetchCurrentPrice();
-  }, [fetchCurrentPrice]);
+    if (!symbol || !accessToken) return;
+
+    let socket: WebSocket | null = null;
+    let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+    let delay = 1000;
+    let stopped = false;
+
+    const connect = () => {
+      socket = new WebSocket(STREAM_URL);
+
+      socket.onopen = () => {
+        delay = 1000;
+        setIsStreaming(true);
+        // Authenticate in the first message so the token stays out of URLs and access logs
+        socket?.send(JSON.stringify({ action: 'auth', token: accessToken }));
+        socket?.send(JSON.stringify({ action: 'subscribe', symbols: [symbol] }));
+      };
+
+      socket.onmessage = (event) => {
+        const message = JSON.parse(event.data);
+        if (message.type === 'quote' && message.data.symbol === symbol) {
+          setCurrentPrice(toPriceResponse(message.data));
+        } else if (message.type === 'error') {
+          console.error('Price stream error:', message.detail);
+        }
+      };
+
+      socket.onclose = (event) => {
+        setIsStreaming(false);
+        if (stopped) return;
+        if (event.code === STREAM_POLICY_VIOLATION) {
+          setError(event.reason || 'Price stream rejected');
+          return;
+        }
+        reconnectTimer = setTimeout(connect, delay);
+        delay = Math.min(delay * 2, STREAM_RECONNECT_MAX_DELAY);
+      };
+    };
+
+    connect();
+
+    return () => {
+      stopped = true;
+      if (reconnectTimer) clearTimeout(reconnectTimer);
+      socket?.close();
+    };
+  }, [symbol, accessToken]);
 
   return {
     chartData,
@@ -119,6 +184,7 @@ export function useMarketData(symbol: string, interval: TimeInterval, days: numb
     isLoadingChart,
     isLoadingPrice,
     isCollecting,
+    isStreaming,
     collectDailyData,
     collectMinuteData,
     refreshChartData: fetchChartData,